@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Body, HTTPException
+from fastapi import APIRouter, Depends, Body, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from admin.service import (
@@ -10,6 +10,8 @@ from admin.service import (
 )
 from auth.schemas import AdminRegister, AdminLogin, AdminUpdate, AdminOut
 from core.deps import get_db, get_current_admin
+from core.security import password_hashing_stats
+from core.rate_limit import enforce_login_limits, login_throttling_stats
 from models import User
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
@@ -28,9 +30,13 @@ async def admin_register(
 
 @router.post("/login")
 async def admin_login_api(
+        request: Request,
         data: AdminLogin,
         db: AsyncSession = Depends(get_db)
 ):
+    # before any decrypt / query / bcrypt
+    await enforce_login_limits(request, "admin", data.email)
+
     resp, err = await admin_login(db, data.email, data.password)
     if err:
         raise HTTPException(status_code=400, detail=err)
@@ -92,3 +98,21 @@ async def update_user_status(
         "uuid": user.uuid,
         "approved": user.approved
     }
+
+
+# ---------------- PASSWORD HASHING METRICS ---------------- #
+
+@router.get("/metrics/password-hashing")
+async def password_hashing_metrics(
+        current_admin=Depends(get_current_admin)
+):
+    # per worker process: queue depth, rejections, rehashes, timings
+    return password_hashing_stats()
+
+
+@router.get("/metrics/login-throttling")
+async def login_throttling_metrics(
+        current_admin=Depends(get_current_admin)
+):
+    # per worker process: admitted / rejected login attempts per scope
+    return login_throttling_stats()
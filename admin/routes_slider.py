@@ -15,6 +15,7 @@ from admin.service_slider import (
 from core.deps import get_db, get_current_admin
 from fastapi import Request
 from core.media import parse_media
+from core.http_cache import bump_version, SLIDERS
 
 
 
@@ -71,6 +72,7 @@ async def create_slider_api(
             shutil.copyfileobj(image.file, buffer)
 
         slider.image = file_path.replace("\\", "/")
+        await bump_version(db, SLIDERS)
         await db.commit()
         await db.refresh(slider)
 
@@ -118,6 +120,7 @@ async def update_slider_api(
             shutil.copyfileobj(image.file, buffer)
 
         slider.image = file_path.replace("\\", "/")
+        await bump_version(db, SLIDERS)
         await db.commit()
         await db.refresh(slider)
 
@@ -8,6 +8,7 @@ from admin.schema_work import *
 from admin.service_work import *
 
 from core.deps import get_db, get_current_admin
+from core.http_cache import bump_version, WORK_TYPES
 
 router = APIRouter(prefix="/admin/worktype", tags=["Admin Work Type"])
 
@@ -55,6 +56,7 @@ async def delete_work_type_api(
         raise HTTPException(status_code=404, detail="Work Type not found")
 
     await db.delete(worktype)
+    await bump_version(db, WORK_TYPES)
     await db.commit()
 
     return {"message": "Work Type permanently deleted"}
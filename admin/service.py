@@ -4,12 +4,17 @@ from sqlalchemy import select, delete, cast, String
 
 from models import AdminUser, User
 from core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_and_update_password,
     create_access_token,
     create_refresh_token
 )
 from core.aes_encryption import aes_decrypt
+from public.service_model_card import refresh_model_card
+from public.service_share import invalidate_shared_profile
+from core.principal import (
+    invalidate_user_principal, invalidate_admin_principal, refresh_user_claims
+)
 
 
 
@@ -34,7 +39,7 @@ async def create_admin(db: AsyncSession, data):
     admin = AdminUser(
         username=data.username,
         email=data.email,
-        password=hash_password(decrypted_password)
+        password=await hash_password_async(decrypted_password)
     )
 
     db.add(admin)
@@ -60,9 +65,14 @@ async def admin_login(db: AsyncSession, email: str, password: str):
     except Exception:
         return None, "Invalid encrypted password"
 
-    if not verify_password(decrypted_password, admin.password):
+    valid, new_hash = await verify_and_update_password(decrypted_password, admin.password)
+    if not valid:
         return None, "Invalid email or password"
 
+    if new_hash:
+        admin.password = new_hash
+        await db.commit()
+
     return {
         "access_token": create_access_token(subject=str(admin.uuid)),
         "refresh_token": create_refresh_token(str(admin.uuid)),
@@ -91,7 +101,7 @@ async def update_admin(db: AsyncSession, admin_id: int, data):
     if data.email:
         admin.email = data.email
     if data.password:
-        admin.password = hash_password(
+        admin.password = await hash_password_async(
             aes_decrypt(data.password)
         )
     if data.role:
@@ -128,12 +138,13 @@ async def update_admin(
 
     if data.password:
         decrypted_password = aes_decrypt(data.password)
-        admin.password = hash_password(decrypted_password)
+        admin.password = await hash_password_async(decrypted_password)
 
     if data.role:
         admin.role = data.role
 
     await db.commit()
+    invalidate_admin_principal(admin.uuid)
     await db.refresh(admin)
 
     return admin, None
@@ -148,13 +159,15 @@ async def delete_admin(
     result = await db.execute(
         delete(AdminUser).where(
             cast(AdminUser.uuid, String) == uuid
-        )
+        ).returning(AdminUser.uuid)
     )
+    deleted = result.scalar_one_or_none()
 
-    if result.rowcount == 0:
+    if not deleted:
         return None, "Admin not found"
 
     await db.commit()
+    invalidate_admin_principal(deleted)
     return True, None
 
 
@@ -175,12 +188,19 @@ async def admin_update_user_status(
     if not user:
         return None
 
+    # access tokens carry "approved": authorize them from the row until refreshed
+    if approved is not None and approved != user.approved:
+        await refresh_user_claims(db, user.id)
+
     if approved is not None:
         user.approved = approved
     if verified is not None:
         user.verified = verified
 
+    await refresh_model_card(db, user.id)
     await db.commit()
+    invalidate_user_principal(user.uuid)
+    invalidate_shared_profile(user.id)
     await db.refresh(user)
     return user
 
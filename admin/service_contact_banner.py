@@ -4,6 +4,7 @@ from datetime import datetime
 from fastapi import UploadFile
 from sqlalchemy.orm import Session
 from models import ContactBanner, AdminUser
+from core.http_cache import bump_version, CONTACT_BANNER
 from uuid import UUID
 from sqlalchemy import cast, String, select
 
@@ -51,6 +52,7 @@ async def create_contact_banner(
     )
 
     db.add(banner)
+    await bump_version(db, CONTACT_BANNER)
     await db.commit()
     await db.refresh(banner)
     return banner
@@ -101,6 +103,7 @@ async def update_contact_banner(
 
     banner.updated_by = user.id
 
+    await bump_version(db, CONTACT_BANNER)
     await db.commit()
     await db.refresh(banner)
     return banner
@@ -124,6 +127,7 @@ async def get_contact_banner_any_by_uuid(db: Session, uuid: str):
 # ======================
 async def hard_delete_banner(db: Session, banner: ContactBanner):
     await db.delete(banner)
+    await bump_version(db, CONTACT_BANNER)
     await db.commit()
     return True
 
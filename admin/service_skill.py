@@ -2,6 +2,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import cast, String, select
 from datetime import datetime
 from models import Skill
+from core.http_cache import bump_version, SKILLS
 from fastapi.concurrency import run_in_threadpool
 from uuid import UUID
 
@@ -15,6 +16,7 @@ async def create_skill(db: Session, data, admin_id: int):
             updated_by=admin_id
         )
         db.add(skill)
+        await bump_version(db, SKILLS)
         await db.commit()
         await db.refresh(skill)
         return skill, None
@@ -45,6 +47,7 @@ async def update_skill(db: Session, uuid: str, data, admin_id: int):
 
         skill.updated_by = admin_id
 
+        await bump_version(db, SKILLS)
         await db.commit()
         await db.refresh(skill)
         return skill, None
@@ -64,6 +67,7 @@ async def delete_skill(db: Session, uuid: str):
             return None, "Skill not found"
 
         await db.delete(skill)
+        await bump_version(db, SKILLS)
         await db.commit()
         return True, None
 
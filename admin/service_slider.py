@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 from models import HomeSlider
+from core.http_cache import bump_version, SLIDERS
 from uuid import UUID
 
 # CREATE
@@ -14,6 +15,7 @@ async def create_slider(db: AsyncSession, data, admin_id: int):
     )
 
     db.add(slider)
+    await bump_version(db, SLIDERS)
     await db.commit()
     await db.refresh(slider)
 
@@ -43,6 +45,7 @@ async def update_slider(db: AsyncSession, uuid: str, data, admin_id: int):
 
     slider.updated_by = admin_id
 
+    await bump_version(db, SLIDERS)
     await db.commit()
     await db.refresh(slider)
 
@@ -60,6 +63,7 @@ async def soft_delete_slider(db: AsyncSession, uuid: str):
         return None, "Slider not found"
 
     await db.delete(slider)
+    await bump_version(db, SLIDERS)
     await db.commit()
 
     return True, None
@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from uuid import UUID
 from models import WorkType
+from core.http_cache import bump_version, WORK_TYPES
 
 
 async def create_work_type(db: AsyncSession, data, admin_id: int):
@@ -13,6 +14,7 @@ async def create_work_type(db: AsyncSession, data, admin_id: int):
             updated_by=admin_id
         )
         db.add(work_type)
+        await bump_version(db, WORK_TYPES)
         await db.commit()
         await db.refresh(work_type)
         return work_type, None
@@ -42,6 +44,7 @@ async def update_work_type(db: AsyncSession, uuid: str, data, admin_id: int):
 
         worktype.updated_by = admin_id
 
+        await bump_version(db, WORK_TYPES)
         await db.commit()
         await db.refresh(worktype)
         return worktype, None
@@ -66,6 +69,7 @@ async def soft_delete_work_type(db: AsyncSession, uuid: str, admin_id: int):
         worktype.is_delete = True
         worktype.updated_by = admin_id
 
+        await bump_version(db, WORK_TYPES)
         await db.commit()
         return True, None
     except Exception as e:
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, status
+from fastapi import APIRouter, Depends, HTTPException, File, UploadFile, Form, Query, status
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 import json
@@ -21,6 +21,10 @@ from agency.agency_profile_service import (
 from agency.schema_jobposting import *
 from agency.service_jobposting import *
 from models import AgencyProfile
+from core.http_cache import bump_version, AGENCIES, JOBS
+from core.quota import require_quota, JOB_POSTINGS
+from agency.service_candidates import find_job_candidates
+from core.pagination import DEFAULT_PAGE_SIZE, clamp_limit
 
 UPLOAD_DIR = "uploads/agency"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
@@ -47,17 +51,11 @@ async def create_jobposting_api(
     if current_user.user_type != 2:
         raise HTTPException(403, "Only agencies can create jobs")
 
-    # ✅ ADD VALIDATION (no existing code changed)
-    result = await db.execute(
-        select(JobPosting).where(
-            JobPosting.agency_id == current_user.id,
-            JobPosting.is_delete == False
-        )
+    # 🔒 Job limit check (commits with the job)
+    await require_quota(
+        db, current_user.id, current_user.plan, JOB_POSTINGS,
+        "subscribe for more job postings", status_code=400
     )
-    job_count = len(result.scalars().all())
-
-    if job_count >= 3:
-        raise HTTPException(400, "subscribe for more job postings")
 
     job, err = await create_jobposting(db, data, current_user.id)
     if err:
@@ -106,6 +104,7 @@ async def upload_job_logo(
     job.logo = file_path
     job.updated_by = user.id
 
+    await bump_version(db, JOBS)
     await db.commit()
     await db.refresh(job)
 
@@ -164,15 +163,11 @@ async def create_job_with_logo(
     if current_user.user_type != 2:
         raise HTTPException(403, "Only agencies can create jobs")
 
-    # 🔒 Job limit check
-    result = await db.execute(
-        select(JobPosting).where(
-            JobPosting.agency_id == current_user.id,
-            JobPosting.is_delete == False
-        )
+    # 🔒 Job limit check (commits with the job)
+    await require_quota(
+        db, current_user.id, current_user.plan, JOB_POSTINGS,
+        "subscribe for more job postings", status_code=400
     )
-    if len(result.scalars().all()) >= 3:
-        raise HTTPException(400, "subscribe for more job postings")
 
     # 🧠 Build schema (NOW COMPLETE)
     data = JobPostingCreate(
@@ -219,6 +214,7 @@ async def create_job_with_logo(
 
         job.logo = file_path
         job.updated_by = current_user.id
+        await bump_version(db, JOBS)
         await db.commit()
         await db.refresh(job)
 
@@ -265,11 +261,50 @@ async def get_job_details_api(
 
     raise HTTPException(403, "Unauthorized")
 
+# ------------ candidates for a job -------------
+
+@router.get("/jobposting/{uuid}/candidates")
+async def get_job_candidates_api(
+        uuid: UUID,
+        request: Request,
+        limit: int = Query(20, ge=1, le=100),
+        offset: int = Query(0, ge=0),
+        db: AsyncSession = Depends(get_db),
+        current_user=Depends(get_current_user)
+):
+    if current_user.user_type != 2:
+        raise HTTPException(403, "Only agencies allowed")
+
+    job = await get_jobposting_by_uuid(db, uuid)
+    if not job or job.agency_id != current_user.id:
+        raise HTTPException(404, "Job not found")
+
+    base_url = str(request.base_url).rstrip("/")
+    return await find_job_candidates(db, job, base_url, limit, offset)
+
+
 # ------------job apply list-------------
 
+@router.get("/job/dashboard")
+async def get_job_dashboard(
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(get_current_user)
+):
+    """Applied / shortlisted / rejected / hired counts for every job of the agency"""
+    if current_user.user_type != 2:
+        raise HTTPException(403, "Only agencies allowed")
+
+    return await get_agency_dashboard(db, current_user.id)
+
+
 @router.get("/job/status/{job_uuid}")
 async def get_single_job_status(
     job_uuid: UUID,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    status: str | None = None,
+    city: str | None = None,
+    gender: str | None = None,
     db: AsyncSession = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
@@ -279,7 +314,12 @@ async def get_single_job_status(
     return await get_agency_single_job_status(
         db,
         current_user.id,
-        job_uuid
+        job_uuid,
+        limit=clamp_limit(limit),
+        cursor=cursor,
+        status=status,
+        city=city,
+        gender=gender
     )
 
 
@@ -296,7 +336,8 @@ async def get_all_jobs_api(
         media = parse_job_media(request, job)
         response.append({
             **job.__dict__,
-            **media
+            **media,
+            "applications": application_counts(job)
         })
 
     return response
@@ -376,6 +417,7 @@ async def create_profile(
     profile.logo = logo_path
     # profile.photos = "|".join(photo_paths)
 
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
     await db.refresh(profile)
 
@@ -461,6 +503,7 @@ async def update_profile(
 
     profile.updated_by = user.id
 
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
     await db.refresh(profile)
 
@@ -592,6 +635,7 @@ async def upload_logo(
     profile.logo = file_path
     profile.updated_by = user.id
 
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
     await db.refresh(profile)
 
@@ -630,6 +674,7 @@ async def delete_agency_profile(
         )
 
     await db.delete(profile)
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
 
     return {
@@ -6,6 +6,7 @@ import uuid
 from uuid import UUID
 
 from models import AgencyProfile
+from core.http_cache import bump_version, AGENCIES, JOBS
 from agency.agency_profile_schema import (
     AgencyProfileCreate,
     AgencyProfileUpdate,
@@ -36,6 +37,7 @@ async def create_agency_profile(
     )
 
     db.add(profile)
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
     await db.refresh(profile)
     return profile
@@ -64,6 +66,7 @@ async def update_agency_profile(
 
     profile.updated_by = user_id
 
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
     await db.refresh(profile)
 
@@ -115,6 +118,7 @@ async def delete_agency_profile_service(
         return False
 
     await db.delete(profile)
+    await bump_version(db, AGENCIES, JOBS)
     await db.commit()
 
     return True
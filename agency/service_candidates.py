@@ -0,0 +1,315 @@
+# agency/service_candidates.py
+import asyncio
+import re
+import time
+from datetime import timedelta
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
+
+from models import PublicModelCard
+from public.service_model_card import search_terms, build_card_response
+
+# score weights, sum to 1
+W_SKILLS = 0.45
+W_CATEGORIES = 0.25
+W_LOCATION = 0.2
+W_TRAVEL = 0.1               # other city, but willing to travel
+
+CANDIDATE_REFRESH_SECONDS = 15
+CANDIDATE_FULL_RELOAD_SECONDS = 3600
+# re-read cards updated slightly before the watermark: a transaction that
+# started earlier may commit an older updated_at after we last looked
+WATERMARK_OVERLAP = timedelta(seconds=60)
+LOAD_BATCH_SIZE = 5000
+
+_TERM_SPLIT = re.compile(r"[,;/|\n]+")
+
+
+# -----------------------------------
+# 🧮 FEATURE MATRIX
+# -----------------------------------
+class CandidateMatrix:
+    """
+    Every model card as a row of NumPy features:
+    gender / city as vocabulary codes, skills / categories as bitsets
+    (one bit per known term, packed in uint64 words), travel as bool.
+
+    One copy per worker. Kept current by refresh_candidate_matrix, which only reads the
+    cards updated since the last call; a periodic full reload drops
+    deleted cards and unused vocabulary.
+    """
+
+    def __init__(self):
+        self.rows = {}                                   # user_id -> row
+        self.user_ids = np.zeros(0, dtype=np.int64)
+        self.active = np.zeros(0, dtype=bool)            # is_public_complete
+        self.gender = np.zeros(0, dtype=np.int32)
+        self.city = np.zeros(0, dtype=np.int32)
+        self.travel = np.zeros(0, dtype=bool)
+        self.skills = np.zeros((0, 1), dtype=np.uint64)
+        self.categories = np.zeros((0, 1), dtype=np.uint64)
+
+        self.vocab = {"gender": {}, "city": {}, "skills": {}, "categories": {}}
+        self.watermark = None
+        self.refreshed_at = 0.0
+        self.loaded_at = 0.0
+
+    def __len__(self):
+        return len(self.user_ids)
+
+    # ---------- vocabulary ----------
+    def _code(self, kind: str, value) -> int:
+        """Code of a lower-cased scalar, -1 for empty"""
+        value = (value or "").strip().lower()
+        if not value:
+            return -1
+        vocab = self.vocab[kind]
+        return vocab.setdefault(value, len(vocab))
+
+    def _fit_words(self, name: str):
+        """Widen a bitset matrix when its vocabulary outgrew it"""
+        matrix = getattr(self, name)
+        words = max(1, (len(self.vocab[name]) + 63) // 64)
+        if matrix.shape[1] < words:
+            setattr(self, name, np.pad(matrix, ((0, 0), (0, words - matrix.shape[1]))))
+
+    # ---------- load ----------
+    def apply(self, cards: list):
+        """Insert / overwrite rows from (user_id, gender, city, skills, categories, travel, complete) tuples"""
+        new_ids = [c[0] for c in cards if c[0] not in self.rows]
+        if new_ids:
+            start = len(self.user_ids)
+            for offset, user_id in enumerate(new_ids):
+                self.rows[user_id] = start + offset
+
+            grow = len(new_ids)
+            self.user_ids = np.concatenate([self.user_ids, np.array(new_ids, dtype=np.int64)])
+            self.active = np.concatenate([self.active, np.zeros(grow, dtype=bool)])
+            self.gender = np.concatenate([self.gender, np.full(grow, -1, dtype=np.int32)])
+            self.city = np.concatenate([self.city, np.full(grow, -1, dtype=np.int32)])
+            self.travel = np.concatenate([self.travel, np.zeros(grow, dtype=bool)])
+            self.skills = np.pad(self.skills, ((0, grow), (0, 0)))
+            self.categories = np.pad(self.categories, ((0, grow), (0, 0)))
+
+        rows = np.array([self.rows[c[0]] for c in cards], dtype=np.int64)
+        self.gender[rows] = [self._code("gender", c[1]) for c in cards]
+        self.city[rows] = [self._code("city", c[2]) for c in cards]
+        self.travel[rows] = [bool(c[5]) for c in cards]
+        self.active[rows] = [bool(c[6]) for c in cards]
+
+        for name, column in (("skills", 3), ("categories", 4)):
+            bitsets = term_bitsets(self.vocab[name], [c[column] for c in cards])
+            self._fit_words(name)
+
+            matrix = getattr(self, name)
+            matrix[rows] = 0
+            matrix[rows, :bitsets.shape[1]] = bitsets
+
+    # ---------- score ----------
+    def query_bits(self, kind: str, terms: list[str]) -> np.ndarray:
+        """Bitset of the known terms; unknown ones can't match anybody"""
+        return term_bitsets(self.vocab[kind], [terms], grow=False)[0]
+
+    def score(self, gender: str | None, cities: list[str], skills: list[str], categories: list[str]):
+        """
+        (eligible row indexes, scores, skill overlaps, category overlaps,
+        same-city flags) for one job, all as NumPy arrays
+        """
+        eligible = self.active.copy()
+
+        gender = (gender or "").strip().lower()
+        if gender and gender != "any":
+            code = self.vocab["gender"].get(gender, -2)
+            eligible &= self.gender == code
+
+        rows = np.flatnonzero(eligible)
+        scores = np.zeros(len(rows), dtype=np.float32)
+
+        skill_hits = np.zeros(len(rows), dtype=np.int64)
+        if skills:
+            mask = self.query_bits("skills", skills)
+            skill_hits = np.bitwise_count(self.skills[rows] & mask).sum(axis=1, dtype=np.int64)
+            scores += W_SKILLS * skill_hits / len(skills)
+
+        category_hits = np.zeros(len(rows), dtype=np.int64)
+        if categories:
+            mask = self.query_bits("categories", categories)
+            category_hits = np.bitwise_count(self.categories[rows] & mask).sum(axis=1, dtype=np.int64)
+            scores += W_CATEGORIES * category_hits / len(categories)
+
+        same_city = np.zeros(len(rows), dtype=bool)
+        if cities:
+            codes = [self.vocab["city"][c] for c in cities if c in self.vocab["city"]]
+            same_city = np.isin(self.city[rows], codes)
+            scores += np.where(same_city, W_LOCATION, np.where(self.travel[rows], W_TRAVEL, 0))
+        else:
+            # remote / unspecified location: everybody is local
+            scores += W_LOCATION
+
+        return rows, scores, skill_hits, category_hits, same_city
+
+
+def term_bitsets(vocab: dict, term_lists: list, grow: bool = True) -> np.ndarray:
+    """
+    One row of uint64 words per term list, bit i set for the vocabulary
+    term with code i. New terms are added to `vocab` unless grow=False,
+    in which case they are ignored (they can't match anything).
+    """
+    pairs = []
+    for row, terms in enumerate(term_lists):
+        for term in terms or []:
+            code = vocab.setdefault(term, len(vocab)) if grow else vocab.get(term)
+            if code is not None:
+                pairs.append((row, code))
+
+    words = max(1, (len(vocab) + 63) // 64)
+    bitsets = np.zeros((len(term_lists), words), dtype=np.uint64)
+    if pairs:
+        rows, codes = np.array(pairs, dtype=np.int64).T
+        np.bitwise_or.at(
+            bitsets,
+            (rows, codes >> 6),
+            np.left_shift(np.uint64(1), (codes & 63).astype(np.uint64))
+        )
+    return bitsets
+
+
+_matrix = CandidateMatrix()
+_refresh_lock = asyncio.Lock()
+
+
+async def refresh_candidate_matrix(db: AsyncSession, force: bool = False) -> CandidateMatrix:
+    """
+    Bring this worker's matrix up to date: a full load on first use and
+    every CANDIDATE_FULL_RELOAD_SECONDS, otherwise only the cards whose
+    updated_at moved since the last refresh (at most every
+    CANDIDATE_REFRESH_SECONDS).
+    """
+    global _matrix
+
+    now = time.monotonic()
+    if not force and now - _matrix.refreshed_at < CANDIDATE_REFRESH_SECONDS:
+        return _matrix
+
+    # a refresh is already running in this worker: serve what we have
+    if _refresh_lock.locked() and _matrix.loaded_at:
+        return _matrix
+
+    async with _refresh_lock:
+        if not force and time.monotonic() - _matrix.refreshed_at < CANDIDATE_REFRESH_SECONDS:
+            return _matrix
+
+        full = force or not _matrix.loaded_at or now - _matrix.loaded_at > CANDIDATE_FULL_RELOAD_SECONDS
+        matrix = CandidateMatrix() if full else _matrix
+
+        card = PublicModelCard
+        stmt = select(
+            card.user_id, card.gender, card.current_city,
+            card.skills, card.interested_categories,
+            card.willing_to_travel, card.is_public_complete,
+            card.updated_at
+        )
+        if full:
+            stmt = stmt.where(card.is_public_complete == True)
+        elif matrix.watermark is not None:
+            # incomplete cards too: they switch existing rows off
+            stmt = stmt.where(card.updated_at >= matrix.watermark - WATERMARK_OVERLAP)
+
+        result = await db.stream(stmt, execution_options={"yield_per": LOAD_BATCH_SIZE})
+        async for partition in result.partitions():
+            matrix.apply([tuple(row[:7]) for row in partition])
+            latest = max((row.updated_at for row in partition if row.updated_at), default=None)
+            if latest and (matrix.watermark is None or latest > matrix.watermark):
+                matrix.watermark = latest
+
+        matrix.refreshed_at = time.monotonic()
+        if full:
+            matrix.loaded_at = matrix.refreshed_at
+            _matrix = matrix
+
+    return _matrix
+
+
+# -----------------------------------
+# 🎯 JOB -> CANDIDATES
+# -----------------------------------
+def job_terms(value) -> list[str]:
+    """Free-text "a, b; c" or list -> search_terms"""
+    if isinstance(value, str):
+        value = _TERM_SPLIT.split(value)
+    return search_terms(value)
+
+
+def job_features(job) -> dict:
+    """CandidateMatrix.score keyword arguments for a job"""
+    return {
+        "gender": job.gender,
+        "cities": job_terms(job.location),
+        "skills": job_terms(job.required_skills),
+        "categories": job_terms(job.work_type),
+    }
+
+
+def rank_page(scores, user_ids, offset: int, end: int):
+    """
+    Positions offset..end of the (score desc, user_id) order. Partial
+    sort: only rows scoring at least the end-th best score are ordered,
+    ties at the page edge included, so pages never overlap or skip.
+    """
+    if end < len(scores):
+        cutoff = -np.partition(-scores, end - 1)[end - 1]
+        top = np.flatnonzero(scores >= cutoff)
+    else:
+        top = np.arange(len(scores))
+    return top[np.lexsort((user_ids[top], -scores[top]))][offset:end]
+
+
+async def find_job_candidates(
+    db: AsyncSession,
+    job,
+    base_url: str,
+    limit: int = 20,
+    offset: int = 0
+) -> dict:
+    """Best-matching complete model cards for a job, highest score first"""
+    matrix = await refresh_candidate_matrix(db)
+
+    rows, scores, skill_hits, category_hits, same_city = matrix.score(**job_features(job))
+
+    total = len(rows)
+    end = min(offset + limit, total)
+    if offset >= end:
+        return {"items": [], "total": total, "limit": limit, "offset": offset}
+
+    top = rank_page(scores, matrix.user_ids[rows], offset, end)
+
+    user_ids = [int(u) for u in matrix.user_ids[rows[top]]]
+
+    result = await db.execute(
+        select(PublicModelCard).where(
+            PublicModelCard.user_id == any_(bindparam("user_ids", user_ids, type_=ARRAY(Integer))),
+            PublicModelCard.is_public_complete == True
+        )
+    )
+    cards = {c.user_id: c for c in result.scalars().all()}
+
+    items = []
+    for i, user_id in zip(top, user_ids):
+        card = cards.get(user_id)
+        if not card:
+            continue            # removed since the last refresh
+        items.append({
+            **build_card_response(card, base_url),
+            "score": round(float(scores[i]) * 100, 1),
+            "match": {
+                "skills": int(skill_hits[i]),
+                "categories": int(category_hits[i]),
+                "same_city": bool(same_city[i]),
+                "willing_to_travel": bool(card.willing_to_travel),
+            }
+        })
+
+    return {"items": items, "total": total, "limit": limit, "offset": offset}
@@ -0,0 +1,93 @@
+# agency/service_job_expiry.py
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import select, update, func, or_, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database import AsyncSessionLocal
+from models import JobPosting
+from core.http_cache import bump_version, JOBS
+from agency.service_jobposting import strip_jobs_from_feeds
+
+JOB_SWEEP_INTERVAL_SECONDS = 300
+JOB_SWEEP_BATCH_SIZE = 500
+
+# pg advisory lock key: only the worker holding it sweeps (leader election)
+JOB_SWEEP_LOCK_KEY = 71_004_001
+
+
+# -----------------------------------
+# 🧹 CLOSE EXPIRED JOBS
+# -----------------------------------
+async def close_expired_jobs(db: AsyncSession, now: datetime, batch_size: int) -> int:
+    """
+    Close up to `batch_size` open jobs whose expires_at or deadline has
+    passed. Served by the partial open-job indexes on expires_at / deadline;
+    SKIP LOCKED leaves rows an agency is editing for the next run.
+    The closed jobs are also stripped from the model feeds.
+    """
+    expired = (
+        select(JobPosting.id)
+        .where(
+            JobPosting.is_delete == False,
+            JobPosting.status == literal_column("'open'"),
+            or_(JobPosting.expires_at < now, JobPosting.deadline < now)
+        )
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+    result = await db.execute(
+        update(JobPosting)
+        .where(JobPosting.id.in_(expired.scalar_subquery()))
+        .values(status="closed")
+        .returning(JobPosting.id)
+        .execution_options(synchronize_session=False)
+    )
+    closed = result.scalars().all()
+
+    # closed jobs leave the recommended-jobs feeds in the same transaction
+    await strip_jobs_from_feeds(db, closed)
+    return len(closed)
+
+
+async def sweep_expired_jobs(batch_size: int = JOB_SWEEP_BATCH_SIZE) -> int | None:
+    """
+    One sweep, one short transaction per batch. Returns the number of
+    closed jobs, or None when another worker holds the sweep lock.
+    """
+    now = datetime.utcnow()          # job dates are naive UTC
+    total = 0
+
+    while True:
+        async with AsyncSessionLocal() as db:
+            # transaction-scoped: released by the commit / rollback below
+            locked = await db.scalar(select(func.pg_try_advisory_xact_lock(JOB_SWEEP_LOCK_KEY)))
+            if not locked:
+                await db.rollback()
+                return total or None
+
+            closed = await close_expired_jobs(db, now, batch_size)
+            if closed:
+                await bump_version(db, JOBS)
+            await db.commit()
+
+        total += closed
+        if closed < batch_size:
+            return total
+
+
+async def run_job_expiry_sweeper(interval: float = JOB_SWEEP_INTERVAL_SECONDS):
+    """Lifespan task: sweep every `interval` seconds until cancelled"""
+    while True:
+        try:
+            closed = await sweep_expired_jobs()
+            if closed:
+                print(f"Closed {closed} expired job postings")
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            print(f"Job expiry sweep failed: {exc}")
+
+        await asyncio.sleep(interval)
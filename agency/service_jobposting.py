@@ -1,12 +1,92 @@
 # agency/service_jobposting.py
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete, func
+from sqlalchemy import select, update, delete, func, literal_column, bindparam, Integer
+from sqlalchemy.dialects.postgresql import ARRAY
 from uuid import UUID
 from datetime import datetime
-from models import JobPosting, JobApplication, User
+from models import JobPosting, JobApplication, User, ModelJobRecommendation
+from core.http_cache import bump_version, JOBS
+from core.quota import release_quota, JOB_POSTINGS
+from core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, build_page
+from job_applications.service_counters import APPLICATION_STATUSES, application_counts
 from fastapi import HTTPException
 
 
+SEARCH_CONFIG = "english"
+
+
+def job_search_vector(job):
+    """
+    Weighted full-text document for a job:
+    role (A) > required skills (B) > location, project type (C) > description (D)
+    """
+    def weighted(value, weight):
+        return func.setweight(
+            func.to_tsvector(SEARCH_CONFIG, value or ""),
+            literal_column(f"'{weight}'")
+        )
+
+    return (
+        weighted(job.job_role, "A")
+        .op("||")(weighted(job.required_skills, "B"))
+        .op("||")(weighted(job.location, "C"))
+        .op("||")(weighted(job.project_type, "C"))
+        .op("||")(weighted(job.description, "D"))
+    )
+
+
+def open_public_job() -> tuple:
+    """
+    Criteria for jobs shown publicly. The values are SQL literals, not
+    bind params, so the planner can match the partial index
+    ix_job_posting_open_public_id (models.OPEN_PUBLIC_JOB).
+    """
+    return (
+        JobPosting.is_delete == False,
+        JobPosting.visibility == literal_column("'public'"),
+        JobPosting.status == literal_column("'open'"),
+    )
+
+
+async def strip_jobs_from_feeds(db: AsyncSession, job_ids: list[int]) -> int:
+    """
+    Remove jobs (closed, deleted, or edited and about to be re-fanned out)
+    from every model's recommended-jobs feed, with their scores. Found
+    through the GIN index on job_ids; returns the number of feeds changed.
+    """
+    if not job_ids:
+        return 0
+
+    feed = ModelJobRecommendation
+    result = await db.execute(
+        select(feed.user_id, feed.job_ids, feed.scores)
+        .where(feed.job_ids.overlap(bindparam("strip_ids", list(job_ids), type_=ARRAY(Integer))))
+        .order_by(feed.user_id)          # same lock order as the feed upserts
+        .with_for_update()
+    )
+
+    drop = set(job_ids)
+    rows = []
+    for row in result.all():
+        kept = [(job_id, score) for job_id, score in zip(row.job_ids, row.scores) if job_id not in drop]
+        rows.append({
+            "feed_user_id": row.user_id,
+            "kept_job_ids": [job_id for job_id, _ in kept],
+            "kept_scores": [score for _, score in kept],
+        })
+
+    if rows:
+        # Core table: an executemany with its own WHERE, not the ORM bulk-by-pk path
+        table = feed.__table__
+        await db.execute(
+            update(table)
+            .where(table.c.user_id == bindparam("feed_user_id"))
+            .values(job_ids=bindparam("kept_job_ids"), scores=bindparam("kept_scores")),
+            rows
+        )
+    return len(rows)
+
+
 def to_naive(dt: datetime | None):
     """Convert tz-aware datetime to tz-naive (UTC stripped)"""
     if dt and dt.tzinfo is not None:
@@ -46,8 +126,10 @@ async def create_jobposting(db: AsyncSession, data, agency_id: int):
         created_by=agency_id,
         updated_by=agency_id,
     )
+    job.search_vector = job_search_vector(job)
 
     db.add(job)
+    await bump_version(db, JOBS)
     await db.commit()
     await db.refresh(job)
 
@@ -71,7 +153,12 @@ async def update_jobposting(db: AsyncSession, uuid: UUID, data, agency_id: int):
         setattr(job, field, value)
 
     job.updated_by = agency_id
+    job.search_vector = job_search_vector(job)
+    job.recommended_at = None          # re-fan-out into model feeds
+    # old scores may no longer fit: the fan-out re-adds the job where it does
+    await strip_jobs_from_feeds(db, [job.id])
 
+    await bump_version(db, JOBS)
     await db.commit()
     await db.refresh(job)
 
@@ -119,8 +206,13 @@ async def delete_jobposting(db: AsyncSession, uuid: UUID, agency_id: int):
         )
     )
 
+    await strip_jobs_from_feeds(db, [job.id])
+
     # ❗ Ab job delete karo
     await db.delete(job)
+    if not job.is_delete:
+        await release_quota(db, agency_id, JOB_POSTINGS)
+    await bump_version(db, JOBS)
     await db.commit()
 
     return True, None
@@ -129,10 +221,49 @@ async def delete_jobposting(db: AsyncSession, uuid: UUID, agency_id: int):
 
 # ----------------- job posting list service  ----
 
+async def get_agency_dashboard(db: AsyncSession, agency_id: int) -> dict:
+    """Per-status application counts of every live job of an agency, from the job counters"""
+    result = await db.execute(
+        select(
+            JobPosting.uuid, JobPosting.job_role, JobPosting.location, JobPosting.status,
+            JobPosting.applications_count, JobPosting.applied_count,
+            JobPosting.shortlisted_count, JobPosting.rejected_count, JobPosting.hired_count
+        )
+        .where(
+            JobPosting.agency_id == agency_id,
+            JobPosting.is_delete == False
+        )
+        .order_by(JobPosting.id.desc())
+    )
+    jobs = result.all()
+
+    totals = {key: 0 for key in (*APPLICATION_STATUSES, "total")}
+    items = []
+    for job in jobs:
+        job_counts = application_counts(job)
+        for key, value in job_counts.items():
+            totals[key] += value
+
+        items.append({
+            "job_uuid": str(job.uuid),
+            "job_role": job.job_role,
+            "location": job.location,
+            "status": job.status,
+            "applications": job_counts
+        })
+
+    return {"total_jobs": len(items), "applications": totals, "jobs": items}
+
+
 async def get_agency_single_job_status(
     db,
     agency_id: int,
-    job_uuid
+    job_uuid,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    status: str | None = None,
+    city: str | None = None,
+    gender: str | None = None
 ):
     # 1️⃣ Validate & fetch job (ownership check)
     result = await db.execute(
@@ -148,9 +279,24 @@ async def get_agency_single_job_status(
     if not job:
         raise HTTPException(404, "Job not found")
 
-    # 2️⃣ Fetch applicants for this job
+    # 2️⃣ One page of applicants, newest first (keyset on application id)
+    criteria = [
+        JobApplication.job_id == job.id,
+        JobApplication.is_delete == False
+    ]
+    if status:
+        criteria.append(JobApplication.status == status.strip().lower())
+    if city:
+        criteria.append(func.lower(User.current_city) == city.strip().lower())
+    if gender:
+        criteria.append(func.lower(User.gender) == gender.strip().lower())
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        criteria.append(JobApplication.id < last_id)
+
     apps_result = await db.execute(
         select(
+            JobApplication.id,
             JobApplication.uuid.label("application_uuid"),
             JobApplication.status,
             User.id.label("model_id"),
@@ -161,11 +307,11 @@ async def get_agency_single_job_status(
             User.current_city
         )
         .join(User, User.id == JobApplication.model_id)
-        .where(
-            JobApplication.job_id == job.id,
-            JobApplication.is_delete == False
-        )
+        .where(*criteria)
+        .order_by(JobApplication.id.desc())
+        .limit(limit + 1)
     )
+    rows, next_cursor = build_page(apps_result.all(), limit, lambda row: (row.id,))
 
     applicants = [
         {
@@ -177,15 +323,19 @@ async def get_agency_single_job_status(
             "city": row.current_city,
             "status": row.status
         }
-        for row in apps_result.all()
+        for row in rows
     ]
 
+    counts = application_counts(job)
+
     # 3️⃣ Final response
     return {
         # "job_uuid": str(job.uuid),
         "job_role": job.job_role,
         "location": job.location,
-        "total_applications": len(applicants),
-        "applicants": applicants
+        "total_applications": counts["total"],
+        "applications": counts,
+        "applicants": applicants,
+        "next_cursor": next_cursor,
+        "limit": limit
     }
-
@@ -0,0 +1,44 @@
+"""trigram indexes for typeahead
+
+Revision ID: 0a7e3d95c8b1
+Revises: f1c84a2e6b37
+Create Date: 2026-01-21 17:48:09.301564
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0a7e3d95c8b1'
+down_revision: Union[str, Sequence[str], None] = 'f1c84a2e6b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.create_index(
+        'ix_job_posting_job_role_trgm', 'job_posting', ['job_role'], unique=False,
+        postgresql_using='gin', postgresql_ops={'job_role': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_job_posting_location_trgm', 'job_posting', ['location'], unique=False,
+        postgresql_using='gin', postgresql_ops={'location': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_users_current_city_trgm', 'users', ['current_city'], unique=False,
+        postgresql_using='gin', postgresql_ops={'current_city': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_current_city_trgm', table_name='users')
+    op.drop_index('ix_job_posting_location_trgm', table_name='job_posting')
+    op.drop_index('ix_job_posting_job_role_trgm', table_name='job_posting')
+    # pg_trgm is left installed
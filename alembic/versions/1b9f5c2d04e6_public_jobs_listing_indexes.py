@@ -0,0 +1,36 @@
+"""public jobs listing indexes
+
+Revision ID: 1b9f5c2d04e6
+Revises: 0a7e3d95c8b1
+Create Date: 2026-01-23 12:30:57.804113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1b9f5c2d04e6'
+down_revision: Union[str, Sequence[str], None] = '0a7e3d95c8b1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_posting_live_id',
+        'job_posting',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
+    op.create_index('ix_job_posting_work_type', 'job_posting', ['work_type'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_posting_work_type', table_name='job_posting')
+    op.drop_index('ix_job_posting_live_id', table_name='job_posting')
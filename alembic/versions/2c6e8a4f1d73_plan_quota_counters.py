@@ -0,0 +1,108 @@
+"""plan entitlements and usage counters
+
+Revision ID: 2c6e8a4f1d73
+Revises: 1b9f5c2d04e6
+Create Date: 2026-01-26 10:14:42.615208
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c6e8a4f1d73'
+down_revision: Union[str, Sequence[str], None] = '1b9f5c2d04e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# limits that were hard-coded before (3 jobs, MAX_FREE_IMAGES, MAX_FREE_MEDIA)
+FREE_PLAN_LIMITS = {
+    'job_postings': 3,
+    'model_images': 5,
+    'model_videos': 2,
+}
+
+
+def _video_link_count(value) -> int:
+    try:
+        links = json.loads(value) if value else []
+    except (TypeError, ValueError):
+        return 0
+    return len(links) if isinstance(links, list) else 0
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('plan', sa.String(length=30), server_default='free', nullable=False))
+
+    entitlements = op.create_table('plan_entitlements',
+    sa.Column('plan', sa.String(length=30), nullable=False),
+    sa.Column('resource', sa.String(length=50), nullable=False),
+    sa.Column('max_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('plan', 'resource')
+    )
+    op.create_table('usage_counters',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('resource', sa.String(length=50), nullable=False),
+    sa.Column('used', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'resource')
+    )
+
+    op.bulk_insert(entitlements, [
+        {'plan': 'free', 'resource': resource, 'max_count': max_count}
+        for resource, max_count in FREE_PLAN_LIMITS.items()
+    ])
+
+    # ---- backfill counters from the rows that exist today ----
+    op.execute("""
+        INSERT INTO usage_counters (user_id, resource, used)
+        SELECT agency_id, 'job_postings', count(*)
+        FROM job_posting
+        WHERE NOT is_delete
+        GROUP BY agency_id
+    """)
+    op.execute("""
+        INSERT INTO usage_counters (user_id, resource, used)
+        SELECT mv.user_id, 'model_images', count(*)
+        FROM model_images mi
+        JOIN model_video mv ON mv.uuid = mi.media_uuid
+        JOIN users u ON u.id = mv.user_id
+        GROUP BY mv.user_id
+    """)
+
+    # videos = uploaded files + JSON links in model_video.video_url
+    bind = op.get_bind()
+    rows = bind.execute(sa.text("""
+        SELECT mv.user_id,
+               mv.video_url,
+               (SELECT count(*) FROM model_videos v WHERE v.media_uuid = mv.uuid) AS files
+        FROM model_video mv
+        JOIN users u ON u.id = mv.user_id
+    """)).all()
+
+    used = {}
+    for user_id, video_url, files in rows:
+        used[user_id] = used.get(user_id, 0) + files + _video_link_count(video_url)
+
+    values = [{'user_id': user_id, 'used': count} for user_id, count in used.items() if count]
+    if values:
+        bind.execute(
+            sa.text("""
+                INSERT INTO usage_counters (user_id, resource, used)
+                VALUES (:user_id, 'model_videos', :used)
+            """),
+            values
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('usage_counters')
+    op.drop_table('plan_entitlements')
+    op.drop_column('users', 'plan')
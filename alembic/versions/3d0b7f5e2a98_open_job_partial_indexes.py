@@ -0,0 +1,67 @@
+"""open job partial indexes
+
+Revision ID: 3d0b7f5e2a98
+Revises: 2c6e8a4f1d73
+Create Date: 2026-01-28 16:42:09.318457
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d0b7f5e2a98'
+down_revision: Union[str, Sequence[str], None] = '2c6e8a4f1d73'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # close what has already expired, so listings switch to status = 'open' cleanly
+    op.execute("""
+        UPDATE job_posting
+        SET status = 'closed'
+        WHERE NOT is_delete
+          AND status = 'open'
+          AND (expires_at < timezone('utc', now()) OR deadline < timezone('utc', now()))
+    """)
+
+    op.drop_index('ix_job_posting_live_id', table_name='job_posting')
+    op.create_index(
+        'ix_job_posting_open_public_id',
+        'job_posting',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text("NOT is_delete AND visibility = 'public' AND status = 'open'")
+    )
+    op.create_index(
+        'ix_job_posting_open_expires_at',
+        'job_posting',
+        ['expires_at'],
+        unique=False,
+        postgresql_where=sa.text("NOT is_delete AND status = 'open'")
+    )
+    op.create_index(
+        'ix_job_posting_open_deadline',
+        'job_posting',
+        ['deadline'],
+        unique=False,
+        postgresql_where=sa.text("NOT is_delete AND status = 'open'")
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_posting_open_deadline', table_name='job_posting')
+    op.drop_index('ix_job_posting_open_expires_at', table_name='job_posting')
+    op.drop_index('ix_job_posting_open_public_id', table_name='job_posting')
+    op.create_index(
+        'ix_job_posting_live_id',
+        'job_posting',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
@@ -0,0 +1,28 @@
+"""public model card updated_at index
+
+Revision ID: 4e1a9c6b3f05
+Revises: 3d0b7f5e2a98
+Create Date: 2026-02-02 09:51:26.447310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e1a9c6b3f05'
+down_revision: Union[str, Sequence[str], None] = '3d0b7f5e2a98'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_public_model_card_updated_at', 'public_model_card', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_public_model_card_updated_at', table_name='public_model_card')
@@ -0,0 +1,66 @@
+"""model job recommendations feed
+
+Revision ID: 5f2d8b0c7e14
+Revises: 4e1a9c6b3f05
+Create Date: 2026-02-05 14:03:51.902674
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2d8b0c7e14'
+down_revision: Union[str, Sequence[str], None] = '4e1a9c6b3f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('model_job_recommendations',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('job_ids', postgresql.ARRAY(sa.Integer()), server_default='{}', nullable=False),
+    sa.Column('scores', postgresql.ARRAY(sa.Float()), server_default='{}', nullable=False),
+    sa.Column('stale', sa.Boolean(), server_default='true', nullable=False),
+    sa.Column('computed_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id')
+    )
+    op.create_index(
+        'ix_model_job_recommendations_stale',
+        'model_job_recommendations',
+        ['user_id'],
+        unique=False,
+        postgresql_where=sa.text('stale')
+    )
+
+    op.add_column('job_posting', sa.Column('recommended_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(
+        'ix_job_posting_pending_recommendation',
+        'job_posting',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text(
+            "NOT is_delete AND visibility = 'public' AND status = 'open' AND recommended_at IS NULL"
+        )
+    )
+
+    # every model starts with a stale feed, built from all open jobs by the
+    # worker, so the jobs that exist today don't need a fan-out
+    op.execute("""
+        INSERT INTO model_job_recommendations (user_id, stale)
+        SELECT user_id, true FROM public_model_card
+    """)
+    op.execute("UPDATE job_posting SET recommended_at = now()")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_posting_pending_recommendation', table_name='job_posting')
+    op.drop_column('job_posting', 'recommended_at')
+    op.drop_index('ix_model_job_recommendations_stale', table_name='model_job_recommendations')
+    op.drop_table('model_job_recommendations')
@@ -0,0 +1,42 @@
+"""job applications agency indexes
+
+Revision ID: 6a3c1e9d8b27
+Revises: 5f2d8b0c7e14
+Create Date: 2026-02-09 11:37:14.258031
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a3c1e9d8b27'
+down_revision: Union[str, Sequence[str], None] = '5f2d8b0c7e14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_applications_job_id_id',
+        'job_applications',
+        ['job_id', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
+    op.create_index(
+        'ix_job_applications_job_status_id',
+        'job_applications',
+        ['job_id', 'status', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_job_status_id', table_name='job_applications')
+    op.drop_index('ix_job_applications_job_id_id', table_name='job_applications')
@@ -0,0 +1,53 @@
+"""job applications unique job and model
+
+Revision ID: 7b4d2f0a9c36
+Revises: 6a3c1e9d8b27
+Create Date: 2026-02-12 15:20:48.771903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b4d2f0a9c36'
+down_revision: Union[str, Sequence[str], None] = '6a3c1e9d8b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # one application per (job, model) pair: keep the live one furthest
+    # along (hired > shortlisted > rejected > applied), then the oldest
+    op.execute("""
+        DELETE FROM job_applications
+        WHERE id IN (
+            SELECT id
+            FROM (
+                SELECT id,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY job_id, model_id
+                           ORDER BY coalesce(is_delete, false),
+                                    CASE status
+                                        WHEN 'hired' THEN 4
+                                        WHEN 'shortlisted' THEN 3
+                                        WHEN 'rejected' THEN 2
+                                        WHEN 'applied' THEN 1
+                                        ELSE 0
+                                    END DESC,
+                                    id
+                       ) AS keep_rank
+                FROM job_applications
+            ) ranked
+            WHERE keep_rank > 1
+        )
+    """)
+    op.create_unique_constraint('uq_job_applications_job_model', 'job_applications', ['job_id', 'model_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_job_applications_job_model', 'job_applications', type_='unique')
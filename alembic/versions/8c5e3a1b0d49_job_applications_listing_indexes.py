@@ -0,0 +1,50 @@
+"""job applications listing indexes
+
+Revision ID: 8c5e3a1b0d49
+Revises: 7b4d2f0a9c36
+Create Date: 2026-02-16 10:08:33.524716
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c5e3a1b0d49'
+down_revision: Union[str, Sequence[str], None] = '7b4d2f0a9c36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_applications_created_at_id',
+        'job_applications',
+        ['created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
+    op.create_index(
+        'ix_job_applications_job_created_at_id',
+        'job_applications',
+        ['job_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
+    op.create_index(
+        'ix_job_applications_model_created_at_id',
+        'job_applications',
+        ['model_id', 'created_at', 'id'],
+        unique=False,
+        postgresql_where=sa.text('NOT is_delete')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_model_created_at_id', table_name='job_applications')
+    op.drop_index('ix_job_applications_job_created_at_id', table_name='job_applications')
+    op.drop_index('ix_job_applications_created_at_id', table_name='job_applications')
@@ -0,0 +1,34 @@
+"""public catalog keyset index
+
+Revision ID: 8f8816b9ece3
+Revises: 29b234a50301
+Create Date: 2026-01-05 11:20:41.512334
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f8816b9ece3'
+down_revision: Union[str, Sequence[str], None] = '29b234a50301'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_users_models_first_name_id',
+        'users',
+        ['first_name', 'id'],
+        unique=False,
+        postgresql_where=sa.text('user_type = 1')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_models_first_name_id', table_name='users')
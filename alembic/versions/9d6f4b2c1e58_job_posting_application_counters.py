@@ -0,0 +1,55 @@
+"""job posting application counters
+
+Revision ID: 9d6f4b2c1e58
+Revises: 8c5e3a1b0d49
+Create Date: 2026-02-19 11:42:07.318546
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d6f4b2c1e58'
+down_revision: Union[str, Sequence[str], None] = '8c5e3a1b0d49'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+COUNTERS = ('applications_count', 'applied_count', 'shortlisted_count', 'rejected_count', 'hired_count')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in COUNTERS:
+        op.add_column('job_posting', sa.Column(column, sa.Integer(), server_default='0', nullable=False))
+
+    # ---- backfill from the live applications ----
+    op.execute("""
+        UPDATE job_posting jp
+        SET applications_count = c.total,
+            applied_count = c.applied,
+            shortlisted_count = c.shortlisted,
+            rejected_count = c.rejected,
+            hired_count = c.hired
+        FROM (
+            SELECT job_id,
+                   count(*) AS total,
+                   count(*) FILTER (WHERE status = 'applied') AS applied,
+                   count(*) FILTER (WHERE status = 'shortlisted') AS shortlisted,
+                   count(*) FILTER (WHERE status = 'rejected') AS rejected,
+                   count(*) FILTER (WHERE status = 'hired') AS hired
+            FROM job_applications
+            WHERE NOT is_delete
+            GROUP BY job_id
+        ) c
+        WHERE c.job_id = jp.id
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in reversed(COUNTERS):
+        op.drop_column('job_posting', column)
@@ -0,0 +1,28 @@
+"""users token version
+
+Revision ID: a1e7c5d3f260
+Revises: 9d6f4b2c1e58
+Create Date: 2026-02-23 09:27:51.804137
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a1e7c5d3f260'
+down_revision: Union[str, Sequence[str], None] = '9d6f4b2c1e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,37 @@
+"""model feed job ids index
+
+Revision ID: b2f8d6e4a371
+Revises: a1e7c5d3f260
+Create Date: 2026-02-26 14:05:19.662013
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2f8d6e4a371'
+down_revision: Union[str, Sequence[str], None] = 'a1e7c5d3f260'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_model_job_recommendations_job_ids',
+        'model_job_recommendations',
+        ['job_ids'],
+        unique=False,
+        postgresql_using='gin'
+    )
+
+    # feeds built so far may hold closed or deleted jobs: rebuild them
+    op.execute("UPDATE model_job_recommendations SET stale = true")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_model_job_recommendations_job_ids', table_name='model_job_recommendations')
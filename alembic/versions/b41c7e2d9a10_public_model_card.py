@@ -0,0 +1,63 @@
+"""public model card read model
+
+Revision ID: b41c7e2d9a10
+Revises: 8f8816b9ece3
+Create Date: 2026-01-08 16:02:13.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b41c7e2d9a10'
+down_revision: Union[str, Sequence[str], None] = '8f8816b9ece3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('public_model_card',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('user_uuid', sa.UUID(), nullable=False),
+    sa.Column('first_name', sa.String(), nullable=False),
+    sa.Column('last_name', sa.String(), nullable=False),
+    sa.Column('gender', sa.String(), nullable=True),
+    sa.Column('current_city', sa.String(), nullable=True),
+    sa.Column('nationality', sa.String(), nullable=True),
+    sa.Column('age', sa.Integer(), nullable=True),
+    sa.Column('approved', sa.Boolean(), nullable=True),
+    sa.Column('height', sa.String(length=100), nullable=True),
+    sa.Column('weight', sa.String(length=100), nullable=True),
+    sa.Column('chest_bust', sa.String(length=100), nullable=True),
+    sa.Column('waist', sa.String(length=100), nullable=True),
+    sa.Column('hips', sa.String(length=100), nullable=True),
+    sa.Column('shoe_size', sa.String(length=100), nullable=True),
+    sa.Column('eye_color', sa.String(length=255), nullable=True),
+    sa.Column('hair_color', sa.String(length=255), nullable=True),
+    sa.Column('complexion', sa.String(length=255), nullable=True),
+    sa.Column('profile_photo', sa.String(), nullable=True),
+    sa.Column('video', sa.String(), nullable=True),
+    sa.Column('is_public_complete', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id'),
+    sa.UniqueConstraint('user_uuid')
+    )
+    op.create_index(
+        'ix_public_model_card_catalog',
+        'public_model_card',
+        ['first_name', 'user_id'],
+        unique=False,
+        postgresql_where=sa.text('is_public_complete')
+    )
+    # fill it afterwards with: python -m public.service_model_card
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_public_model_card_catalog', table_name='public_model_card')
+    op.drop_table('public_model_card')
@@ -0,0 +1,36 @@
+"""model profile measurement ranges
+
+Revision ID: c4a9e2f7b815
+Revises: b2f8d6e4a371
+Create Date: 2026-02-27 10:41:07.318245
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.measurements import PLAUSIBLE_RANGES
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a9e2f7b815'
+down_revision: Union[str, Sequence[str], None] = 'b2f8d6e4a371'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # the e93b1c4d7a20 backfill kept any number; drop the implausible ones
+    for column, (low, high) in PLAUSIBLE_RANGES.items():
+        op.execute(
+            f"UPDATE model_profile SET {column} = NULL "
+            f"WHERE {column} < {low} OR {column} > {high}"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # the cleared values were wrong, nothing to restore
+    pass
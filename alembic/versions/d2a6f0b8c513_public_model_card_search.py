@@ -0,0 +1,71 @@
+"""public model card search columns and indexes
+
+Revision ID: d2a6f0b8c513
+Revises: c7d3e5a91f42
+Create Date: 2026-01-14 10:41:52.118306
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a6f0b8c513'
+down_revision: Union[str, Sequence[str], None] = 'c7d3e5a91f42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('public_model_card', sa.Column('body_type', sa.String(length=255), nullable=True))
+    op.add_column('public_model_card', sa.Column('height_cm', sa.Float(), nullable=True))
+    op.add_column('public_model_card', sa.Column('skills', postgresql.ARRAY(sa.String()), nullable=True))
+    op.add_column('public_model_card', sa.Column('languages', postgresql.ARRAY(sa.String()), nullable=True))
+    op.add_column('public_model_card', sa.Column('interested_categories', postgresql.ARRAY(sa.String()), nullable=True))
+    op.add_column('public_model_card', sa.Column('willing_to_travel', sa.Boolean(), nullable=True))
+
+    op.create_index(
+        'ix_public_model_card_gender_age',
+        'public_model_card',
+        [sa.text('lower(gender)'), 'age'],
+        unique=False,
+        postgresql_where=sa.text('is_public_complete')
+    )
+    op.create_index(
+        'ix_public_model_card_city',
+        'public_model_card',
+        [sa.text('lower(current_city)')],
+        unique=False,
+        postgresql_where=sa.text('is_public_complete')
+    )
+    op.create_index(
+        'ix_public_model_card_height',
+        'public_model_card',
+        ['height_cm'],
+        unique=False,
+        postgresql_where=sa.text('is_public_complete')
+    )
+    op.create_index('ix_public_model_card_skills', 'public_model_card', ['skills'], unique=False, postgresql_using='gin')
+    op.create_index('ix_public_model_card_languages', 'public_model_card', ['languages'], unique=False, postgresql_using='gin')
+    op.create_index('ix_public_model_card_categories', 'public_model_card', ['interested_categories'], unique=False, postgresql_using='gin')
+    # fill the new columns afterwards with: python -m public.service_model_card
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_public_model_card_categories', table_name='public_model_card')
+    op.drop_index('ix_public_model_card_languages', table_name='public_model_card')
+    op.drop_index('ix_public_model_card_skills', table_name='public_model_card')
+    op.drop_index('ix_public_model_card_height', table_name='public_model_card')
+    op.drop_index('ix_public_model_card_city', table_name='public_model_card')
+    op.drop_index('ix_public_model_card_gender_age', table_name='public_model_card')
+    op.drop_column('public_model_card', 'willing_to_travel')
+    op.drop_column('public_model_card', 'interested_categories')
+    op.drop_column('public_model_card', 'languages')
+    op.drop_column('public_model_card', 'skills')
+    op.drop_column('public_model_card', 'height_cm')
+    op.drop_column('public_model_card', 'body_type')
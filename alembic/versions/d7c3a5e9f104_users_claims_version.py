@@ -0,0 +1,28 @@
+"""users claims version
+
+Revision ID: d7c3a5e9f104
+Revises: c4a9e2f7b815
+Create Date: 2026-02-27 16:22:38.904117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7c3a5e9f104'
+down_revision: Union[str, Sequence[str], None] = 'c4a9e2f7b815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('claims_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'claims_version')
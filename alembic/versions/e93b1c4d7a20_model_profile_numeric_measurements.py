@@ -0,0 +1,65 @@
+"""model profile numeric measurement columns
+
+Revision ID: e93b1c4d7a20
+Revises: d2a6f0b8c513
+Create Date: 2026-01-16 09:12:44.670215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from utils.measurements import MEASUREMENT_FIELDS, normalized_measurements
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e93b1c4d7a20'
+down_revision: Union[str, Sequence[str], None] = 'd2a6f0b8c513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column in MEASUREMENT_FIELDS:
+        op.add_column('model_profile', sa.Column(column, sa.Float(), nullable=True))
+
+    # backfill from the free-text columns in id batches
+    bind = op.get_bind()
+    text_fields = [field for field, _ in MEASUREMENT_FIELDS.values()]
+    select_batch = sa.text(
+        f"SELECT id, {', '.join(text_fields)} FROM model_profile "
+        "WHERE id > :last_id ORDER BY id LIMIT :limit"
+    )
+    update_row = sa.text(
+        "UPDATE model_profile SET "
+        + ", ".join(f"{column} = :{column}" for column in MEASUREMENT_FIELDS)
+        + " WHERE id = :id"
+    )
+
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            select_batch, {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE}
+        ).mappings().all()
+        if not rows:
+            break
+
+        bind.execute(update_row, [
+            {"id": row["id"], **normalized_measurements(dict(row))}
+            for row in rows
+        ])
+        last_id = rows[-1]["id"]
+
+    for column in MEASUREMENT_FIELDS:
+        op.create_index(op.f(f'ix_model_profile_{column}'), 'model_profile', [column], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for column in MEASUREMENT_FIELDS:
+        op.drop_index(op.f(f'ix_model_profile_{column}'), table_name='model_profile')
+        op.drop_column('model_profile', column)
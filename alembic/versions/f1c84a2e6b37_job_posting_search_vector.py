@@ -0,0 +1,42 @@
+"""job posting full text search vector
+
+Revision ID: f1c84a2e6b37
+Revises: e93b1c4d7a20
+Create Date: 2026-01-19 14:05:31.442870
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c84a2e6b37'
+down_revision: Union[str, Sequence[str], None] = 'e93b1c4d7a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_posting', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # same weighting as agency.service_jobposting.job_search_vector
+    op.execute("""
+        UPDATE job_posting SET search_vector =
+            setweight(to_tsvector('english', coalesce(job_role, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(required_skills, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(location, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(project_type, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(description, '')), 'D')
+    """)
+
+    op.create_index('ix_job_posting_search_vector', 'job_posting', ['search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_posting_search_vector', table_name='job_posting')
+    op.drop_column('job_posting', 'search_vector')
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from database import get_db     # <-- use async get_db
 from .schemas import RegisterUser, LoginUser, RefreshSchema, GoogleLogin
@@ -7,6 +7,7 @@ from .service import (
     refresh_access_token, login_with_google
 )
 from model.model_profile_progress_service import calculate_profile_progress
+from core.rate_limit import enforce_login_limits
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -53,7 +54,10 @@ async def register(user: RegisterUser, db: AsyncSession = Depends(get_db)):
 # ----------------- Login -----------------
 
 @router.post("/login")
-async def login(data: LoginUser, db: AsyncSession = Depends(get_db)):
+async def login(request: Request, data: LoginUser, db: AsyncSession = Depends(get_db)):
+    # before any decrypt / query / bcrypt
+    await enforce_login_limits(request, "auth", data.email)
+
     resp, err = await authenticate_user(db, data.email, data.password)
     if err:
         raise HTTPException(status_code=404,detail="Invalid email or password")
@@ -71,8 +75,8 @@ async def login(data: LoginUser, db: AsyncSession = Depends(get_db)):
 
 # ----------------- Refresh Token -----------------
 @router.post("/refresh", summary="Generate new access token using refresh token")
-async def refresh_token_api(data: RefreshSchema):
-    token, err = await refresh_access_token(data.refresh_token)
+async def refresh_token_api(data: RefreshSchema, db: AsyncSession = Depends(get_db)):
+    token, err = await refresh_access_token(db, data.refresh_token)
     if err:
         raise HTTPException(status_code=401, detail=err)
 
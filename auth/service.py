@@ -4,11 +4,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from core.security import (
-    hash_password, verify_password,
+    hash_password_async, verify_and_update_password,
     create_access_token, create_refresh_token,
-    verify_refresh_token
+    decode_token, user_claims
 )
 from core.google_auth import verify_google_id_token
+from core.principal import parse_subject, is_refresh_payload
 from models import User
 from core.aes_encryption import aes_decrypt
 # removed unused decrypt_password import
@@ -57,7 +58,7 @@ async def register_user(db: AsyncSession, data: RegisterUser):
         email=data.email,
         country_code=data.country_code,
         phone=data.phone,
-        password=hash_password(decrypted_password),
+        password=await hash_password_async(decrypted_password),
         dob=data.dob,
         age=calculate_age(data.dob)
     )
@@ -96,13 +97,18 @@ async def authenticate_user(db: AsyncSession, email: str, password: str):
     if not decrypted_password or decrypted_password.strip() == "":
         return None, "Invalid encrypted password"
 
-    # bcrypt verify
-    if not verify_password(decrypted_password, user.password):
+    # bcrypt verify (hashing pool); re-hash when the cost setting changed
+    valid, new_hash = await verify_and_update_password(decrypted_password, user.password)
+    if not valid:
         return None, "Invalid email or password"
 
+    if new_hash:
+        user.password = new_hash
+        await db.commit()
+
     # Generate tokens
-    access_token = create_access_token(subject=str(user.uuid))
-    refresh_token = create_refresh_token(subject=str(user.uuid))
+    access_token = create_access_token(subject=str(user.uuid), claims=user_claims(user))
+    refresh_token = create_refresh_token(subject=str(user.uuid), claims={"tv": user.token_version or 0})
 
     user_info = {
         "uuid": str(user.uuid),
@@ -130,12 +136,23 @@ async def authenticate_user(db: AsyncSession, email: str, password: str):
 
 # ---------------- REFRESH TOKEN ---------------- #
 
-async def refresh_access_token(refresh_token: str):
-    user_id, err = verify_refresh_token(refresh_token)
-    if err:
-        return None, err
+async def refresh_access_token(db: AsyncSession, refresh_token: str):
+    payload = decode_token(refresh_token)
+    if payload is None:
+        return None, "Invalid or expired refresh token"
+
+    user_uuid = parse_subject(payload.get("sub"))
+    if not user_uuid or not is_refresh_payload(payload):
+        return None, "Invalid or expired refresh token"
+
+    # fresh claims from the row; a bumped token_version revokes the refresh token too
+    result = await db.execute(select(User).where(User.uuid == user_uuid))
+    user = result.scalars().first()
+
+    if not user or payload.get("tv", 0) != (user.token_version or 0):
+        return None, "Invalid or expired refresh token"
 
-    new_access_token = create_access_token(subject=user_id)
+    new_access_token = create_access_token(subject=str(user.uuid), claims=user_claims(user))
     return new_access_token, None
 
 
@@ -178,8 +195,8 @@ async def login_with_google(db: AsyncSession, id_token: str):
         await db.refresh(user)
 
     # 3. Generate tokens (same as normal login)
-    access_token = create_access_token(subject=str(user.uuid))
-    refresh_token = create_refresh_token(subject=str(user.uuid))
+    access_token = create_access_token(subject=str(user.uuid), claims=user_claims(user))
+    refresh_token = create_refresh_token(subject=str(user.uuid), claims={"tv": user.token_version or 0})
 
     user_info = {
         "uuid": str(user.uuid),
@@ -0,0 +1,157 @@
+# benchmarks/bench_login_storm.py
+"""
+Does a burst of logins stall the rest of the worker?
+
+In-process (no server or database needed): fires N concurrent bcrypt
+verifications, once inline on the event loop (the old behaviour) and
+once through core.security's hashing pool, while a probe task measures
+how late the event loop wakes it up every 10 ms:
+
+    python -m benchmarks.bench_login_storm              # 50 logins
+    python -m benchmarks.bench_login_storm --logins 200
+
+Against a running server: GET latency of a non-auth endpoint, first
+alone, then during a storm of POST /auth/login with a real account:
+
+    python -m benchmarks.bench_login_storm --url http://127.0.0.1:8000 \\
+        --email someone@example.com --password secret --logins 200
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from core.security import (
+    pwd_context, verify_and_update_password, password_hashing_stats
+)
+
+PROBE_INTERVAL = 0.01
+
+
+def summary(samples: list[float]) -> str:
+    if not samples:
+        return "no samples"
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+    return (
+        f"n={len(ordered):>5}  p50={pick(0.50):7.1f} ms  p95={pick(0.95):7.1f} ms  "
+        f"p99={pick(0.99):7.1f} ms  max={ordered[-1] * 1000:7.1f} ms"
+    )
+
+
+# -----------------------------------
+# 🧪 IN-PROCESS: EVENT-LOOP LAG
+# -----------------------------------
+async def probe_lag(stop: asyncio.Event, samples: list):
+    """How much later than PROBE_INTERVAL the loop lets us run"""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append(max(0.0, time.perf_counter() - started - PROBE_INTERVAL))
+
+
+async def inline_verify(password: str, hashed: str):
+    # what the handlers did before: bcrypt right on the event loop
+    return pwd_context.verify_and_update(password, hashed)
+
+
+async def storm(verify, logins: int, password: str, hashed: str):
+    samples = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_lag(stop, samples))
+    await asyncio.sleep(PROBE_INTERVAL * 5)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(verify(password, hashed) for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    return samples, elapsed
+
+
+async def run_in_process(logins: int):
+    password = "bench-password"
+    hashed = pwd_context.hash(password)
+
+    print(f"{logins} concurrent logins, event-loop lag seen by a {PROBE_INTERVAL * 1000:.0f} ms probe")
+    for name, verify in (("inline", inline_verify), ("pool", verify_and_update_password)):
+        samples, elapsed = await storm(verify, logins, password, hashed)
+        print(f"{name:>7} | {elapsed:6.2f} s | {logins / elapsed:6.1f} logins/s | lag {summary(samples)}")
+
+    print(f"pool stats: {password_hashing_stats()}")
+
+
+# -----------------------------------
+# 🌐 AGAINST A RUNNING SERVER
+# -----------------------------------
+async def probe_http(client, path: str, stop: asyncio.Event, samples: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await client.get(path)
+        samples.append(time.perf_counter() - started)
+        await asyncio.sleep(PROBE_INTERVAL)
+
+
+async def run_http(url: str, probe_path: str, email: str, password: str, logins: int, baseline_seconds: float):
+    import httpx
+    from core.aes_encryption import aes_encrypt
+
+    body = {"email": email, "password": aes_encrypt(password)}
+    limits = httpx.Limits(max_connections=logins + 10)
+
+    async with httpx.AsyncClient(base_url=url, timeout=60, limits=limits) as client:
+        baseline = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_http(client, probe_path, stop, baseline))
+        await asyncio.sleep(baseline_seconds)
+        stop.set()
+        await probe
+
+        during = []
+        stop = asyncio.Event()
+        probe = asyncio.create_task(probe_http(client, probe_path, stop, during))
+
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.post("/auth/login", json=body) for _ in range(logins)),
+            return_exceptions=True
+        )
+        elapsed = time.perf_counter() - started
+
+        stop.set()
+        await probe
+
+    statuses = {}
+    for response in responses:
+        key = type(response).__name__ if isinstance(response, Exception) else response.status_code
+        statuses[key] = statuses.get(key, 0) + 1
+
+    print(f"GET {probe_path} alone        | {summary(baseline)}")
+    print(f"GET {probe_path} during storm | {summary(during)}")
+    print(
+        f"{logins} logins in {elapsed:.2f} s ({logins / elapsed:.1f}/s), statuses {statuses}, "
+        f"median probe slowdown x{statistics.median(during) / statistics.median(baseline):.2f}"
+        if baseline and during else ""
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=50)
+    parser.add_argument("--url")
+    parser.add_argument("--probe-path", default="/")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--baseline-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+
+    if args.url:
+        if not (args.email and args.password):
+            parser.error("--url needs --email and --password")
+        asyncio.run(run_http(
+            args.url.rstrip("/"), args.probe_path, args.email, args.password,
+            args.logins, args.baseline_seconds
+        ))
+    else:
+        asyncio.run(run_in_process(args.logins))
@@ -0,0 +1,174 @@
+# benchmarks/bench_public_models.py
+"""
+Query count + latency of the GET /public/models loading strategies.
+
+Seeds N synthetic models (user + profile + professional + gallery + 5 images)
+inside a transaction that is ROLLED BACK at the end, so it is safe to point
+at a dev database:
+
+    python -m benchmarks.bench_public_models            # 1k, 10k, 50k
+    python -m benchmarks.bench_public_models 1000 5000
+
+Compares the old per-model fan-out (4N + 1 queries) with
+public.service_models.load_model_catalog (constant query count).
+"""
+import asyncio
+import sys
+import time
+import uuid
+from datetime import date
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from core.config import get_settings
+from models import (
+    User, ModelProfile, ModelProfessional, Image_Videos, ModelImages
+)
+from public.service_models import load_model_catalog
+
+DEFAULT_SIZES = [1_000, 10_000, 50_000]
+BATCH = 2_000
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+async def seed(db: AsyncSession, n: int):
+    prefix = uuid.uuid4().hex[:8]
+
+    for start in range(0, n, BATCH):
+        size = min(BATCH, n - start)
+
+        user_ids = (await db.execute(
+            insert(User).returning(User.id),
+            [
+                {
+                    "user_type": 1,
+                    "first_name": f"Bench{start + i:06d}",
+                    "last_name": "Model",
+                    "email": f"bench_{prefix}_{start + i}@example.com",
+                    "country_code": "+1",
+                    "phone": f"bench{prefix}{start + i}",
+                    "password": "x",
+                    "dob": date(2000, 1, 1),
+                    "age": 25,
+                    "gender": "female",
+                    "current_city": "Mumbai",
+                    "nationality": "Indian",
+                }
+                for i in range(size)
+            ]
+        )).scalars().all()
+
+        await db.execute(insert(ModelProfile), [
+            {
+                "user_id": uid, "height": "175", "weight": "55",
+                "chest_bust": "34", "waist": "26", "hips": "36",
+                "shoulder": "15", "shoe_size": "7", "complexion": "fair",
+                "eye_color": "brown", "hair_color": "black",
+                "body_type": "slim", "hair_length": "long",
+            }
+            for uid in user_ids
+        ])
+
+        await db.execute(insert(ModelProfessional), [
+            {
+                "user_id": uid, "experience_details": "2 years",
+                "skills": ["ramp"], "languages": ["english"],
+                "interested_categories": ["fashion"],
+            }
+            for uid in user_ids
+        ])
+
+        media_uuids = [uuid.uuid4() for _ in user_ids]
+        await db.execute(insert(Image_Videos), [
+            {"uuid": m, "user_id": uid}
+            for uid, m in zip(user_ids, media_uuids)
+        ])
+
+        await db.execute(insert(ModelImages), [
+            {"media_uuid": m, "image_index": idx, "image_path": f"uploads/bench/{m}_{idx}.jpg"}
+            for m in media_uuids
+            for idx in range(5)
+        ])
+
+
+async def legacy_load(db: AsyncSession):
+    """The pre-batching implementation: 4 queries per model"""
+    users = (await db.execute(
+        select(User).where(User.user_type == 1).order_by(User.first_name.asc())
+    )).scalars().all()
+
+    for user in users:
+        (await db.execute(
+            select(ModelProfile).where(ModelProfile.user_id == user.id).limit(1)
+        )).scalars().first()
+        (await db.execute(
+            select(ModelProfessional).where(ModelProfessional.user_id == user.id).limit(1)
+        )).scalars().first()
+        media = (await db.execute(
+            select(Image_Videos).where(Image_Videos.user_id == user.id)
+        )).scalars().first()
+        if media:
+            (await db.execute(
+                select(ModelImages)
+                .where(ModelImages.media_uuid == media.uuid)
+                .order_by(ModelImages.image_index)
+                .limit(5)
+            )).scalars().all()
+
+    return users
+
+
+async def batched_load(db: AsyncSession):
+    return await load_model_catalog(db, User.user_type == 1)
+
+
+async def measure(engine, db: AsyncSession, loader):
+    counter = QueryCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    try:
+        db.expunge_all()
+        started = time.perf_counter()
+        rows = await loader(db)
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+
+    return len(rows), counter.count, elapsed
+
+
+async def run(sizes):
+    engine = create_async_engine(get_settings().DATABASE_URL, echo=False)
+
+    print(f"{'models':>8} | {'strategy':>8} | {'rows':>7} | {'queries':>8} | {'seconds':>8}")
+    print("-" * 52)
+
+    for n in sizes:
+        async with engine.connect() as conn:
+            trans = await conn.begin()
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+
+            try:
+                await seed(db, n)
+                await db.flush()
+
+                for name, loader in (("legacy", legacy_load), ("batched", batched_load)):
+                    rows, queries, elapsed = await measure(engine, db, loader)
+                    print(f"{n:>8} | {name:>8} | {rows:>7} | {queries:>8} | {elapsed:>8.3f}")
+            finally:
+                await db.close()
+                await trans.rollback()
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    asyncio.run(run(sizes))
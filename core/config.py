@@ -18,6 +18,25 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 
+    # bcrypt cost; hashes of another cost are re-hashed on the next login
+    BCRYPT_ROUNDS: int = 12
+    # threads doing bcrypt per worker, and how many calls may wait for one
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_WAITING: int = 200
+
+    # login token buckets (burst, refill per minute), per IP and per email;
+    # per worker unless RATE_LIMIT_REDIS_URL is set (needs `pip install redis`)
+    LOGIN_IP_BURST: int = 20
+    LOGIN_IP_PER_MINUTE: float = 10
+    LOGIN_EMAIL_BURST: int = 5
+    LOGIN_EMAIL_PER_MINUTE: float = 1
+    RATE_LIMIT_REDIS_URL: Optional[str] = None
+    # full-table exports (burst, refill per minute), per user
+    EXPORT_BURST: int = 3
+    EXPORT_PER_MINUTE: float = 1
+    # take the client IP from X-Forwarded-For (only behind a trusted proxy)
+    TRUST_PROXY_HEADERS: bool = False
+
     UPLOAD_DIR: ClassVar[str] = "uploads"
 
     # ✅ Pydantic v2 compatible private attribute
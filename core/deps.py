@@ -1,11 +1,14 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, cast, String
 
 from database import AsyncSessionLocal
 from core.security import decode_token
-from models import User, AdminUser
+from core.principal import (
+    UserPrincipal, AdminPrincipal, parse_subject, is_access_payload,
+    resolve_user_principal, get_admin_principal
+)
+from models import User
 
 
 auth_scheme = HTTPBearer()
@@ -22,10 +25,14 @@ async def get_db() -> AsyncSession:
 # -------------------------
 # CURRENT USER (ASYNC)
 # -------------------------
-async def get_current_user(
+async def get_principal(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(auth_scheme)
-) -> User:
+) -> UserPrincipal:
+    """
+    The caller (id, uuid, user_type, approved, plan), from the token
+    claims; routes that need other columns depend on get_current_user_row
+    """
 
     token = credentials.credentials
     payload = decode_token(token)
@@ -33,15 +40,27 @@ async def get_current_user(
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
-    sub = payload.get("sub")
-    if not sub:
+    if not parse_subject(payload.get("sub")):
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    # ✅ Use cast to String for UUID comparison
-    result = await db.execute(
-        select(User).where(cast(User.uuid, String) == str(sub))
-    )
-    user = result.scalars().first()
+    user = await resolve_user_principal(db, payload)
+
+    if not user:
+        raise HTTPException(status_code=401, detail="User not found or token revoked")
+
+    return user
+
+
+# existing routes depend on this name
+get_current_user = get_principal
+
+
+async def get_current_user_row(
+    principal: UserPrincipal = Depends(get_principal),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """Opt-in: the full User row of the caller"""
+    user = await db.get(User, principal.id)
 
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
@@ -55,9 +74,9 @@ async def get_current_user(
 async def get_current_admin(
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials = Depends(auth_scheme)
-) -> AdminUser:
+) -> AdminPrincipal:
     """
-    Extract admin from JWT token
+    Extract admin from JWT token (cached snapshot: id, uuid, role)
     """
     token = credentials.credentials  # ✅ HTTPBearer automatically strips "Bearer "
     payload = decode_token(token)
@@ -68,18 +87,14 @@ async def get_current_admin(
             detail="Invalid or expired token"
         )
 
-    uuid = payload.get("sub")
-    if not uuid:
+    uuid = parse_subject(payload.get("sub"))
+    if not uuid or not is_access_payload(payload):
         raise HTTPException(
             status_code=401,
             detail="Invalid token payload"
         )
 
-    # ✅ Use cast to String for UUID comparison
-    result = await db.execute(
-        select(AdminUser).where(cast(AdminUser.uuid, String) == str(uuid))
-    )
-    admin = result.scalars().first()
+    admin = await get_admin_principal(db, uuid)
 
     if not admin:
         raise HTTPException(
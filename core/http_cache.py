@@ -0,0 +1,155 @@
+# core/http_cache.py
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, event
+from sqlalchemy.dialects.postgresql import insert
+
+from core.cache import TTLCache
+from models import ResourceVersion
+
+
+# -----------------------------------
+# 🏷️ VERSIONED RESOURCES
+# -----------------------------------
+SLIDERS = "sliders"
+SKILLS = "skills"
+WORK_TYPES = "work_types"
+CONTACT_BANNER = "contact_banner"
+AGENCIES = "agencies"
+JOBS = "jobs"
+
+PUBLIC_CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+# Each worker re-reads a version at most every VERSION_TTL_SECONDS, so a
+# warm revalidation is answered without a query and a bump made through
+# another worker is picked up within a few seconds.
+VERSION_TTL_SECONDS = 5
+_versions = TTLCache(maxsize=64, ttl=VERSION_TTL_SECONDS)
+
+# session.info key: names bumped in the open transaction
+_BUMPED = "bumped_versions"
+
+
+def _drop_bumped_versions(session):
+    for name in session.info.pop(_BUMPED, ()):
+        _versions.pop(name)
+
+
+async def bump_version(db: AsyncSession, *names: str):
+    """
+    Invalidate the validators of the given resources.
+    Call it BEFORE db.commit() so the bump commits with the write; this
+    worker's cached versions are dropped once the commit has happened (a
+    read in between would cache the old version again).
+    """
+    stmt = insert(ResourceVersion).values([
+        {"name": name, "version": 1} for name in names
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ResourceVersion.name],
+        set_={
+            "version": ResourceVersion.version + 1,
+            "updated_at": func.now(),
+        }
+    )
+    await db.execute(stmt)
+
+    db.info.setdefault(_BUMPED, set()).update(names)
+    if not event.contains(db.sync_session, "after_commit", _drop_bumped_versions):
+        event.listen(db.sync_session, "after_commit", _drop_bumped_versions)
+
+
+async def get_version(db: AsyncSession, name: str) -> tuple[int, datetime | None]:
+    cached = _versions.get(name)
+    if cached is not None:
+        return cached
+
+    result = await db.execute(
+        select(ResourceVersion.version, ResourceVersion.updated_at)
+        .where(ResourceVersion.name == name)
+    )
+    row = result.first()
+
+    value = (row.version, row.updated_at) if row else (0, None)
+    _versions.set(name, value)
+    return value
+
+
+# -----------------------------------
+# 🔁 CONDITIONAL GET
+# -----------------------------------
+def make_etag(name: str, version: int, *parts) -> str:
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()[:12]
+    return f'W/"{name}-{version}-{digest}"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def _is_not_modified(request: Request, etag: str, last_modified: datetime | None) -> bool:
+    # If-None-Match wins over If-Modified-Since (RFC 9110 13.2.2)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = {_opaque_tag(t) for t in if_none_match.split(",")}
+        return "*" in tags or _opaque_tag(etag) in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+
+        return last_modified.replace(microsecond=0) <= since
+
+    return False
+
+
+async def conditional_get(
+    request: Request,
+    response: Response,
+    db: AsyncSession,
+    name: str,
+    changes_daily: bool = False,
+    cache_control: str = PUBLIC_CACHE_CONTROL
+) -> Response | None:
+    """
+    Revalidate a public GET against the resource version.
+
+    Returns a 304 Response to send as-is when the client copy is still
+    fresh; otherwise sets ETag / Last-Modified / Cache-Control on
+    `response` and returns None so the route builds the body.
+    `changes_daily` is for bodies with day-relative text ("3 days ago").
+    """
+    version, last_modified = await get_version(db, name)
+
+    parts = [str(request.base_url), request.url.query]
+
+    if changes_daily:
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        parts.append(today.date().isoformat())
+        if last_modified:
+            last_modified = max(last_modified, today)
+
+    etag = make_etag(name, version, *parts)
+
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+
+    if _is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,60 @@
+# core/pagination.py
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(*values) -> str:
+    """Opaque keyset cursor from the sort key of the last row of a page"""
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _cursor_value(value, kind):
+    # json gives str / int / float / bool / None; each sort key must come
+    # back as its column type, or the keyset comparison fails in the db
+    if kind is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    if kind is int and isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if kind is str and isinstance(value, str):
+        return value
+    raise ValueError(f"expected {kind.__name__}")
+
+
+def decode_cursor(cursor: str, *types) -> list:
+    """
+    Decode a cursor made by encode_cursor into values of `types` (int,
+    str or datetime, one per sort key); 400 if it was tampered with
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("wrong size")
+        return [_cursor_value(value, kind) for value, kind in zip(values, types)]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def clamp_limit(limit: int | None) -> int:
+    if not limit or limit < 1:
+        return DEFAULT_PAGE_SIZE
+    return min(limit, MAX_PAGE_SIZE)
+
+
+def build_page(rows: list, limit: int, cursor_of) -> tuple[list, str | None]:
+    """
+    `rows` is the result of a LIMIT limit + 1 query.
+    Returns (page_rows, next_cursor).
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    return page, encode_cursor(*cursor_of(page[-1]))
@@ -0,0 +1,219 @@
+# core/principal.py
+import time
+from typing import NamedTuple
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update
+
+from core.cache import TTLCache
+from core.config import get_settings
+from models import User, AdminUser
+
+
+# -----------------------------------
+# 🪪 AUTHENTICATED PRINCIPALS
+# -----------------------------------
+class UserPrincipal(NamedTuple):
+    """What routes need of the caller; load the User row for anything else"""
+    id: int
+    uuid: UUID
+    user_type: int
+    approved: bool | None
+    plan: str
+
+
+class AdminPrincipal(NamedTuple):
+    id: int
+    uuid: UUID
+    role: str | None
+
+
+# token sub -> principal, per worker. A write through this worker drops
+# the entry at once (invalidate_*); other workers see it within the TTL.
+PRINCIPAL_TTL_SECONDS = 30
+_principals = TTLCache(maxsize=10000, ttl=PRINCIPAL_TTL_SECONDS)
+
+# claim set of user tokens (core.security.user_claims); bump when it changes,
+# tokens of another version fall back to the user lookup
+CLAIMS_VERSION = 1
+
+# "typ" claim: only access tokens are bearer tokens
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+ACCESS_TOKEN_TTL_SECONDS = get_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+# user uuid -> (users.token_version, users.claims_version), per worker; a
+# revoked token stops working here at once and within the TTL elsewhere
+TOKEN_VERSION_TTL_SECONDS = 30
+_token_versions = TTLCache(maxsize=50000, ttl=TOKEN_VERSION_TTL_SECONDS)
+
+
+def parse_subject(sub) -> UUID | None:
+    """Token subject as a UUID (compared as uuid, the unique index applies)"""
+    try:
+        return UUID(str(sub))
+    except (TypeError, ValueError):
+        return None
+
+
+async def get_user_principal(db: AsyncSession, user_uuid: UUID) -> UserPrincipal | None:
+    key = ("user", user_uuid)
+    principal = _principals.get(key)
+    if principal is not None:
+        return principal
+
+    result = await db.execute(
+        select(User.id, User.uuid, User.user_type, User.approved, User.plan)
+        .where(User.uuid == user_uuid)
+    )
+    row = result.first()
+    if not row:
+        return None
+
+    principal = UserPrincipal(*row)
+    _principals.set(key, principal)
+    return principal
+
+
+def is_access_payload(payload: dict) -> bool:
+    """
+    Refuse refresh tokens as bearer tokens. Tokens from before the "typ"
+    claim can't say which they are: accept them only while their exp is
+    within one access-token lifetime (refresh tokens live 30 days), so
+    they all fail once the access TTL has passed.
+    """
+    token_type = payload.get("typ")
+    if token_type is not None:
+        return token_type == ACCESS_TOKEN
+
+    exp = payload.get("exp")
+    return exp is not None and exp - time.time() <= ACCESS_TOKEN_TTL_SECONDS
+
+
+def is_refresh_payload(payload: dict) -> bool:
+    """
+    Counterpart of is_access_payload: a token without "typ" counts as a
+    refresh token only while its exp is further out than any access token
+    could be, so old access tokens can't be exchanged for new ones.
+    """
+    token_type = payload.get("typ")
+    if token_type is not None:
+        return token_type == REFRESH_TOKEN
+
+    exp = payload.get("exp")
+    return exp is not None and exp - time.time() > ACCESS_TOKEN_TTL_SECONDS
+
+
+async def get_token_versions(db: AsyncSession, user_uuid: UUID) -> tuple[int, int] | None:
+    """(token_version, claims_version) of a user, None when the user is gone"""
+    versions = _token_versions.get(user_uuid)
+    if versions is not None:
+        return versions
+
+    result = await db.execute(
+        select(User.token_version, User.claims_version).where(User.uuid == user_uuid)
+    )
+    row = result.first()
+    if not row:
+        return None
+
+    versions = (row[0], row[1])
+    _token_versions.set(user_uuid, versions)
+    return versions
+
+
+async def resolve_user_principal(db: AsyncSession, payload: dict) -> UserPrincipal | None:
+    """
+    Principal of a decoded access token. Every token passes the cached
+    token-version check (no "tv" counts as 0, tokens minted before any
+    revocation); tokens with the current claim set and current claims
+    ("uv") are then authorized from their claims alone, others go through
+    get_user_principal.
+    """
+    user_uuid = parse_subject(payload.get("sub"))
+    if not user_uuid or not is_access_payload(payload):
+        return None
+
+    versions = await get_token_versions(db, user_uuid)
+    if versions is None:
+        return None
+    token_version, claims_version = versions
+    if token_version != payload.get("tv", 0):
+        return None
+
+    if payload.get("cv") != CLAIMS_VERSION or payload.get("uv", 0) != claims_version:
+        return await get_user_principal(db, user_uuid)
+
+    try:
+        return UserPrincipal(
+            id=int(payload["uid"]),
+            uuid=user_uuid,
+            user_type=payload["user_type"],
+            approved=payload.get("approved"),
+            plan=payload["plan"]
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+async def revoke_user_tokens(db: AsyncSession, user_id: int):
+    """
+    Invalidate every token of the user, refresh tokens included (logout
+    everywhere, a security event). Call BEFORE db.commit(),
+    invalidate_user_principal after.
+    """
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def refresh_user_claims(db: AsyncSession, user_id: int):
+    """
+    The claims in the user's access tokens went stale (approved, plan,
+    type): those tokens keep working but are authorized from the row until
+    /auth/refresh issues new ones. Call BEFORE db.commit(),
+    invalidate_user_principal after.
+    """
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(claims_version=User.claims_version + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def get_admin_principal(db: AsyncSession, admin_uuid: UUID) -> AdminPrincipal | None:
+    key = ("admin", admin_uuid)
+    principal = _principals.get(key)
+    if principal is not None:
+        return principal
+
+    result = await db.execute(
+        select(AdminUser.id, AdminUser.uuid, AdminUser.role)
+        .where(AdminUser.uuid == admin_uuid)
+    )
+    row = result.first()
+    if not row:
+        return None
+
+    principal = AdminPrincipal(*row)
+    _principals.set(key, principal)
+    return principal
+
+
+def invalidate_user_principal(user_uuid):
+    """Call after a write to the user row (status, plan, type, delete)"""
+    user_uuid = parse_subject(user_uuid)
+    if user_uuid:
+        _principals.pop(("user", user_uuid))
+        _token_versions.pop(user_uuid)
+
+
+def invalidate_admin_principal(admin_uuid):
+    admin_uuid = parse_subject(admin_uuid)
+    if admin_uuid:
+        _principals.pop(("admin", admin_uuid))
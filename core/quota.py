@@ -0,0 +1,131 @@
+# core/quota.py
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert
+
+from core.cache import TTLCache
+from models import PlanEntitlement, UsageCounter
+
+
+# -----------------------------------
+# 🎟️ COUNTED RESOURCES
+# -----------------------------------
+JOB_POSTINGS = "job_postings"
+MODEL_IMAGES = "model_images"
+MODEL_VIDEOS = "model_videos"          # uploaded files + video links
+
+FREE_PLAN = "free"
+
+# used when the free plan itself has no plan_entitlements row for a resource
+FREE_PLAN_LIMITS = {
+    JOB_POSTINGS: 3,
+    MODEL_IMAGES: 5,
+    MODEL_VIDEOS: 2,
+}
+
+# plan -> {resource: max_count}; plan limits change rarely (admin / migration)
+ENTITLEMENT_TTL_SECONDS = 300
+_entitlements = TTLCache(maxsize=64, ttl=ENTITLEMENT_TTL_SECONDS)
+
+
+async def get_plan_limits(db: AsyncSession, plan: str | None) -> dict:
+    """
+    Limits of a plan. A resource the plan has no row for gets the free
+    plan's limit (a missing row never means unlimited).
+    """
+    plan = plan or FREE_PLAN
+
+    limits = _entitlements.get(plan)
+    if limits is not None:
+        return limits
+
+    result = await db.execute(
+        select(PlanEntitlement.plan, PlanEntitlement.resource, PlanEntitlement.max_count)
+        .where(PlanEntitlement.plan.in_([plan, FREE_PLAN]))
+    )
+    rows = result.all()
+
+    limits = dict(FREE_PLAN_LIMITS)
+    limits.update({resource: max_count for row_plan, resource, max_count in rows if row_plan == FREE_PLAN})
+    limits.update({resource: max_count for row_plan, resource, max_count in rows if row_plan == plan})
+    _entitlements.set(plan, limits)
+    return limits
+
+
+# -----------------------------------
+# ➕➖ COUNTERS
+# -----------------------------------
+async def consume_quota(
+    db: AsyncSession,
+    user_id: int,
+    plan: str | None,
+    resource: str,
+    amount: int = 1
+) -> bool:
+    """
+    Take `amount` units of the user's quota; False when the plan limit
+    would be exceeded or the resource has no limit at all.
+
+    A single INSERT .. ON CONFLICT DO UPDATE .. WHERE used + amount <= limit
+    on the (user_id, resource) primary key: the row stays locked until the
+    caller commits, so concurrent requests of the same user queue up instead
+    of all passing a stale count. Call it BEFORE db.commit(), in the same
+    transaction as the insert it counts.
+    """
+    limits = await get_plan_limits(db, plan)
+    max_count = limits.get(resource)
+
+    if max_count is None:
+        print(f"No quota limit for {resource}, refusing")
+        return False
+
+    if amount > max_count:
+        return False
+
+    stmt = insert(UsageCounter).values(
+        user_id=user_id,
+        resource=resource,
+        used=amount
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[UsageCounter.user_id, UsageCounter.resource],
+        set_={
+            "used": UsageCounter.used + amount,
+            "updated_at": func.now(),
+        },
+        where=UsageCounter.used + amount <= max_count
+    ).returning(UsageCounter.used)
+
+    result = await db.execute(stmt)
+    return result.scalar_one_or_none() is not None
+
+
+async def require_quota(
+    db: AsyncSession,
+    user_id: int,
+    plan: str | None,
+    resource: str,
+    detail: str,
+    status_code: int = 403
+):
+    if not await consume_quota(db, user_id, plan, resource):
+        raise HTTPException(status_code=status_code, detail=detail)
+
+
+async def release_quota(db: AsyncSession, user_id: int, resource: str, amount: int = 1):
+    """Give back `amount` units; call BEFORE db.commit() of the delete"""
+    if amount <= 0:
+        return
+
+    await db.execute(
+        update(UsageCounter)
+        .where(
+            UsageCounter.user_id == user_id,
+            UsageCounter.resource == resource
+        )
+        .values(
+            used=func.greatest(UsageCounter.used - amount, 0),
+            updated_at=func.now()
+        )
+    )
@@ -0,0 +1,217 @@
+# core/rate_limit.py
+import hashlib
+import math
+import time
+
+from fastapi import HTTPException, Request
+
+from core.cache import TTLCache
+from core.config import get_settings
+
+settings = get_settings()
+
+
+# -----------------------------------
+# 🪣 TOKEN BUCKETS
+# -----------------------------------
+class MemoryBuckets:
+    """
+    Per-worker buckets: key -> (tokens, updated_at) in a TTL+LRU cache, an
+    entry lives until its bucket would be full again (then it's the same
+    as a fresh one).
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int = 100_000):
+        self._buckets = TTLCache(maxsize=maxsize, ttl=60)
+
+    async def take(self, key: str, capacity: float, rate: float, cost: float = 1) -> tuple[bool, float]:
+        """(allowed, seconds until `cost` tokens are available)"""
+        now = time.monotonic()
+        tokens, updated_at = self._buckets.get(key, (capacity, now))
+        tokens = min(capacity, tokens + (now - updated_at) * rate)
+
+        allowed = tokens >= cost
+        if allowed:
+            tokens -= cost
+
+        self._buckets.set(key, (tokens, now), ttl=(capacity - tokens) / rate + 1)
+        return allowed, 0.0 if allowed else (cost - tokens) / rate
+
+
+# refill, take and expire in one round trip; the server clock keeps all
+# workers on the same time
+_TAKE_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - ts) * rate)
+
+local allowed = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil((capacity - tokens) / rate * 1000) + 1000)
+return {allowed, tostring(tokens)}
+"""
+
+
+class RedisBuckets:
+    """
+    Buckets shared by every worker, in Redis (or anything speaking its
+    protocol, e.g. a local redis-server for testing). Optional: needs the
+    `redis` package and RATE_LIMIT_REDIS_URL, or pass a client.
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str | None = None, client=None, prefix: str = "rl:"):
+        if client is None:
+            import redis.asyncio as redis
+            client = redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    async def take(self, key: str, capacity: float, rate: float, cost: float = 1) -> tuple[bool, float]:
+        allowed, tokens = await self.client.eval(
+            _TAKE_SCRIPT, 1, self.prefix + key, capacity, rate, cost
+        )
+        tokens = float(tokens)
+        return bool(allowed), 0.0 if allowed else (cost - tokens) / rate
+
+
+def _default_backend():
+    url = settings.RATE_LIMIT_REDIS_URL
+    if not url:
+        return MemoryBuckets()
+    try:
+        return RedisBuckets(url)
+    except ImportError:
+        print("RATE_LIMIT_REDIS_URL is set but the redis package is missing, using per-worker buckets")
+        return MemoryBuckets()
+
+
+_backend = _default_backend()
+# when the shared backend fails we still throttle, per worker
+_fallback = MemoryBuckets()
+
+
+def set_rate_limit_backend(backend):
+    """Swap the bucket store (e.g. a RedisBuckets on a local stand-in)"""
+    global _backend
+    _backend = backend
+
+
+# -----------------------------------
+# 🚪 LOGIN ADMISSION
+# -----------------------------------
+# (burst, refill per minute) of each identity
+LOGIN_LIMITS = {
+    "ip": (settings.LOGIN_IP_BURST, settings.LOGIN_IP_PER_MINUTE),
+    "email": (settings.LOGIN_EMAIL_BURST, settings.LOGIN_EMAIL_PER_MINUTE),
+}
+
+_login_stats = {}            # scope -> counters
+
+
+def _stats(scope: str) -> dict:
+    return _login_stats.setdefault(scope, {
+        "allowed": 0,
+        "rejected_ip": 0,
+        "rejected_email": 0,
+        "backend_errors": 0,
+    })
+
+
+def client_ip(request: Request) -> str:
+    if settings.TRUST_PROXY_HEADERS:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def _take_bucket(key: str, capacity: float, per_minute: float, stats: dict | None = None) -> tuple[bool, float]:
+    rate = per_minute / 60
+    try:
+        return await _backend.take(key, capacity, rate)
+    except Exception as exc:
+        if stats is not None:
+            stats["backend_errors"] += 1
+        print(f"Rate limit backend {_backend.name} failed: {exc}")
+        return await _fallback.take(key, capacity, rate)
+
+
+async def _take(scope: str, kind: str, identity: str) -> tuple[bool, float]:
+    capacity, per_minute = LOGIN_LIMITS[kind]
+    # hashed: no addresses or emails in the shared store
+    key = f"login:{scope}:{kind}:" + hashlib.sha256(identity.encode()).hexdigest()[:32]
+    return await _take_bucket(key, capacity, per_minute, _stats(scope))
+
+
+async def enforce_login_limits(request: Request, scope: str, email: str | None):
+    """
+    Token-bucket admission for a login attempt, by client IP and then by
+    email. Call it first thing in the handler: a rejected attempt costs
+    no decrypt, query or bcrypt. Raises 429 with Retry-After.
+    """
+    stats = _stats(scope)
+
+    allowed, retry_after = await _take(scope, "ip", client_ip(request))
+    if not allowed:
+        stats["rejected_ip"] += 1
+    elif email:
+        allowed, retry_after = await _take(scope, "email", email.strip().lower())
+        if not allowed:
+            stats["rejected_email"] += 1
+
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many login attempts, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
+
+    stats["allowed"] += 1
+
+
+def login_throttling_stats() -> dict:
+    """This worker's admission counters per login scope"""
+    return {
+        "backend": _backend.name,
+        "limits": {
+            kind: {"burst": burst, "per_minute": per_minute}
+            for kind, (burst, per_minute) in LOGIN_LIMITS.items()
+        },
+        "scopes": {scope: dict(counters) for scope, counters in _login_stats.items()},
+    }
+
+
+# -----------------------------------
+# 📤 EXPORT ADMISSION
+# -----------------------------------
+# (burst, refill per minute) per user: each export streams a whole table
+EXPORT_LIMITS = (settings.EXPORT_BURST, settings.EXPORT_PER_MINUTE)
+
+
+async def enforce_export_limits(user_id: int):
+    """Token bucket per user for the full-table exports. Raises 429 with Retry-After."""
+    capacity, per_minute = EXPORT_LIMITS
+    allowed, retry_after = await _take_bucket(f"export:user:{user_id}", capacity, per_minute)
+
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Too many exports, please try again later",
+            headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+        )
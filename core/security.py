@@ -1,4 +1,8 @@
 # core/security.py
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from passlib.context import CryptContext
 from jose import jwt, JWTError
 from datetime import datetime, timedelta
@@ -6,17 +10,22 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from core.config import get_settings
 
 settings = get_settings()
 
 from database import get_db
-from models import User
+from core.principal import (
+    CLAIMS_VERSION, ACCESS_TOKEN, REFRESH_TOKEN, resolve_user_principal
+)
 
 # ---- PASSWORD HASHING ---- #
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
 
 
 def hash_password(password: str) -> str:
@@ -27,6 +36,96 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# ---- PASSWORD HASHING OFF THE EVENT LOOP ---- #
+# One bcrypt call holds a thread for ~250 ms. Async handlers run it on a
+# small dedicated pool; callers beyond PASSWORD_HASH_WORKERS wait on the
+# semaphore (counted as queue depth) and past PASSWORD_HASH_MAX_WAITING
+# are turned away with a 503 instead of piling up.
+PASSWORD_HASH_WORKERS = settings.PASSWORD_HASH_WORKERS
+PASSWORD_HASH_MAX_WAITING = settings.PASSWORD_HASH_MAX_WAITING
+
+_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash"
+)
+_hash_slots = asyncio.Semaphore(PASSWORD_HASH_WORKERS)
+
+_hash_stats = {
+    "in_flight": 0,
+    "waiting": 0,
+    "max_waiting": 0,
+    "completed": 0,
+    "rejected": 0,
+    "rehashed": 0,
+    "wait_seconds": 0.0,
+    "hash_seconds": 0.0,
+}
+
+
+async def _run_password_hashing(fn, *args):
+    if _hash_stats["waiting"] >= PASSWORD_HASH_MAX_WAITING:
+        _hash_stats["rejected"] += 1
+        raise HTTPException(
+            status_code=503,
+            detail="Too many login attempts, please retry shortly",
+            headers={"Retry-After": "1"}
+        )
+
+    queued_at = time.perf_counter()
+    _hash_stats["waiting"] += 1
+    _hash_stats["max_waiting"] = max(_hash_stats["max_waiting"], _hash_stats["waiting"])
+    try:
+        await _hash_slots.acquire()
+    finally:
+        _hash_stats["waiting"] -= 1
+
+    started_at = time.perf_counter()
+    _hash_stats["wait_seconds"] += started_at - queued_at
+    _hash_stats["in_flight"] += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+    finally:
+        _hash_stats["in_flight"] -= 1
+        _hash_stats["completed"] += 1
+        _hash_stats["hash_seconds"] += time.perf_counter() - started_at
+        _hash_slots.release()
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run_password_hashing(pwd_context.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    (valid, new_hash): new_hash is set when the stored hash was made with
+    another cost (BCRYPT_ROUNDS changed); the caller saves it
+    """
+    valid, new_hash = await _run_password_hashing(
+        pwd_context.verify_and_update, plain_password, hashed_password
+    )
+    if valid and new_hash:
+        _hash_stats["rehashed"] += 1
+    return valid, new_hash
+
+
+def password_hashing_stats() -> dict:
+    """This worker's hashing pool: config, queue depth and timings"""
+    completed = _hash_stats["completed"]
+    return {
+        **_hash_stats,
+        "wait_seconds": round(_hash_stats["wait_seconds"], 3),
+        "hash_seconds": round(_hash_stats["hash_seconds"], 3),
+        "workers": PASSWORD_HASH_WORKERS,
+        "max_waiting_allowed": PASSWORD_HASH_MAX_WAITING,
+        "bcrypt_rounds": settings.BCRYPT_ROUNDS,
+        "avg_wait_ms": round(_hash_stats["wait_seconds"] / completed * 1000, 1) if completed else 0.0,
+        "avg_hash_ms": round(_hash_stats["hash_seconds"] / completed * 1000, 1) if completed else 0.0,
+    }
+
+
 # ---- JWT SETTINGS ---- #
 SECRET_KEY = settings.SECRET_KEY
 ALGORITHM = "HS256"
@@ -34,17 +133,40 @@ ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 
 
 # ---- CREATE TOKENS ---- #
-def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
+def create_access_token(
+    subject: str,
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[dict] = None,
+    token_type: str = ACCESS_TOKEN
+) -> str:
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     expire = datetime.utcnow() + expires_delta
-    to_encode = {"exp": expire, "sub": subject}
+    to_encode = {**(claims or {}), "typ": token_type, "exp": expire, "sub": subject}
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 
-def create_refresh_token(subject: str) -> str:
+def create_refresh_token(subject: str, claims: Optional[dict] = None) -> str:
     expires_delta = timedelta(days=30)
-    return create_access_token(subject, expires_delta)
+    return create_access_token(subject, expires_delta, claims, token_type=REFRESH_TOKEN)
+
+
+def user_claims(user) -> dict:
+    """
+    Claims that let route guards authorize a user from the token alone
+    (core.principal.resolve_user_principal); "tv" ties the token to
+    users.token_version so bumping it revokes the token, "uv" to
+    users.claims_version so bumping it sends the token to the row.
+    """
+    return {
+        "cv": CLAIMS_VERSION,
+        "uid": user.id,
+        "user_type": user.user_type,
+        "approved": bool(user.approved),
+        "plan": user.plan,
+        "tv": user.token_version or 0,
+        "uv": user.claims_version or 0,
+    }
 
 
 # ---- DECODE TOKEN ---- #
@@ -55,13 +177,6 @@ def decode_token(token: str):
         return None
 
 
-def verify_refresh_token(refresh_token: str):
-    payload = decode_token(refresh_token)
-    if payload is None:
-        return None, "Invalid or expired refresh token"
-    return payload.get("sub"), None
-
-
 # ---- GET CURRENT USER ---- #
 oauth2_scheme = HTTPBearer()
 
@@ -80,21 +195,9 @@ async def get_current_user(
     if payload is None:
         raise credentials_exception
 
-    user_id = payload.get("sub")
-    if not user_id:
-        raise credentials_exception
-
-    # Try numeric ID first (INT), fallback UUID
-    try:
-        result = await db.execute(select(User).where(User.id == int(user_id)))
-        user = result.scalars().first()
-    except:
-        user = None
-
-    if not user:
-        result = await db.execute(select(User).where(User.uuid == user_id))
-        user = result.scalars().first()
-
+    # access tokens only, subject is the user uuid (tokens never carried ids);
+    # refresh tokens and revoked token versions are refused here
+    user = await resolve_user_principal(db, payload)
     if not user:
         raise credentials_exception
 
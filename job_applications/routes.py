@@ -1,17 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Header, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.deps import get_db, get_current_user
+from core.pagination import DEFAULT_PAGE_SIZE, clamp_limit
 from job_applications.schema import (
     JobApplicationCreate,
     JobApplicationUpdate,
+    JobApplicationBulkStatus,
     JobApplicationOut
 )
 from job_applications.service import (
+    ALREADY_APPLIED,
     create_job_application,
+    get_idempotent_apply,
+    remember_idempotent_apply,
     update_job_application,
+    bulk_update_application_status,
     get_application_by_uuid,
     list_applications_service,
+    list_my_applications,
     hard_delete_application
 )
 
@@ -23,18 +33,53 @@ router = APIRouter(prefix="/applications", tags=["Applications"])
 async def apply_job(
     data: JobApplicationCreate,
     db: AsyncSession = Depends(get_db),
-    user=Depends(get_current_user)
+    user=Depends(get_current_user),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key")
 ):
     if user.user_type != 1:
         raise HTTPException(status_code=403, detail="Only models can apply")
 
+    if idempotency_key:
+        cached, err = get_idempotent_apply(user.id, idempotency_key, data.job_uuid)
+        if err:
+            raise HTTPException(status_code=422, detail=err)
+        # only a key recorded here is replayed; otherwise a duplicate is a 409
+        if cached:
+            return cached
+
     application, err = await create_job_application(
         db, data, user.id
     )
+
+    if err == ALREADY_APPLIED:
+        raise HTTPException(status_code=409, detail=err)
     if err:
         raise HTTPException(status_code=400, detail=err)
 
-    return application
+    response = JobApplicationOut.model_validate(application)
+    if idempotency_key:
+        remember_idempotent_apply(user.id, idempotency_key, data.job_uuid, response)
+
+    return response
+
+
+# BULK STATUS UPDATE (agency)
+@router.post("/bulk-status")
+async def bulk_update_status(
+    data: JobApplicationBulkStatus,
+    db: AsyncSession = Depends(get_db),
+    user=Depends(get_current_user)
+):
+    if user.user_type != 2:
+        raise HTTPException(status_code=403, detail="Only agencies allowed")
+
+    result, err = await bulk_update_application_status(
+        db, user.id, data.application_uuids, data.status, data.from_statuses
+    )
+    if err:
+        raise HTTPException(status_code=400, detail=err)
+
+    return result
 
 
 # UPDATE APPLICATION
@@ -51,6 +96,24 @@ async def update_application(
     return application
 
 
+# MY APPLICATIONS (model) - declared before /{uuid}
+@router.get("/me")
+async def my_applications(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    status: str | None = None,
+    db: AsyncSession = Depends(get_db),
+    user=Depends(get_current_user)
+):
+    if user.user_type != 1:
+        raise HTTPException(status_code=403, detail="Only models allowed")
+
+    limit = clamp_limit(limit)
+    items, next_cursor = await list_my_applications(db, user.id, limit, cursor, status)
+
+    return {"items": items, "next_cursor": next_cursor, "limit": limit}
+
+
 # GET APPLICATION DETAILS
 @router.get("/{uuid}", response_model=JobApplicationOut)
 async def get_application_details(
@@ -65,12 +128,41 @@ async def get_application_details(
 
 
 # LIST APPLICATIONS
-@router.get("/", response_model=list[JobApplicationOut])
+@router.get("/")
 async def list_applications(
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
     job_id: int | None = None,
+    job_uuid: UUID | None = None,
+    model_id: int | None = None,
+    status: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None,
     db: AsyncSession = Depends(get_db)
 ):
-    return await list_applications_service(db, job_id)
+    """
+    Applications newest first, one (created_at, id) keyset page at a time.
+    Pass `next_cursor` from the previous page as `cursor`.
+    """
+    limit = clamp_limit(limit)
+
+    applications, next_cursor = await list_applications_service(
+        db,
+        limit,
+        cursor,
+        job_id=job_id,
+        job_uuid=job_uuid,
+        model_id=model_id,
+        status=status,
+        created_from=created_from,
+        created_to=created_to
+    )
+
+    return {
+        "items": [JobApplicationOut.model_validate(a) for a in applications],
+        "next_cursor": next_cursor,
+        "limit": limit
+    }
 
 
 # DELETE APPLICATION
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
 from typing import Optional, List
 from datetime import datetime
@@ -13,6 +13,13 @@ class JobApplicationUpdate(BaseModel):
     admin_notes: Optional[str] = None
 
 
+class JobApplicationBulkStatus(BaseModel):
+    application_uuids: List[UUID] = Field(..., min_length=1, max_length=500)
+    status: str
+    # optional guard: only move applications currently in one of these
+    from_statuses: Optional[List[str]] = None
+
+
 class JobApplicationOut(BaseModel):
     uuid: UUID
     job_id: int
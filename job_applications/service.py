@@ -1,8 +1,25 @@
+import uuid
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, cast, String, update, delete
+from sqlalchemy import select, cast, String, update, delete, func, any_, bindparam, literal, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY, UUID, insert
 from datetime import datetime
 
-from models import JobApplication, JobPosting
+from core.cache import TTLCache
+from core.http_cache import bump_version, JOBS
+from core.pagination import DEFAULT_PAGE_SIZE, decode_cursor, build_page
+from models import JobApplication, JobPosting, AgencyProfile
+from job_applications.service_counters import (
+    APPLICATION_STATUSES, counter_deltas, adjust_application_counts
+)
+
+
+ALREADY_APPLIED = "Already applied to this job"
+
+# (model_id, Idempotency-Key) -> (job_uuid, response); per worker, retries
+# of one request usually land on the same worker within seconds, and the
+# unique (job_id, model_id) constraint covers the rest
+IDEMPOTENCY_TTL_SECONDS = 600
+_idempotent_applies = TTLCache(maxsize=10000, ttl=IDEMPOTENCY_TTL_SECONDS)
 
 
 # CREATE APPLICATION
@@ -11,28 +28,85 @@ async def create_job_application(
     data,
     model_id: int
 ):
-    result = await db.execute(
-        select(JobPosting).where(
+    """
+    Resolve the job uuid and insert in ONE statement:
+    INSERT .. SELECT FROM job_posting .. ON CONFLICT (job_id, model_id)
+    DO NOTHING RETURNING. No row back means the job doesn't exist or the
+    model already applied; only then is a second query made to tell
+    which. The job's counters move in the same transaction.
+    """
+    job = (
+        select(
+            literal(uuid.uuid4()).label("uuid"),
+            JobPosting.id,
+            literal(model_id).label("model_id"),
+            literal("applied").label("status"),
+            literal(False).label("is_delete")
+        )
+        .where(
             JobPosting.uuid == data.job_uuid,
             JobPosting.is_delete == False
         )
     )
-    job = result.scalar_one_or_none()
 
-    if not job:
-        return None, "Job not found"
+    stmt = (
+        insert(JobApplication)
+        .from_select(["uuid", "job_id", "model_id", "status", "is_delete"], job)
+        .on_conflict_do_nothing(index_elements=["job_id", "model_id"])
+        .returning(JobApplication)
+    )
+
+    result = await db.execute(stmt)
+    application = result.scalar_one_or_none()
 
-    application = JobApplication(
-        job_id=job.id,
-        model_id=model_id,
-        status="applied"
+    if application:
+        await adjust_application_counts(
+            db, application.job_id, counter_deltas(None, application.status)
+        )
+        # public job cards carry the applicant count
+        await bump_version(db, JOBS)
+        await db.commit()
+        return application, None
+
+    await db.rollback()
+
+    existing = await get_application_for_job(db, data.job_uuid, model_id)
+    if existing:
+        return None, ALREADY_APPLIED
+
+    return None, "Job not found"
+
+
+async def get_application_for_job(db: AsyncSession, job_uuid, model_id: int):
+    result = await db.execute(
+        select(JobApplication)
+        .join(JobPosting, JobPosting.id == JobApplication.job_id)
+        .where(
+            JobPosting.uuid == job_uuid,
+            JobApplication.model_id == model_id
+        )
     )
+    return result.scalar_one_or_none()
 
-    db.add(application)
-    await db.commit()
-    await db.refresh(application)
 
-    return application, None
+def get_idempotent_apply(model_id: int, key: str, job_uuid):
+    """
+    Cached response of an earlier apply with the same Idempotency-Key.
+    Returns (response, err); err when the key was used for another job.
+    """
+    cached = _idempotent_applies.get((model_id, key))
+    if cached is None:
+        return None, None
+
+    cached_job_uuid, response = cached
+    if cached_job_uuid != job_uuid:
+        return None, "Idempotency-Key was already used for a different job"
+
+    return response, None
+
+
+def remember_idempotent_apply(model_id: int, key: str, job_uuid, response):
+    _idempotent_applies.set((model_id, key), (job_uuid, response))
 
 
 # UPDATE APPLICATION
@@ -46,15 +120,25 @@ async def update_job_application(
             cast(JobApplication.uuid, String) == uuid,
             JobApplication.is_delete == False
         )
+        # the old status decides the counter move: no concurrent change in between
+        .with_for_update()
     )
     application = result.scalar_one_or_none()
 
     if not application:
         return None, "Application not found"
 
+    old_status = application.status
+
     for field, value in data.dict(exclude_unset=True).items():
         setattr(application, field, value)
 
+    if application.status != old_status:
+        await adjust_application_counts(
+            db, application.job_id, counter_deltas(old_status, application.status)
+        )
+        await bump_version(db, JOBS)
+
     application.updated_at = datetime.utcnow()
     await db.commit()
     await db.refresh(application)
@@ -62,6 +146,119 @@ async def update_job_application(
     return application, None
 
 
+# BULK STATUS UPDATE
+async def bulk_update_application_status(
+    db: AsyncSession,
+    agency_id: int,
+    application_uuids: list,
+    status: str,
+    from_statuses: list[str] | None = None
+):
+    """
+    Move many applications of the agency's jobs to `status` in ONE
+    statement: a locked CTE of the targets, a guarded UPDATE .. RETURNING
+    on it, and a join of the two for per-id outcomes:
+    updated / unchanged (already in status) / status_conflict (not in
+    from_statuses) / not_found (unknown, deleted or another agency's).
+    The jobs' counters follow in one UPDATE per touched job.
+    """
+    status = status.strip().lower()
+    if status not in APPLICATION_STATUSES:
+        return None, f"status must be one of: {', '.join(APPLICATION_STATUSES)}"
+
+    guard = [s.strip().lower() for s in from_statuses or [] if s and s.strip()]
+    application_uuids = list(dict.fromkeys(application_uuids))
+
+    target = (
+        select(
+            JobApplication.id,
+            JobApplication.uuid,
+            JobApplication.job_id,
+            JobApplication.status.label("previous_status")
+        )
+        .where(
+            JobApplication.uuid == any_(
+                bindparam("application_uuids", application_uuids, type_=ARRAY(UUID(as_uuid=True)))
+            ),
+            JobApplication.is_delete == False,
+            JobApplication.job_id.in_(
+                select(JobPosting.id).where(JobPosting.agency_id == agency_id)
+            )
+        )
+        .with_for_update()
+        .cte("target")
+    )
+
+    conditions = [
+        JobApplication.id == target.c.id,
+        target.c.previous_status.is_distinct_from(status),
+    ]
+    if guard:
+        conditions.append(target.c.previous_status.in_(guard))
+
+    updated = (
+        update(JobApplication)
+        .where(*conditions)
+        .values(status=status, updated_at=func.now())
+        .returning(JobApplication.id)
+        .cte("updated")
+    )
+
+    result = await db.execute(
+        select(
+            target.c.uuid,
+            target.c.job_id,
+            target.c.previous_status,
+            updated.c.id.isnot(None).label("updated")
+        )
+        .outerjoin(updated, updated.c.id == target.c.id)
+    )
+    found = {row.uuid: row for row in result.all()}
+
+    moved = {}                       # (job_id, previous_status) -> count
+    for row in found.values():
+        if row.updated:
+            key = (row.job_id, row.previous_status)
+            moved[key] = moved.get(key, 0) + 1
+
+    deltas = {}                      # job_id -> {column: delta}
+    for (job_id, previous_status), count in moved.items():
+        job_deltas = deltas.setdefault(job_id, {})
+        for column, delta in counter_deltas(previous_status, status, count).items():
+            job_deltas[column] = job_deltas.get(column, 0) + delta
+
+    for job_id in sorted(deltas):
+        await adjust_application_counts(db, job_id, deltas[job_id])
+    if deltas:
+        await bump_version(db, JOBS)
+
+    await db.commit()
+
+    results = []
+    for application_uuid in application_uuids:
+        row = found.get(application_uuid)
+        if not row:
+            outcome = "not_found"
+        elif row.updated:
+            outcome = "updated"
+        elif row.previous_status == status:
+            outcome = "unchanged"
+        else:
+            outcome = "status_conflict"
+
+        results.append({
+            "application_uuid": str(application_uuid),
+            "outcome": outcome,
+            "previous_status": row.previous_status if row else None
+        })
+
+    return {
+        "status": status,
+        "updated": sum(r["outcome"] == "updated" for r in results),
+        "results": results
+    }, None
+
+
 # GET BY UUID
 async def get_application_by_uuid(
     db: AsyncSession,
@@ -77,21 +274,130 @@ async def get_application_by_uuid(
 
 
 # LIST APPLICATIONS
+def application_list_filters(
+    job_uuid=None,
+    job_id: int | None = None,
+    model_id: int | None = None,
+    status: str | None = None,
+    created_from: datetime | None = None,
+    created_to: datetime | None = None
+) -> list:
+    criteria = [JobApplication.is_delete == False]
+
+    if job_uuid:
+        # resolved to job_id so (job_id, created_at, id) serves the scan
+        criteria.append(
+            JobApplication.job_id == select(JobPosting.id)
+            .where(JobPosting.uuid == job_uuid)
+            .scalar_subquery()
+        )
+    if job_id:
+        criteria.append(JobApplication.job_id == job_id)
+    if model_id:
+        criteria.append(JobApplication.model_id == model_id)
+    if status:
+        criteria.append(JobApplication.status == status.strip().lower())
+    if created_from:
+        criteria.append(JobApplication.created_at >= created_from)
+    if created_to:
+        criteria.append(JobApplication.created_at < created_to)
+
+    return criteria
+
+
+def _after_cursor(cursor: str | None) -> list:
+    """Keyset condition for a (created_at, id) cursor, newest first"""
+    if not cursor:
+        return []
+
+    created_at, application_id = decode_cursor(cursor, datetime, int)
+    return [
+        tuple_(JobApplication.created_at, JobApplication.id) < tuple_(created_at, application_id)
+    ]
+
+
+def _cursor_of(row):
+    return row.created_at.isoformat(), row.id
+
+
 async def list_applications_service(
     db: AsyncSession,
-    job_id: int | None = None
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    **filters
 ):
-    stmt = select(JobApplication).where(
-        JobApplication.is_delete == False
+    """One (created_at, id) keyset page, newest first. Returns (applications, next_cursor)"""
+    stmt = (
+        select(JobApplication)
+        .where(*application_list_filters(**filters), *_after_cursor(cursor))
+        .order_by(JobApplication.created_at.desc(), JobApplication.id.desc())
+        .limit(limit + 1)
     )
 
-    if job_id:
-        stmt = stmt.where(JobApplication.job_id == job_id)
+    result = await db.execute(stmt)
+    return build_page(result.scalars().all(), limit, _cursor_of)
 
-    stmt = stmt.order_by(JobApplication.created_at.desc())
+
+async def list_my_applications(
+    db: AsyncSession,
+    model_id: int,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    status: str | None = None
+):
+    """A model's own applications with a summary of each job, in the same query"""
+    stmt = (
+        select(
+            JobApplication.id,
+            JobApplication.uuid,
+            JobApplication.status,
+            JobApplication.created_at,
+            JobApplication.updated_at,
+            JobPosting.uuid.label("job_uuid"),
+            JobPosting.job_role,
+            JobPosting.project_type,
+            JobPosting.location,
+            JobPosting.pay_min,
+            JobPosting.pay_max,
+            JobPosting.pay_unit,
+            JobPosting.status.label("job_status"),
+            JobPosting.is_delete.label("job_deleted"),
+            AgencyProfile.company_name
+        )
+        .join(JobPosting, JobPosting.id == JobApplication.job_id)
+        .outerjoin(AgencyProfile, AgencyProfile.user_id == JobPosting.agency_id)
+        .where(
+            *application_list_filters(model_id=model_id, status=status),
+            *_after_cursor(cursor)
+        )
+        .order_by(JobApplication.created_at.desc(), JobApplication.id.desc())
+        .limit(limit + 1)
+    )
 
     result = await db.execute(stmt)
-    return result.scalars().all()
+    rows, next_cursor = build_page(result.all(), limit, _cursor_of)
+
+    items = [
+        {
+            "application_uuid": str(row.uuid),
+            "status": row.status,
+            "applied_at": row.created_at,
+            "updated_at": row.updated_at,
+            "job": {
+                "uuid": str(row.job_uuid),
+                "job_role": row.job_role,
+                "project_type": row.project_type,
+                "location": row.location,
+                "pay_min": row.pay_min,
+                "pay_max": row.pay_max,
+                "pay_unit": row.pay_unit,
+                "status": "deleted" if row.job_deleted else row.job_status,
+                "company_name": row.company_name
+            }
+        }
+        for row in rows
+    ]
+    return items, next_cursor
 
 
 # HARD DELETE
@@ -101,13 +407,21 @@ async def hard_delete_application(
 ):
     stmt = delete(JobApplication).where(
         cast(JobApplication.uuid, String) == uuid
-    )
+    ).returning(JobApplication.job_id, JobApplication.status, JobApplication.is_delete)
 
     result = await db.execute(stmt)
+    deleted = result.first()
 
-    if result.rowcount == 0:
+    if not deleted:
         return None, "Application not found"
 
+    # soft-deleted rows were already out of the counters
+    if not deleted.is_delete:
+        await adjust_application_counts(
+            db, deleted.job_id, counter_deltas(deleted.status, None)
+        )
+        await bump_version(db, JOBS)
+
     await db.commit()
     return True, None
 
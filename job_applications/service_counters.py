@@ -0,0 +1,157 @@
+# job_applications/service_counters.py
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, and_, tuple_
+
+from core.http_cache import bump_version, JOBS
+from models import JobApplication, JobPosting
+
+APPLICATION_STATUSES = ("applied", "shortlisted", "rejected", "hired")
+
+# status -> job_posting counter column
+STATUS_COUNTERS = {status: f"{status}_count" for status in APPLICATION_STATUSES}
+TOTAL_COUNTER = "applications_count"
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+# -----------------------------------
+# 🔢 COUNTERS ON JOB_POSTING
+# -----------------------------------
+def application_counts(job) -> dict:
+    """{"applied": n, "shortlisted": n, "rejected": n, "hired": n, "total": n} of a job row"""
+    return {
+        **{status: getattr(job, column) or 0 for status, column in STATUS_COUNTERS.items()},
+        "total": getattr(job, TOTAL_COUNTER) or 0,
+    }
+
+
+def counter_deltas(old_status: str | None, new_status: str | None, count: int = 1) -> dict:
+    """
+    Column deltas for `count` applications moving from old_status to
+    new_status; None means "not there" (created / deleted).
+    Statuses outside APPLICATION_STATUSES only count towards the total.
+    """
+    deltas = {}
+    if old_status is None:
+        deltas[TOTAL_COUNTER] = count
+    if new_status is None:
+        deltas[TOTAL_COUNTER] = deltas.get(TOTAL_COUNTER, 0) - count
+
+    if old_status in STATUS_COUNTERS:
+        deltas[STATUS_COUNTERS[old_status]] = -count
+    if new_status in STATUS_COUNTERS:
+        column = STATUS_COUNTERS[new_status]
+        deltas[column] = deltas.get(column, 0) + count
+
+    return {column: delta for column, delta in deltas.items() if delta}
+
+
+async def adjust_application_counts(db: AsyncSession, job_id: int, deltas: dict):
+    """
+    Apply counter_deltas to one job. Call it BEFORE db.commit(), in the
+    transaction of the application write it mirrors.
+    """
+    if not deltas:
+        return
+
+    await db.execute(
+        update(JobPosting)
+        .where(JobPosting.id == job_id)
+        .values({
+            column: getattr(JobPosting, column) + delta
+            for column, delta in deltas.items()
+        })
+        .execution_options(synchronize_session=False)
+    )
+
+
+# -----------------------------------
+# 🧰 RECONCILIATION
+# -----------------------------------
+def counted_applications(*criteria):
+    """Live application counts per job from job_applications (the source of truth)"""
+    return (
+        select(
+            JobPosting.id.label("job_id"),
+            func.count(JobApplication.id).label(TOTAL_COUNTER),
+            *(
+                func.count(JobApplication.id).filter(JobApplication.status == status).label(column)
+                for status, column in STATUS_COUNTERS.items()
+            )
+        )
+        .outerjoin(
+            JobApplication,
+            and_(
+                JobApplication.job_id == JobPosting.id,
+                JobApplication.is_delete == False
+            )
+        )
+        .where(*criteria)
+        .group_by(JobPosting.id)
+    )
+
+
+async def reconcile_application_counts(
+    db: AsyncSession,
+    batch_size: int = RECONCILE_BATCH_SIZE
+) -> int:
+    """
+    Recount every job in id batches and rewrite only the counters that
+    drifted. Returns the number of repaired jobs.
+    """
+    columns = [TOTAL_COUNTER, *STATUS_COUNTERS.values()]
+    repaired = 0
+    last_id = 0
+
+    while True:
+        ids = (await db.execute(
+            select(JobPosting.id)
+            .where(JobPosting.id > last_id)
+            .order_by(JobPosting.id)
+            .limit(batch_size)
+            # writers move counters under this row lock: with the batch locked,
+            # the recount sees every committed application and no half-done one
+            .with_for_update()
+        )).scalars().all()
+        if not ids:
+            break
+
+        actual = counted_applications(JobPosting.id.between(ids[0], ids[-1])).subquery()
+
+        result = await db.execute(
+            update(JobPosting)
+            .where(
+                JobPosting.id == actual.c.job_id,
+                tuple_(*(getattr(JobPosting, c) for c in columns)).is_distinct_from(
+                    tuple_(*(actual.c[c] for c in columns))
+                )
+            )
+            .values({c: actual.c[c] for c in columns})
+            .returning(JobPosting.id)
+            .execution_options(synchronize_session=False)
+        )
+        fixed = len(result.all())
+        if fixed:
+            # public job cards carry the applicant count
+            await bump_version(db, JOBS)
+        repaired += fixed
+        await db.commit()
+
+        last_id = ids[-1]
+
+    return repaired
+
+
+async def _main():
+    from database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        repaired = await reconcile_application_counts(db)
+
+    print(f"Repaired application counters of {repaired} job postings")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -1,3 +1,6 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
@@ -12,10 +15,30 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent
 
 
+# =====================
+# LIFESPAN (BACKGROUND TASKS)
+# =====================
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    from agency.service_job_expiry import run_job_expiry_sweeper
+    from model.model_recommendation_service import run_recommendation_worker
+
+    # every worker runs the loops; pg advisory locks pick the one that works
+    tasks = [
+        asyncio.create_task(run_job_expiry_sweeper()),
+        asyncio.create_task(run_recommendation_worker()),
+    ]
+    yield
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
 # =====================
 # CREATE APP
 # =====================
 app = FastAPI(
+    lifespan=lifespan,
     title="LockTrust API",
     version="1.0.0",
     openapi_url="/openapi.json",
@@ -79,12 +102,14 @@ from admin.routes_work import router as work_router
 from admin.routes_skill import router as skill_router
 from admin.routes_contact_banner import router as contact_router
 from public.routes_public import router as public_router
+from public.routes_export import router as public_export_router
 from model.model_routes_master import router as model_router
 from agency.agency_profile_routes import router as agency_router
 from job_applications.routes import router as job_application_router
 from agency.agency_progress_routes import router as agency_progress_router
 
 app.include_router(public_router)
+app.include_router(public_export_router)
 app.include_router(auth_router)
 app.include_router(model_router)
 app.include_router(agency_router)
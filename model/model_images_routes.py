@@ -55,7 +55,7 @@ async def upload_image(
     with open(path, "wb") as f:
         f.write(await file.read())
 
-    await add_image(db, current_user.id, path)
+    await add_image(db, current_user.id, path, current_user.plan)
     return {"message": "Image added"}
 
 
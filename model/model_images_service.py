@@ -4,9 +4,9 @@ from sqlalchemy import select, delete
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from models import Image_Videos, ModelImages, Image_Videos
-
-
-MAX_FREE_IMAGES = 5  # future: dynamic
+from public.service_model_card import refresh_model_card
+from public.service_share import invalidate_shared_profile
+from core.quota import require_quota, release_quota, MODEL_IMAGES
 
 
 async def get_or_create_media(db: AsyncSession, user_id: int) -> Image_Videos:
@@ -24,36 +24,32 @@ async def get_or_create_media(db: AsyncSession, user_id: int) -> Image_Videos:
     return media
 
 
-async def get_next_image_index(
-    db: AsyncSession,
-    media_uuid,
-    limit: int
-) -> int:
+async def get_next_image_index(db: AsyncSession, media_uuid) -> int:
+    """First free slot; only called after consume_quota, whose row lock
+    keeps two uploads of the same user from picking the same slot"""
     res = await db.execute(
         select(ModelImages.image_index)
         .where(ModelImages.media_uuid == media_uuid)
     )
     used = {r[0] for r in res.fetchall()}
 
-    if len(used) >= limit:
-        raise HTTPException(
-            status_code=403,
-            detail="Subscribe to add more images"
-        )
-
-    for i in range(limit):
-        if i not in used:
-            return i
-
-    raise HTTPException(400, "Image limit reached")
+    index = 0
+    while index in used:
+        index += 1
+    return index
 
 async def add_image(
     db: AsyncSession,
     user_id: int,
-    image_path: str
+    image_path: str,
+    plan: str
 ):
     media = await get_or_create_media(db, user_id)
-    index = await get_next_image_index(db, media.uuid, MAX_FREE_IMAGES)
+
+    await require_quota(
+        db, user_id, plan, MODEL_IMAGES, "Subscribe to add more images"
+    )
+    index = await get_next_image_index(db, media.uuid)
 
     img = ModelImages(
         media_uuid=media.uuid,
@@ -61,7 +57,9 @@ async def add_image(
         image_path=image_path
     )
     db.add(img)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 async def get_images(db: AsyncSession, user_id: int):
@@ -100,7 +98,9 @@ async def replace_image_by_index(
         os.remove(img.image_path)
 
     img.image_path = new_path
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 async def delete_image_by_index(
@@ -125,7 +125,10 @@ async def delete_image_by_index(
         os.remove(img.image_path)
 
     await db.delete(img)
+    await release_quota(db, user_id, MODEL_IMAGES)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 async def delete_all_images(db: AsyncSession, user_id: int):
@@ -139,8 +142,11 @@ async def delete_all_images(db: AsyncSession, user_id: int):
         if os.path.exists(path):
             os.remove(path)
 
-    await db.execute(
+    result = await db.execute(
         delete(ModelImages)
         .where(ModelImages.media_uuid == media.uuid)
     )
+    await release_quota(db, user_id, MODEL_IMAGES, result.rowcount)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
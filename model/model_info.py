@@ -1,15 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from core.deps import get_current_user
 from database import get_db
-from models import (
-    User,
-    ModelProfile,
-    ModelProfessional,
-    UserSocialLink,
-)
+from models import User
+from public.service_profile import load_model_profile, build_social_links
 
 router = APIRouter(prefix="/info", tags=["Model Info"])
 
@@ -18,31 +13,14 @@ async def get_my_model_info(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
-    model_id = current_user.id
-
-    # 1️⃣ User
-    result_user = await db.execute(select(User).where(User.id == model_id))
-    user = result_user.scalar_one_or_none()
-    if not user:
+    # user + profile + professional + social links in one query
+    bundle = await load_model_profile(db, User.id == current_user.id)
+    if not bundle:
         raise HTTPException(status_code=404, detail="Model Not Found")
 
-    # 2️⃣ Physical Profile
-    result_profile = await db.execute(
-        select(ModelProfile).where(ModelProfile.user_id == model_id)
-    )
-    profile = result_profile.scalar_one_or_none()
-
-    # 3️⃣ Professional Info
-    result_professional = await db.execute(
-        select(ModelProfessional).where(ModelProfessional.user_id == model_id)
-    )
-    professional = result_professional.scalar_one_or_none()
-
-    # 4️⃣ Social Links (UPDATED)
-    result_links = await db.execute(
-        select(UserSocialLink).where(UserSocialLink.user_id == model_id)
-    )
-    social_link = result_links.scalars().first()
+    user = bundle["user"]
+    profile = bundle["profile"]
+    professional = bundle["professional"]
 
     return {
         "basic_info": {
@@ -93,16 +71,7 @@ async def get_my_model_info(
             "willing_to_travel": professional.willing_to_travel,
         } if professional else None,
 
-        "social_links": {
-            "x": social_link.x if social_link else None,
-            "instagram": social_link.instagram if social_link else None,
-            "tiktok": social_link.tiktok if social_link else None,
-            "snapchat": social_link.snapchat if social_link else None,
-            "pinterest": social_link.pinterest if social_link else None,
-            "linkedin": social_link.linkedin if social_link else None,
-            "youtube": social_link.youtube if social_link else None,
-            "facebook": social_link.facebook if social_link else None,
-        }
+        "social_links": build_social_links(bundle["social_link"])
     }
 
 
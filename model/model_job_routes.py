@@ -1,10 +1,14 @@
+from datetime import datetime
 from typing import Union
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.deps import get_db, get_current_user
-from model.model_job_service import smart_search_jobs
+from core.pagination import DEFAULT_PAGE_SIZE, clamp_limit
+from model.model_job_service import smart_search_jobs, typeahead_suggestions, TYPEAHEAD_LIMIT
+from model.model_recommendation_service import get_recommended_jobs
+from public.service_listings import build_job_response
 
 router = APIRouter(prefix="/jobs", tags=["Model Jobs"])
 
@@ -12,6 +16,8 @@ router = APIRouter(prefix="/jobs", tags=["Model Jobs"])
 @router.get("")
 async def search_jobs_for_model(
     search: Union[str, int, float, None] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
@@ -20,7 +26,57 @@ async def search_jobs_for_model(
 
     return await smart_search_jobs(
         db=db,
-        search=search
+        search=search,
+        limit=clamp_limit(limit),
+        offset=max(offset, 0)
     )
 
 
+@router.get("/typeahead")
+async def job_search_typeahead(
+    q: str,
+    limit: int = TYPEAHEAD_LIMIT,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    """Fuzzy suggestions for the job search box (roles, locations, cities)"""
+    if current_user.user_type != 1:
+        raise HTTPException(status_code=403, detail="Only models allowed")
+
+    return await typeahead_suggestions(db, q, limit)
+
+
+@router.get("/recommended")
+async def recommended_jobs_for_model(
+    request: Request,
+    limit: int = DEFAULT_PAGE_SIZE,
+    offset: int = 0,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    """Open jobs ranked by fit with the model's profile (precomputed feed)"""
+    if current_user.user_type != 1:
+        raise HTTPException(status_code=403, detail="Only models allowed")
+
+    limit = clamp_limit(limit)
+    offset = max(offset, 0)
+
+    page, total, computed_at = await get_recommended_jobs(db, current_user.id, limit, offset)
+
+    base_url = str(request.base_url).rstrip("/")
+    now = datetime.utcnow()
+
+    return {
+        "items": [
+            {
+                **build_job_response(job, profile, base_url, now),
+                "score": round(score * 100, 1)
+            }
+            for job, profile, score in page
+        ],
+        "total": total,
+        "limit": limit,
+        "offset": offset,
+        "next_offset": offset + limit if offset + limit < total else None,
+        "computed_at": computed_at
+    }
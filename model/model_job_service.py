@@ -1,56 +1,83 @@
 from typing import Union
 
-from sqlalchemy import select, or_, and_
+from sqlalchemy import select, func, or_, case, literal, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from models import JobPosting
+from core.cache import TTLCache
+from models import JobPosting, User
+from agency.service_jobposting import SEARCH_CONFIG, open_public_job
+
+PAY_KEYWORDS = {"paid": True, "unpaid": False, "free": False}
+
+TYPEAHEAD_MIN_CHARS = 2
+TYPEAHEAD_LIMIT = 8
+TYPEAHEAD_MAX_LIMIT = 20
+
+# hot prefixes -> suggestions; a minute of staleness is fine for hints
+_typeahead_cache = TTLCache(maxsize=5000, ttl=60)
+
+
+def parse_job_search(search: str) -> tuple[str, list, list]:
+    """
+    Split a search string into (full-text part, is_paid flags, pay amounts).
+    "paid" / "unpaid" / "free" and bare numbers are structured filters,
+    everything else goes to websearch_to_tsquery.
+    """
+    words = []
+    paid_flags = []
+    amounts = []
+
+    for word in search.split():
+        key = word.lower()
+        if key in PAY_KEYWORDS:
+            paid_flags.append(PAY_KEYWORDS[key])
+        elif key.replace(".", "", 1).isdigit():
+            amounts.append(float(key))
+        else:
+            words.append(word)
+
+    return " ".join(words), paid_flags, amounts
 
 
 async def smart_search_jobs(
     db: AsyncSession,
-    search: Union[str, int, float, None] = None
+    search: Union[str, int, float, None] = None,
+    limit: int = 20,
+    offset: int = 0
 ):
+    """
+    Ranked full-text job search over the weighted job_posting.search_vector
+    (GIN), plus paid / unpaid keywords and pay-range numbers.
+    """
     stmt = (
         select(JobPosting)
-        .where(
-            JobPosting.visibility == "public",
-            JobPosting.is_delete == False
-        )
+        .where(*open_public_job())
     )
 
-    if search is not None:
-        search = str(search)
-        keywords = search.lower().split()
-
-        keyword_filters = []
-
-        for word in keywords:
-            conditions = []
-
-            # 🔹 text based fields
-            conditions.append(JobPosting.job_role.ilike(f"%{word}%"))
-            conditions.append(JobPosting.location.ilike(f"%{word}%"))
-            conditions.append(JobPosting.project_type.ilike(f"%{word}%"))
-            conditions.append(JobPosting.gender.ilike(f"%{word}%"))
-            conditions.append(JobPosting.required_skills.ilike(f"%{word}%"))
-            conditions.append(JobPosting.status.ilike(f"%{word}%"))
-
-            # 🔹 paid / unpaid keywords
-            if word in ["paid", "unpaid", "free"]:
-                conditions.append(
-                    JobPosting.is_paid == (word == "paid")
-                )
+    text_query = ""
 
-            # 🔹 numeric search (salary range)
-            if word.replace(".", "", 1).isdigit():
-                num = float(word)
-                conditions.append(JobPosting.pay_min <= num)
-                conditions.append(JobPosting.pay_max >= num)
-
-            keyword_filters.append(or_(*conditions))
+    if search is not None:
+        text_query, paid_flags, amounts = parse_job_search(str(search))
+
+        # 🔹 paid / unpaid keywords
+        for is_paid in paid_flags:
+            stmt = stmt.where(JobPosting.is_paid == is_paid)
+
+        # 🔹 numeric search (salary range)
+        for num in amounts:
+            stmt = stmt.where(JobPosting.pay_min <= num, JobPosting.pay_max >= num)
+
+    if text_query:
+        # 🔥 role > skills > location > description
+        query = func.websearch_to_tsquery(SEARCH_CONFIG, text_query)
+        stmt = (
+            stmt.where(JobPosting.search_vector.op("@@")(query))
+            .order_by(func.ts_rank_cd(JobPosting.search_vector, query).desc(), JobPosting.id.desc())
+        )
+    else:
+        stmt = stmt.order_by(JobPosting.id.desc())
 
-        # 🔥 all keywords must match somewhere
-        stmt = stmt.where(and_(*keyword_filters))
+    stmt = stmt.limit(limit).offset(offset)
 
     result = await db.execute(stmt)
     jobs = result.scalars().all()
@@ -72,10 +99,64 @@ async def smart_search_jobs(
     ]
 
 
+# -----------------------------------
+# ⌨️ TYPEAHEAD
+# -----------------------------------
+def _trigram_suggestions(kind: str, column, q: str, limit: int, *criteria):
+    """
+    Distinct values of `column` matching `q` by prefix or by trigram word
+    similarity (`column %> q`, pg_trgm GIN); prefix hits rank first.
+    """
+    prefix = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    is_prefix = func.max(case((column.ilike(prefix), 1), else_=0))
+    similarity = func.max(func.word_similarity(q, column))
+
+    return (
+        select(
+            literal(kind).label("kind"),
+            func.min(column).label("value"),
+            is_prefix.label("is_prefix"),
+            similarity.label("similarity"),
+        )
+        .where(
+            or_(column.ilike(prefix), column.op("%>")(q)),
+            *criteria
+        )
+        .group_by(func.lower(column))
+        .order_by(is_prefix.desc(), similarity.desc(), func.min(column))
+        .limit(limit)
+    )
 
 
+async def typeahead_suggestions(
+    db: AsyncSession,
+    q: str,
+    limit: int = TYPEAHEAD_LIMIT
+) -> dict:
+    """Top job roles, job locations and model cities for a (possibly misspelled) prefix"""
+    q = " ".join(q.split()).lower()
+    limit = max(1, min(limit, TYPEAHEAD_MAX_LIMIT))
+
+    suggestions = {"job_roles": [], "locations": [], "cities": []}
+    if len(q) < TYPEAHEAD_MIN_CHARS:
+        return suggestions
+
+    cached = _typeahead_cache.get((q, limit))
+    if cached is not None:
+        return cached
+
+    public_job = open_public_job()
+
+    stmt = union_all(
+        _trigram_suggestions("job_roles", JobPosting.job_role, q, limit, *public_job),
+        _trigram_suggestions("locations", JobPosting.location, q, limit, *public_job),
+        _trigram_suggestions("cities", User.current_city, q, limit, User.user_type == 1),
+    )
 
+    result = await db.execute(stmt)
+    rows = sorted(result.all(), key=lambda r: (-r.is_prefix, -r.similarity, r.value))
+    for row in rows:
+        suggestions[row.kind].append(row.value)
 
-
-
-
+    _typeahead_cache.set((q, limit), suggestions)
+    return suggestions
@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
 from models import ModelPortfolio
+from public.service_share import invalidate_shared_profile
 
 def upload_portfolio(db: Session, user_id: int, media_type: str, url: str):
     item = ModelPortfolio(
@@ -10,6 +11,7 @@ def upload_portfolio(db: Session, user_id: int, media_type: str, url: str):
 
     db.add(item)
     db.commit()
+    invalidate_shared_profile(user_id)
     db.refresh(item)
     return item
 
@@ -26,4 +28,5 @@ def delete_portfolio(db: Session, uuid: str, user_id: int):
 
     db.delete(item)
     db.commit()
+    invalidate_shared_profile(user_id)
     return True
@@ -2,6 +2,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models import ModelProfessional
 from model.model_professional_schema import ModelProfessionalSchema
+from public.service_model_card import refresh_model_card
+from public.service_share import invalidate_shared_profile
 
 
 def merge_arrays(existing, base, extra):
@@ -57,7 +59,9 @@ async def create_or_update_professional(
         if field in payload:
             setattr(prof, field, payload[field])
 
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
     await db.refresh(prof)
     return prof
 
@@ -74,8 +78,11 @@ async def delete_professional(db: AsyncSession, uuid: str):
     if not prof:
         return False
 
+    user_id = prof.user_id
     await db.delete(prof)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
     return True
 
 
@@ -2,6 +2,15 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from models import ModelProfile
 from model.model_profile_schema import ModelProfileCreate, ModelProfileUpdate
+from public.service_model_card import refresh_model_card
+from public.service_share import invalidate_shared_profile
+from utils.measurements import normalized_measurements
+
+
+def sync_measurements(profile: ModelProfile):
+    """Refresh the numeric shadow columns from the free-text measurements"""
+    for column, value in normalized_measurements(profile).items():
+        setattr(profile, column, value)
 
 
 # Create or Update profile
@@ -20,7 +29,10 @@ async def create_or_update_profile(
         for key, value in data.dict(exclude_none=True).items():
             setattr(profile, key, value)
 
+        sync_measurements(profile)
+        await refresh_model_card(db, user_id)
         await db.commit()
+        invalidate_shared_profile(user_id)
         await db.refresh(profile)
         return profile
 
@@ -29,8 +41,11 @@ async def create_or_update_profile(
         user_id=user_id,
         **data.dict(exclude_none=True)
     )
+    sync_measurements(profile)
     db.add(profile)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
     await db.refresh(profile)
     return profile
 
@@ -56,7 +71,10 @@ async def update_profile(
     for key, value in data.dict(exclude_none=True).items():
         setattr(profile, key, value)
 
+    sync_measurements(profile)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
     await db.refresh(profile)
     return profile
 
@@ -87,7 +105,9 @@ async def delete_profile(
         return "unauthorized"
 
     await db.delete(profile)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
     return True
 
 
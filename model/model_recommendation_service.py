@@ -0,0 +1,302 @@
+# model/model_recommendation_service.py
+import asyncio
+
+import numpy as np
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, update, func, any_, bindparam, Integer
+from sqlalchemy.dialects.postgresql import insert, ARRAY
+
+from database import AsyncSessionLocal
+from models import JobPosting, PublicModelCard, ModelJobRecommendation
+from agency.service_jobposting import open_public_job
+from agency.service_candidates import (
+    W_SKILLS, W_CATEGORIES, W_LOCATION, W_TRAVEL,
+    job_features, term_bitsets, refresh_candidate_matrix
+)
+from public.service_listings import public_jobs_query
+
+FEED_SIZE = 200                  # jobs kept per model
+FEED_MIN_SCORE = 0.25            # below that a job is noise, not a recommendation
+
+FEED_WORKER_INTERVAL_SECONDS = 30
+FAN_OUT_JOB_BATCH = 20
+STALE_FEED_BATCH = 200
+FEED_WRITE_BATCH = 1000
+
+# pg advisory lock key: one worker process maintains the feeds
+FEED_LOCK_KEY = 71_004_002
+
+
+# -----------------------------------
+# 🧾 FEED ROWS
+# -----------------------------------
+def merge_feed(job_ids: list, scores: list, ranked: dict, keep: set | None = None) -> tuple[list, list]:
+    """
+    Existing feed + {job_id: score} -> best FEED_SIZE, newest job first on
+    ties. With `keep`, existing entries outside it (jobs no longer open)
+    are dropped so they stop holding slots.
+    """
+    merged = {
+        job_id: score
+        for job_id, score in zip(job_ids or [], scores or [])
+        if keep is None or job_id in keep
+    }
+    merged.update(ranked)
+
+    top = sorted(merged.items(), key=lambda item: (-item[1], -item[0]))[:FEED_SIZE]
+    return [job_id for job_id, _ in top], [score for _, score in top]
+
+
+async def upsert_feeds(db: AsyncSession, rows: list[dict]):
+    if not rows:
+        return
+
+    stmt = insert(ModelJobRecommendation).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ModelJobRecommendation.user_id],
+        set_={
+            **{key: stmt.excluded[key] for key in rows[0] if key != "user_id"},
+            "computed_at": func.now(),
+        }
+    )
+    await db.execute(stmt)
+
+
+def _user_ids_param(user_ids: list):
+    return any_(bindparam("user_ids", user_ids, type_=ARRAY(Integer)))
+
+
+# -----------------------------------
+# 📣 NEW JOB -> MODEL FEEDS (fan-out)
+# -----------------------------------
+async def fan_out_jobs(db: AsyncSession) -> int:
+    """
+    Merge open public jobs that were not fanned out yet into the feeds
+    of every model they fit, scored with the agency candidate matrix.
+    Entries of those feeds whose job is no longer open are dropped on the way.
+    """
+    result = await db.execute(
+        select(JobPosting)
+        .where(*open_public_job(), JobPosting.recommended_at.is_(None))
+        .order_by(JobPosting.id)
+        .limit(FAN_OUT_JOB_BATCH)
+        .with_for_update(skip_locked=True)
+    )
+    jobs = result.scalars().all()
+    if not jobs:
+        return 0
+
+    matrix = await refresh_candidate_matrix(db)
+
+    additions = {}                                   # user_id -> {job_id: score}
+    for job in jobs:
+        rows, scores = matrix.score(**job_features(job))[:2]
+        keep = scores >= FEED_MIN_SCORE
+        for user_id, score in zip(matrix.user_ids[rows[keep]], scores[keep]):
+            additions.setdefault(int(user_id), {})[job.id] = round(float(score), 4)
+
+    user_ids = sorted(additions)
+    for start in range(0, len(user_ids), FEED_WRITE_BATCH):
+        chunk = user_ids[start:start + FEED_WRITE_BATCH]
+
+        existing = await db.execute(
+            select(
+                ModelJobRecommendation.user_id,
+                ModelJobRecommendation.job_ids,
+                ModelJobRecommendation.scores
+            )
+            .where(ModelJobRecommendation.user_id == _user_ids_param(chunk))
+        )
+        feeds = {row.user_id: (row.job_ids, row.scores) for row in existing.all()}
+
+        # which of the jobs already in these feeds are still open
+        listed = sorted({job_id for job_ids, _ in feeds.values() for job_id in job_ids})
+        still_open = set()
+        if listed:
+            still_open = set((await db.execute(
+                select(JobPosting.id).where(
+                    JobPosting.id == any_(bindparam("listed_ids", listed, type_=ARRAY(Integer))),
+                    *open_public_job()
+                )
+            )).scalars().all())
+
+        rows = []
+        for user_id in chunk:
+            job_ids, scores = merge_feed(*feeds.get(user_id, ([], [])), additions[user_id], keep=still_open)
+            rows.append({"user_id": user_id, "job_ids": job_ids, "scores": scores})
+        await upsert_feeds(db, rows)
+
+    await db.execute(
+        update(JobPosting)
+        .where(JobPosting.id.in_([job.id for job in jobs]))
+        .values(recommended_at=func.now())
+        .execution_options(synchronize_session=False)
+    )
+    return len(jobs)
+
+
+# -----------------------------------
+# 🔁 PROFILE CHANGE -> ONE FEED
+# -----------------------------------
+class OpenJobs:
+    """All open public jobs as arrays, to score them against one model at once"""
+
+    def __init__(self, jobs):
+        features = [job_features(job) for job in jobs]
+        self.ids = np.array([job.id for job in jobs], dtype=np.int64)
+        self.gender = np.array([(f["gender"] or "").strip().lower() for f in features], dtype=object)
+
+        self.vocab = {"skills": {}, "categories": {}, "cities": {}}
+        self.bits = {}
+        self.counts = {}
+        for kind in self.vocab:
+            lists = [f[kind] for f in features]
+            self.bits[kind] = term_bitsets(self.vocab[kind], lists)
+            self.counts[kind] = np.array([len(terms) for terms in lists], dtype=np.int64)
+
+    def _hits(self, kind: str, terms: list) -> np.ndarray:
+        mask = term_bitsets(self.vocab[kind], [terms], grow=False)[0]
+        return np.bitwise_count(self.bits[kind] & mask).sum(axis=1, dtype=np.int64)
+
+    def rank(self, card) -> dict:
+        """{job_id: score} of the jobs worth recommending to a card"""
+        if not len(self.ids):
+            return {}
+
+        gender = (card.gender or "").strip().lower()
+        eligible = (self.gender == "") | (self.gender == "any") | (self.gender == gender)
+
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for kind, terms, weight in (
+            ("skills", card.skills or [], W_SKILLS),
+            ("categories", card.interested_categories or [], W_CATEGORIES),
+        ):
+            counts = self.counts[kind]
+            scores += weight * self._hits(kind, terms) / np.maximum(counts, 1)
+
+        city = (card.current_city or "").strip().lower()
+        local = (self.counts["cities"] == 0) | (self._hits("cities", [city] if city else []) > 0)
+        scores += np.where(local, W_LOCATION, W_TRAVEL if card.willing_to_travel else 0)
+
+        keep = np.flatnonzero(eligible & (scores >= FEED_MIN_SCORE))
+        return {int(self.ids[i]): round(float(scores[i]), 4) for i in keep}
+
+
+async def recompute_stale_feeds(db: AsyncSession) -> int:
+    """Rebuild the feeds flagged stale by profile writes, against every open public job"""
+    result = await db.execute(
+        select(ModelJobRecommendation.user_id)
+        .where(ModelJobRecommendation.stale == True)
+        .order_by(ModelJobRecommendation.user_id)
+        .limit(STALE_FEED_BATCH)
+        .with_for_update(skip_locked=True)
+    )
+    user_ids = result.scalars().all()
+    if not user_ids:
+        return 0
+
+    result = await db.execute(
+        select(PublicModelCard).where(
+            PublicModelCard.user_id == _user_ids_param(user_ids),
+            PublicModelCard.is_public_complete == True
+        )
+    )
+    cards = {card.user_id: card for card in result.scalars().all()}
+
+    result = await db.execute(
+        select(
+            JobPosting.id, JobPosting.gender, JobPosting.location,
+            JobPosting.required_skills, JobPosting.work_type
+        )
+        .where(*open_public_job())
+    )
+    open_jobs = OpenJobs(result.all())
+
+    rows = []
+    for user_id in user_ids:
+        card = cards.get(user_id)
+        job_ids, scores = merge_feed([], [], open_jobs.rank(card) if card else {})
+        rows.append({"user_id": user_id, "job_ids": job_ids, "scores": scores, "stale": False})
+
+    await upsert_feeds(db, rows)
+    return len(rows)
+
+
+# -----------------------------------
+# ⚙️ BACKGROUND WORKER
+# -----------------------------------
+async def refresh_recommendations() -> int | None:
+    """
+    Fan out new jobs, then rebuild stale feeds, one short transaction
+    per batch. None when another worker holds the feed lock.
+    """
+    total = 0
+
+    for step in (fan_out_jobs, recompute_stale_feeds):
+        while True:
+            async with AsyncSessionLocal() as db:
+                locked = await db.scalar(select(func.pg_try_advisory_xact_lock(FEED_LOCK_KEY)))
+                if not locked:
+                    await db.rollback()
+                    return total or None
+
+                done = await step(db)
+                await db.commit()
+
+            total += done
+            if not done:
+                break
+
+    return total
+
+
+async def run_recommendation_worker(interval: float = FEED_WORKER_INTERVAL_SECONDS):
+    """Lifespan task: keep the feeds current until cancelled"""
+    while True:
+        try:
+            await refresh_recommendations()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            print(f"Job recommendation refresh failed: {exc}")
+
+        await asyncio.sleep(interval)
+
+
+# -----------------------------------
+# 📖 READ
+# -----------------------------------
+async def get_recommended_jobs(db: AsyncSession, user_id: int, limit: int, offset: int):
+    """
+    One page of the model's feed: a primary-key read of the array slice,
+    then the jobs of that slice. Jobs closed since the feed was built
+    are skipped.
+    """
+    feed = ModelJobRecommendation
+    result = await db.execute(
+        select(
+            feed.job_ids[offset + 1:offset + limit].label("job_ids"),
+            feed.scores[offset + 1:offset + limit].label("scores"),
+            func.coalesce(func.cardinality(feed.job_ids), 0).label("total"),
+            feed.computed_at
+        )
+        .where(feed.user_id == user_id)
+    )
+    row = result.first()
+
+    if not row or not row.job_ids:
+        return [], (row.total if row else 0), (row.computed_at if row else None)
+
+    result = await db.execute(
+        public_jobs_query().where(JobPosting.id == any_(
+            bindparam("job_ids", list(row.job_ids), type_=ARRAY(Integer))
+        ))
+    )
+    found = {job.id: (job, profile) for job, profile in result.all()}
+
+    page = [
+        (*found[job_id], score)
+        for job_id, score in zip(row.job_ids, row.scores)
+        if job_id in found
+    ]
+    return page, row.total, row.computed_at
@@ -8,6 +8,7 @@ from database import get_db
 from models import User
 from core.aes_encryption import aes_encrypt
 from urllib.parse import quote
+from public.service_share import invalidate_shared_profile
 
 router = APIRouter(prefix="/share", tags=["Profile Sharing"])
 
@@ -40,3 +41,33 @@ async def share_profile_url(
         "share_url": share_url,
         "token": encrypted_token
     }
+
+
+@router.post("/profile/rotate")
+async def rotate_share_profile_url(
+    request: Request,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Issue a new share link; the previous one stops working"""
+    user = await db.get(User, current_user.id)
+
+    if not user:
+        raise HTTPException(status_code=404, detail="User not found")
+
+    user.share_token = str(uuid.uuid4())
+    db.add(user)
+    await db.commit()
+
+    # other workers notice the old token once their cached profile expires
+    invalidate_shared_profile(user.id)
+
+    encrypted_token = aes_encrypt(user.share_token)
+
+    base_url = str(request.base_url).rstrip("/")
+    share_url = f"{base_url}/public/profile/{encrypted_token}"
+
+    return {
+        "share_url": share_url,
+        "token": encrypted_token
+    }
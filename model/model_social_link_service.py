@@ -2,6 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from fastapi import HTTPException
 from models import UserSocialLink
+from public.service_share import invalidate_shared_profile
 from uuid import UUID
 
 # -------- ADD / UPDATE LINKS --------
@@ -24,6 +25,7 @@ async def add_social_links(db: AsyncSession, user_id: int, data):
         db.add(link)
 
     await db.commit()
+    invalidate_shared_profile(user_id)
     await db.refresh(link)
     return link
 
@@ -59,6 +61,7 @@ async def patch_social_links(
         setattr(link, field, value)
 
     await db.commit()
+    invalidate_shared_profile(user_id)
     await db.refresh(link)
     return link
 
@@ -75,4 +78,5 @@ async def delete_social_link(db: AsyncSession, user_id: int, link_uuid: UUID):
 
     await db.delete(link)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
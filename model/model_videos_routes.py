@@ -86,7 +86,7 @@ async def upload_video(
 
     await save_upload_file(file, path)
 
-    await add_video(db, current_user.id, path)
+    await add_video(db, current_user.id, path, current_user.plan)
     return {"message": "Video uploaded successfully"}
 
 
@@ -98,7 +98,7 @@ async def add_link(
     db: AsyncSession = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    await add_video_link(db, current_user.id, str(video_url))
+    await add_video_link(db, current_user.id, str(video_url), current_user.plan)
     return {"message": "Video link added successfully"}
 
 
@@ -185,12 +185,12 @@ async def upload_video_and_or_link(
         path = f"{UPLOAD_DIR}/{filename}"
 
         await save_upload_file(file, path)
-        await add_video(db, current_user.id, path)
+        await add_video(db, current_user.id, path, current_user.plan)
 
     if has_video_url:
         cleaned_url = str(raw_video_url).strip()
         if cleaned_url and cleaned_url != "https://example.com/":
-            await add_video_link(db, current_user.id, cleaned_url)
+            await add_video_link(db, current_user.id, cleaned_url, current_user.plan)
 
     return {"message": "Video and/or video link added successfully"}
 
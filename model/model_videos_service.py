@@ -1,12 +1,13 @@
 import os
 import json
-from sqlalchemy import select
+from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 
 from models import Image_Videos, ModelVideos
-
-MAX_FREE_MEDIA = 2
+from core.quota import require_quota, release_quota, MODEL_VIDEOS
+from public.service_model_card import refresh_model_card
+from public.service_share import invalidate_shared_profile
 
 
 # ---------- SAFE JSON ----------
@@ -46,45 +47,47 @@ async def get_or_create_media(db: AsyncSession, user_id: int) -> Image_Videos:
 
 # ---------- ADD VIDEO FILE ----------
 
-async def add_video(db: AsyncSession, user_id: int, path: str):
+async def add_video(db: AsyncSession, user_id: int, path: str, plan: str):
     media = await get_or_create_media(db, user_id)
 
-    res = await db.execute(
-        select(ModelVideos).where(ModelVideos.media_uuid == media.uuid)
+    await require_quota(
+        db, user_id, plan, MODEL_VIDEOS, "Subscribe to add more videos or links"
     )
-    videos = res.scalars().all()
-
-    links = safe_json_list(media.video_url)
 
-    if len(videos) + len(links) >= MAX_FREE_MEDIA:
-        raise HTTPException(403, "Subscribe to add more videos or links")
+    res = await db.execute(
+        select(func.max(ModelVideos.video_index))
+        .where(ModelVideos.media_uuid == media.uuid)
+    )
+    last_index = res.scalar()
 
     db.add(ModelVideos(
         media_uuid=media.uuid,
-        video_index=len(videos),
+        video_index=0 if last_index is None else last_index + 1,
         video_path=path
     ))
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 # ---------- ADD VIDEO LINK ----------
 
-async def add_video_link(db: AsyncSession, user_id: int, url: str):
+async def add_video_link(db: AsyncSession, user_id: int, url: str, plan: str):
     media = await get_or_create_media(db, user_id)
 
-    links = safe_json_list(media.video_url)
-
-    res = await db.execute(
-        select(ModelVideos).where(ModelVideos.media_uuid == media.uuid)
+    await require_quota(
+        db, user_id, plan, MODEL_VIDEOS, "Subscribe to add more videos or links"
     )
-    videos_count = len(res.scalars().all())
 
-    if videos_count + len(links) >= MAX_FREE_MEDIA:
-        raise HTTPException(403, "Subscribe to add more videos or links")
+    # re-read under the quota row lock so a concurrent add isn't overwritten
+    await db.refresh(media, ["video_url"])
+    links = safe_json_list(media.video_url)
 
     links.append(url)
     media.video_url = json.dumps(links)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 # --------Patch video link -----
@@ -103,7 +106,9 @@ async def update_video_link_by_index(
 
     links[index] = new_url
     media.video_url = json.dumps(links)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 # ---------- GET ----------
 
@@ -143,7 +148,9 @@ async def replace_video_by_index(
         os.remove(video.video_path)
 
     video.video_path = new_path
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 # ---------- DELETE VIDEO ----------
@@ -170,7 +177,10 @@ async def delete_video_by_index(
         os.remove(video.video_path)
 
     await db.delete(video)
+    await release_quota(db, user_id, MODEL_VIDEOS)
+    await refresh_model_card(db, user_id)
     await db.commit()
+    invalidate_shared_profile(user_id)
 
 
 
@@ -4,7 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from auth.schemas import UpdateUserInfo
 from model.service import update_profile
-from core.deps import get_current_user, get_db
+from core.deps import get_current_user, get_current_user_row, get_db
 from models import User
 
 router = APIRouter(prefix="/user", tags=["Model User"])
@@ -43,7 +43,7 @@ async def update_user_profile(
 @router.get("/update-profile")
 async def get_user_profile(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: User = Depends(get_current_user_row)
 ):
     return {
         "message": "Profile fetched successfully",
@@ -2,6 +2,8 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import HTTPException
 from models import User
+from public.service_model_card import refresh_model_card
+from public.service_share import invalidate_shared_profile
 
 async def update_profile(db: AsyncSession, user: User, data):
 
@@ -21,7 +23,9 @@ async def update_profile(db: AsyncSession, user: User, data):
     for key, value in update_data.items():
         setattr(db_user, key, value)
 
+    await refresh_model_card(db, db_user.id)
     await db.commit()
+    invalidate_shared_profile(db_user.id)
     await db.refresh(db_user)
 
     return db_user
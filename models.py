@@ -2,12 +2,12 @@ import uuid
 
 # from snowflake.snowpark.functions import column
 from sqlalchemy import Column, Integer, Enum, JSON, Numeric, Float, String, Date, ForeignKey, Table, UniqueConstraint, \
-    Text, Boolean, DateTime, func
-from sqlalchemy.orm import relationship
+    Text, Boolean, DateTime, func, Index, text
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.dialects.postgresql import UUID
 from database import Base
 import enum
-from sqlalchemy.dialects.postgresql import JSONB, ARRAY
+from sqlalchemy.dialects.postgresql import JSONB, ARRAY, TSVECTOR
 
 
 # -------------------------
@@ -29,6 +29,17 @@ class User(Base):
     __table_args__ = (
         UniqueConstraint('email', name='uq_users_email'),
         UniqueConstraint('phone', name='uq_users_phone'),
+        # keyset order of the public model catalog
+        Index(
+            'ix_users_models_first_name_id', 'first_name', 'id',
+            postgresql_where=text('user_type = 1')
+        ),
+        # typeahead (pg_trgm)
+        Index(
+            'ix_users_current_city_trgm', 'current_city',
+            postgresql_using='gin',
+            postgresql_ops={'current_city': 'gin_trgm_ops'}
+        ),
     )
 
     id = Column(Integer, primary_key=True, index=True)
@@ -52,6 +63,15 @@ class User(Base):
     home_town = Column(String, nullable=True)
 
     approved = Column(Boolean, default=False)
+
+    # subscription plan -> plan_entitlements.plan
+    plan = Column(String(30), nullable=False, default="free", server_default="free")
+
+    # bumped to revoke every token issued so far (tokens carry it as "tv")
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # bumped when the access-token claims go stale (access tokens carry it as "uv")
+    claims_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     job_postings = relationship("JobPosting", back_populates="agency")
 
 
@@ -79,6 +99,17 @@ class ModelProfile(Base):
     body_shape = Column(String(255), nullable=True)
     facial_hair = Column(String(255), nullable=True)
     bust_cup_size = Column(String(100), nullable=True)
+
+    # numeric shadows of the free-text measurements (utils.measurements),
+    # set on every write in model.model_profile_service
+    height_cm = Column(Float, nullable=True, index=True)
+    weight_kg = Column(Float, nullable=True, index=True)
+    chest_bust_cm = Column(Float, nullable=True, index=True)
+    waist_cm = Column(Float, nullable=True, index=True)
+    hips_cm = Column(Float, nullable=True, index=True)
+    shoulder_cm = Column(Float, nullable=True, index=True)
+    shoe_size_eu = Column(Float, nullable=True, index=True)
+
     created_by = Column(Integer, nullable=True)
     updated_by = Column(Integer, nullable=True)
     created_at = Column(DateTime, default=func.now())
@@ -283,9 +314,49 @@ class ContactBanner(Base):
     is_delete = Column(Boolean, default=False)
 
 
+# predicate of the open-public-job partial index; queries repeat it
+# verbatim (agency.service_jobposting.open_public_job) so it can be used
+OPEN_PUBLIC_JOB = "NOT is_delete AND visibility = 'public' AND status = 'open'"
+
+
 class JobPosting(Base):
     __tablename__ = "job_posting"
 
+    __table_args__ = (
+        Index('ix_job_posting_search_vector', 'search_vector', postgresql_using='gin'),
+        # typeahead (pg_trgm)
+        Index(
+            'ix_job_posting_job_role_trgm', 'job_role',
+            postgresql_using='gin',
+            postgresql_ops={'job_role': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_job_posting_location_trgm', 'location',
+            postgresql_using='gin',
+            postgresql_ops={'location': 'gin_trgm_ops'}
+        ),
+        # /public/jobs: newest-first keyset over open public jobs + work_type overlap
+        Index(
+            'ix_job_posting_open_public_id', 'id',
+            postgresql_where=text(OPEN_PUBLIC_JOB)
+        ),
+        # expiry sweeper: only open jobs are scanned
+        Index(
+            'ix_job_posting_open_expires_at', 'expires_at',
+            postgresql_where=text("NOT is_delete AND status = 'open'")
+        ),
+        Index(
+            'ix_job_posting_open_deadline', 'deadline',
+            postgresql_where=text("NOT is_delete AND status = 'open'")
+        ),
+        # recommendation worker: open public jobs not fanned out yet
+        Index(
+            'ix_job_posting_pending_recommendation', 'id',
+            postgresql_where=text(OPEN_PUBLIC_JOB + " AND recommended_at IS NULL")
+        ),
+        Index('ix_job_posting_work_type', 'work_type', postgresql_using='gin'),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(UUID(as_uuid=True), default=uuid.uuid4, unique=True, nullable=False)
 
@@ -328,10 +399,53 @@ class JobPosting(Base):
 
     is_delete = Column(Boolean, default=False)
 
+    # live applications per status, kept in step by
+    # job_applications.service_counters (reconcile_application_counts repairs drift)
+    applications_count = Column(Integer, nullable=False, default=0, server_default="0")
+    applied_count = Column(Integer, nullable=False, default=0, server_default="0")
+    shortlisted_count = Column(Integer, nullable=False, default=0, server_default="0")
+    rejected_count = Column(Integer, nullable=False, default=0, server_default="0")
+    hired_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    # weighted full-text document, set in agency.service_jobposting;
+    # deferred so job.__dict__ responses never carry it
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
+    # set once the job was merged into model recommendation feeds;
+    # reset to NULL on edit so the job is fanned out again
+    recommended_at = deferred(Column(DateTime(timezone=True), nullable=True))
+
 
 class JobApplication(Base):
     __tablename__ = "job_applications"
 
+    __table_args__ = (
+        # one application per model and job; target of the apply upsert
+        UniqueConstraint('job_id', 'model_id', name='uq_job_applications_job_model'),
+        # agency applicant lists / dashboard: per job, newest first, by status
+        Index(
+            'ix_job_applications_job_id_id', 'job_id', 'id',
+            postgresql_where=text('NOT is_delete')
+        ),
+        Index(
+            'ix_job_applications_job_status_id', 'job_id', 'status', 'id',
+            postgresql_where=text('NOT is_delete')
+        ),
+        # /applications keyset pages: (created_at, id), optionally per job / model
+        Index(
+            'ix_job_applications_created_at_id', 'created_at', 'id',
+            postgresql_where=text('NOT is_delete')
+        ),
+        Index(
+            'ix_job_applications_job_created_at_id', 'job_id', 'created_at', 'id',
+            postgresql_where=text('NOT is_delete')
+        ),
+        Index(
+            'ix_job_applications_model_created_at_id', 'model_id', 'created_at', 'id',
+            postgresql_where=text('NOT is_delete')
+        ),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     uuid = Column(UUID(as_uuid=True), default=uuid.uuid4, unique=True, nullable=False)
 
@@ -443,6 +557,144 @@ class ImageVideoMerge(Base):
     videos = Column(JSON,nullable=True,default=list)
     created_at = Column(DateTime, server_default=func.now())
 
+# -------------------------
+# public_model_card (read model)
+# -------------------------
+class PublicModelCard(Base):
+    """
+    One denormalized row per model for the public catalog.
+    Maintained by public.service_model_card.refresh_model_card on every
+    model write; rebuild with `python -m public.service_model_card`.
+    """
+    __tablename__ = "public_model_card"
+
+    __table_args__ = (
+        Index(
+            'ix_public_model_card_catalog', 'first_name', 'user_id',
+            postgresql_where=text('is_public_complete')
+        ),
+        # /public/models/search
+        Index(
+            'ix_public_model_card_gender_age', text('lower(gender)'), 'age',
+            postgresql_where=text('is_public_complete')
+        ),
+        Index(
+            'ix_public_model_card_city', text('lower(current_city)'),
+            postgresql_where=text('is_public_complete')
+        ),
+        Index(
+            'ix_public_model_card_height', 'height_cm',
+            postgresql_where=text('is_public_complete')
+        ),
+        Index('ix_public_model_card_skills', 'skills', postgresql_using='gin'),
+        Index('ix_public_model_card_languages', 'languages', postgresql_using='gin'),
+        Index('ix_public_model_card_categories', 'interested_categories', postgresql_using='gin'),
+        # incremental refresh of the agency candidate matrix
+        Index('ix_public_model_card_updated_at', 'updated_at'),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    user_uuid = Column(UUID(as_uuid=True), unique=True, nullable=False)
+
+    first_name = Column(String, nullable=False)
+    last_name = Column(String, nullable=False)
+    gender = Column(String, nullable=True)
+    current_city = Column(String, nullable=True)
+    nationality = Column(String, nullable=True)
+    age = Column(Integer, nullable=True)
+    approved = Column(Boolean, default=False)
+
+    height = Column(String(100), nullable=True)
+    weight = Column(String(100), nullable=True)
+    chest_bust = Column(String(100), nullable=True)
+    waist = Column(String(100), nullable=True)
+    hips = Column(String(100), nullable=True)
+    shoe_size = Column(String(100), nullable=True)
+    eye_color = Column(String(255), nullable=True)
+    hair_color = Column(String(255), nullable=True)
+    complexion = Column(String(255), nullable=True)
+    body_type = Column(String(255), nullable=True)
+    height_cm = Column(Float, nullable=True)
+
+    # search keys: lower-cased, de-duplicated copies of ModelProfessional arrays
+    skills = Column(ARRAY(String), nullable=True)
+    languages = Column(ARRAY(String), nullable=True)
+    interested_categories = Column(ARRAY(String), nullable=True)
+    willing_to_travel = Column(Boolean, nullable=True)
+
+    profile_photo = Column(String, nullable=True)  # first gallery image (stored path)
+    video = Column(String, nullable=True)
+
+    is_public_complete = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+
+
+# -------------------------
+# resource_versions (HTTP cache validators)
+# -------------------------
+class ResourceVersion(Base):
+    """
+    Monotonic version per public resource (sliders, skills, jobs ...).
+    Bumped by core.http_cache.bump_version on every write and used to
+    build ETag / Last-Modified for the public read endpoints.
+    """
+    __tablename__ = "resource_versions"
+
+    name = Column(String(50), primary_key=True)
+    version = Column(Integer, nullable=False, default=1)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
+class ModelJobRecommendation(Base):
+    """
+    Precomputed "recommended jobs" feed of one model: job ids ranked by
+    fit with their scores, maintained by model.model_recommendation_service.
+    `stale` is set on profile writes and cleared by the recompute.
+    """
+    __tablename__ = "model_job_recommendations"
+
+    __table_args__ = (
+        Index(
+            'ix_model_job_recommendations_stale', 'user_id',
+            postgresql_where=text('stale')
+        ),
+        # feeds holding a given job (strip_jobs_from_feeds)
+        Index('ix_model_job_recommendations_job_ids', 'job_ids', postgresql_using='gin'),
+    )
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    job_ids = Column(ARRAY(Integer), nullable=False, default=list, server_default="{}")
+    scores = Column(ARRAY(Float), nullable=False, default=list, server_default="{}")
+    stale = Column(Boolean, nullable=False, default=True, server_default="true")
+    computed_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class PlanEntitlement(Base):
+    """
+    Limit of a countable resource (job postings, images, videos) for a
+    plan. A plan without a row for a resource gets the free plan's limit
+    (core.quota.FREE_PLAN_LIMITS if that row is missing too).
+    """
+    __tablename__ = "plan_entitlements"
+
+    plan = Column(String(30), primary_key=True)
+    resource = Column(String(50), primary_key=True)
+    max_count = Column(Integer, nullable=False)
+
+
+class UsageCounter(Base):
+    """
+    How many of a resource a user currently holds. Updated by
+    core.quota in the same transaction as the insert / delete it counts.
+    """
+    __tablename__ = "usage_counters"
+
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    resource = Column(String(50), primary_key=True)
+    used = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+
+
 # -------------------------
 # model_profile_progress
 # -------------------------
@@ -0,0 +1,156 @@
+# public/routes_export.py
+import csv
+import io
+import json
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+
+from core.deps import get_current_user
+from core.principal import UserPrincipal
+from core.rate_limit import enforce_export_limits
+from database import AsyncSessionLocal
+from models import PublicModelCard, AgencyProfile, JobPosting
+from public.service_model_card import build_card_response
+from public.service_listings import (
+    public_agencies_query, build_agency_response,
+    public_jobs_query, build_job_response
+)
+
+router = APIRouter(prefix="/public/export", tags=["Public Export"])
+
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+# -----------------------------------
+# 🌊 STREAMING HELPERS
+# -----------------------------------
+def flatten_row(row: dict, nested: tuple = ()) -> dict:
+    """
+    CSV columns for a response row: `nested` sub-objects become dotted
+    columns (profile.height), any other dict / list (JSON columns) is
+    written as JSON text so the header stays fixed.
+    """
+    flat = {}
+    for key, value in row.items():
+        if key in nested and isinstance(value, dict):
+            flat.update({f"{key}.{k}": v for k, v in value.items()})
+        elif isinstance(value, (dict, list)):
+            flat[key] = json.dumps(value, default=str)
+        else:
+            flat[key] = value
+    return flat
+
+
+async def stream_export(stmt, build_row, export_format: str, nested: tuple = ()):
+    """
+    Server-side cursor -> NDJSON / CSV chunks, one chunk per
+    EXPORT_BATCH_SIZE rows. Opens its own session: the request-scoped
+    one may be closed before the body has finished streaming.
+    """
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(
+            stmt,
+            execution_options={"yield_per": EXPORT_BATCH_SIZE}
+        )
+
+        header = None
+        async for partition in result.partitions():
+            rows = [build_row(*row) for row in partition]
+            db.expunge_all()
+
+            if export_format == "ndjson":
+                yield "".join(json.dumps(r, default=str) + "\n" for r in rows)
+                continue
+
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            for r in rows:
+                flat = flatten_row(r, nested)
+                if header is None:
+                    header = list(flat)
+                    writer.writerow(header)
+                writer.writerow([flat.get(col) for col in header])
+            yield buffer.getvalue()
+
+
+def export_response(
+    stmt,
+    build_row,
+    export_format: str,
+    name: str,
+    nested: tuple = ()
+) -> StreamingResponse:
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail="format must be ndjson or csv")
+
+    return StreamingResponse(
+        stream_export(stmt, build_row, export_format, nested),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format}"'}
+    )
+
+
+async def export_admission(principal: UserPrincipal = Depends(get_current_user)):
+    """Exports read whole tables: signed-in callers only, throttled per user"""
+    await enforce_export_limits(principal.id)
+
+
+# -----------------------------------
+# 📤 EXPORTS
+# -----------------------------------
+@router.get("/models", dependencies=[Depends(export_admission)])
+async def export_public_models(request: Request, format: str = "ndjson"):
+    """All complete public model cards, by user id"""
+    base_url = str(request.base_url).rstrip("/")
+
+    stmt = (
+        select(PublicModelCard)
+        .where(PublicModelCard.is_public_complete == True)
+        .order_by(PublicModelCard.user_id.asc())
+    )
+
+    return export_response(
+        stmt,
+        lambda card: build_card_response(card, base_url),
+        format,
+        "models",
+        nested=("profile",)
+    )
+
+
+@router.get("/agencies", dependencies=[Depends(export_admission)])
+async def export_public_agencies(request: Request, format: str = "ndjson"):
+    base_url = str(request.base_url).rstrip("/")
+
+    stmt = public_agencies_query().order_by(AgencyProfile.id.asc())
+
+    return export_response(
+        stmt,
+        lambda user, profile: build_agency_response(user, profile, base_url),
+        format,
+        "agencies"
+    )
+
+
+@router.get("/jobs", dependencies=[Depends(export_admission)])
+async def export_public_jobs(request: Request, format: str = "ndjson"):
+    base_url = str(request.base_url).rstrip("/")
+    now = datetime.utcnow()
+
+    stmt = public_jobs_query().order_by(JobPosting.id.asc())
+
+    return export_response(
+        stmt,
+        lambda job, profile: build_job_response(job, profile, base_url, now),
+        format,
+        "jobs",
+        nested=("agency",)
+    )
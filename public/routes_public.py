@@ -1,17 +1,31 @@
 # public/routes_public.py
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Response, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, cast, String
+from sqlalchemy import select, cast, String, tuple_
 from sqlalchemy.orm import joinedload
 from fastapi import Request
+from uuid import UUID
 
 from admin.schema_contact import ContactCreate
 from admin.service_contact import create_contact
 from core.deps import get_db
+from core.http_cache import (
+    conditional_get, SLIDERS, SKILLS, WORK_TYPES, CONTACT_BANNER, AGENCIES, JOBS
+)
+from core.pagination import DEFAULT_PAGE_SIZE, clamp_limit, decode_cursor, build_page
 from models import (
     HomeSlider, Skill, WorkType, User, ModelMedia, ModelProfile,
     ModelProfessional, ModelPortfolio, AgencyProfile, ContactBanner,
-    JobPosting, UserSocialLink, ModelImages, Image_Videos
+    JobPosting, UserSocialLink, ModelImages, Image_Videos, PublicModelCard
+)
+from public.service_models import model_catalog_filters
+from public.service_model_card import build_card_response
+from public.service_profile import load_model_profile, build_public_profile
+from public.service_search import model_search_filters, load_saved_filter, load_search_facets
+from public.service_share import get_shared_profile
+from public.service_listings import (
+    public_agencies_query, build_agency_response,
+    public_jobs_query, job_listing_filters, build_job_response
 )
 from utils.email_utils import send_email_sendgrid, NOTIFY_USERS
 
@@ -24,8 +38,14 @@ router = APIRouter(prefix="/public", tags=["Public APIs"])
 
 @router.get("/sliders")
 async def get_public_sliders(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
+    not_modified = await conditional_get(request, response, db, SLIDERS)
+    if not_modified:
+        return not_modified
+
     stmt = (
         select(HomeSlider)
         .where(HomeSlider.is_delete == False)
@@ -74,8 +94,14 @@ async def get_public_slider_by_uuid(
 # -------------------------------
 @router.get("/skills")
 async def get_public_skills(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
+    not_modified = await conditional_get(request, response, db, SKILLS)
+    if not_modified:
+        return not_modified
+
     stmt = (
         select(Skill)
         .where(Skill.is_delete == False)
@@ -123,8 +149,14 @@ async def get_public_skill_by_uuid(
 # -------------------------------
 @router.get("/work-types")
 async def get_public_work_types(
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
+    not_modified = await conditional_get(request, response, db, WORK_TYPES)
+    if not_modified:
+        return not_modified
+
     stmt = (
         select(WorkType)
         .where(WorkType.is_delete == False)
@@ -171,158 +203,140 @@ async def get_public_single_work_type(
 # 👥 PUBLIC: LIST ALL MODELS (SHORT INFO)
 # -----------------------------------
 
-def is_model_profile_complete(
-        user,
-        profile,
-        professional,
-        profile_photo_url
-) -> bool:
-    """Check if model profile is complete enough to display publicly"""
-
-    # BASIC INFO (required)
-    if not all([
-        user.first_name,
-        user.last_name,
-        user.current_city,
-        user.gender,
-        user.nationality,
-    ]):
-        return False
-
-    if user.age is None:
-        return False
-
-    # PROFILE (required)
-    if not profile:
-        return False
-
-    numeric_fields = [
-        profile.height,
-        profile.weight,
-        profile.chest_bust,
-        profile.waist,
-        profile.hips,
-        profile.shoulder,
-        profile.shoe_size,
-    ]
-
-    if any(field is None for field in numeric_fields):
-        return False
+@router.get("/models")
+async def get_public_models(
+        request: Request,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        gender: str | None = None,
+        city: str | None = None,
+        nationality: str | None = None,
+        min_age: int | None = None,
+        max_age: int | None = None,
+        db: AsyncSession = Depends(get_db)
+):
+    """
+    Page of complete public model profiles, ordered by (first_name, id).
+    Pass `next_cursor` from the previous page as `cursor`.
+    """
+    limit = clamp_limit(limit)
 
-    text_fields = [
-        profile.complexion,
-        profile.eye_color,
-        profile.hair_color,
-        profile.body_type,
-        profile.hair_length,
-    ]
+    stmt = (
+        select(PublicModelCard)
+        .where(
+            PublicModelCard.is_public_complete == True,
+            *model_catalog_filters(PublicModelCard, gender, city, nationality, min_age, max_age)
+        )
+        .order_by(PublicModelCard.first_name.asc(), PublicModelCard.user_id.asc())
+        .limit(limit + 1)
+    )
 
-    if any(not f for f in text_fields):
-        return False
+    if cursor:
+        first_name, user_id = decode_cursor(cursor, str, int)
+        stmt = stmt.where(
+            tuple_(PublicModelCard.first_name, PublicModelCard.user_id) > tuple_(first_name, user_id)
+        )
 
-    # PROFESSIONAL (required) - Fixed attribute names
-    if not professional:
-        return False
+    cards = (await db.execute(stmt)).scalars().all()
+    cards, next_cursor = build_page(cards, limit, lambda c: (c.first_name, c.user_id))
 
-    # Check only the attributes that exist in ModelProfessional
-    if (
-            not professional.experience_details or
-            not professional.skills or
-            not professional.languages or
-            not professional.interested_categories
-    ):
-        return False
+    base_url = str(request.base_url).rstrip("/")
 
-    return True
+    return {
+        "items": [build_card_response(card, base_url) for card in cards],
+        "next_cursor": next_cursor,
+        "limit": limit
+    }
 
 
-@router.get("/models")
-async def get_public_models(
+# -----------------------------------
+# 🔎 PUBLIC: FACETED MODEL SEARCH
+# -----------------------------------
+@router.get("/models/search")
+async def search_public_models(
         request: Request,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+        filter_id: int | None = None,
+        gender: str | None = None,
+        city: str | None = None,
+        nationality: str | None = None,
+        min_age: int | None = None,
+        max_age: int | None = None,
+        min_height: float | None = None,
+        max_height: float | None = None,
+        eye_color: str | None = None,
+        hair_color: str | None = None,
+        body_type: str | None = None,
+        skin_tone: str | None = None,
+        skills: list[str] | None = Query(None),
+        languages: list[str] | None = Query(None),
+        categories: list[str] | None = Query(None),
+        willing_to_travel: bool | None = None,
+        facets: bool = True,
         db: AsyncSession = Depends(get_db)
 ):
-    """Get list of all models with basic information"""
-    q = select(User).where(User.user_type == 1).order_by(User.first_name.asc())
-    result = await db.execute(q)
-    models = result.scalars().all()
+    """
+    Search complete public model profiles.
+    `filter_id` starts from a saved model_filters row; explicit query
+    params override it. Heights are in cm. Repeat skills / languages /
+    categories to require several values. Facet counts are returned
+    with the first page only.
+    """
+    limit = clamp_limit(limit)
+
+    filters = {}
+    if filter_id is not None:
+        saved = await load_saved_filter(db, filter_id)
+        if not saved:
+            raise HTTPException(status_code=404, detail="Filter not found")
+        filters.update(saved)
+
+    explicit = {
+        "gender": gender,
+        "city": city,
+        "nationality": nationality,
+        "min_age": min_age,
+        "max_age": max_age,
+        "min_height": min_height,
+        "max_height": max_height,
+        "eye_color": eye_color,
+        "hair_color": hair_color,
+        "body_type": body_type,
+        "skin_tone": skin_tone,
+        "skills": skills,
+        "languages": languages,
+        "categories": categories,
+        "willing_to_travel": willing_to_travel,
+    }
+    filters.update({k: v for k, v in explicit.items() if v is not None})
+
+    criteria = model_search_filters(**filters)
+
+    stmt = (
+        select(PublicModelCard)
+        .where(*criteria)
+        .order_by(PublicModelCard.first_name.asc(), PublicModelCard.user_id.asc())
+        .limit(limit + 1)
+    )
+
+    if cursor:
+        first_name, user_id = decode_cursor(cursor, str, int)
+        stmt = stmt.where(
+            tuple_(PublicModelCard.first_name, PublicModelCard.user_id) > tuple_(first_name, user_id)
+        )
+
+    cards = (await db.execute(stmt)).scalars().all()
+    cards, next_cursor = build_page(cards, limit, lambda c: (c.first_name, c.user_id))
 
     base_url = str(request.base_url).rstrip("/")
-    response = []
-
-    for user in models:
-        # PROFILE
-        profile = (await db.execute(
-            select(ModelProfile).where(ModelProfile.user_id == user.id).limit(1)
-        )).scalars().first()
-
-        # PROFESSIONAL
-        professional = (await db.execute(
-            select(ModelProfessional).where(ModelProfessional.user_id == user.id).limit(1)
-        )).scalars().first()
-
-        # MEDIA GALLERY
-        media_gallery = (await db.execute(
-            select(Image_Videos).where(Image_Videos.user_id == user.id)
-        )).scalars().first()
-
-        images = []
-        video = None
-        profile_photo_url = None
-
-        if media_gallery:
-            images_res = await db.execute(
-                select(ModelImages)
-                .where(ModelImages.media_uuid == media_gallery.uuid)
-                .order_by(ModelImages.image_index)
-                .limit(5)
-            )
-            images_db = images_res.scalars().all()
-
-            images = [
-                f"{base_url}/{img.image_path}"
-                for img in images_db
-            ]
-
-            # First image as profile photo (optional)
-            profile_photo_url = images[0] if images else None
-
-            if media_gallery.video:
-                video = f"{base_url}/{media_gallery.video}"
-
-        # Check completeness
-        if not is_model_profile_complete(
-                user=user,
-                profile=profile,
-                professional=professional,
-                profile_photo_url=profile_photo_url
-        ):
-            continue
-
-        response.append({
-            "uuid": str(user.uuid),
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "full_name": f"{user.first_name} {user.last_name}",
-            "profile_photo": profile_photo_url,
-            "current_city": user.current_city,
-            "age": user.age,
-            "gender": user.gender,
-            "nationality": user.nationality,
-            "approved": user.approved,
-            "profile": {
-                "height": profile.height,
-                "weight": profile.weight,
-                "chest_bust": profile.chest_bust,
-                "waist": profile.waist,
-                "hips": profile.hips,
-                "shoe_size": profile.shoe_size,
-                "eye_color": profile.eye_color,
-                "hair_color": profile.hair_color,
-                "complexion": profile.complexion,
-            }
-        })
-
-    return response
+
+    return {
+        "items": [build_card_response(card, base_url) for card in cards],
+        "next_cursor": next_cursor,
+        "limit": limit,
+        "facets": await load_search_facets(db, criteria) if facets and not cursor else None
+    }
 
 
 # -----------------------------------
@@ -365,146 +379,22 @@ async def get_public_model_details(
     request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    # =========================
-    # USER
-    # =========================
-    result = await db.execute(
-        select(User).where(
-            cast(User.uuid, String) == uuid,
-            User.user_type == 1
-        )
-    )
-    user = result.scalars().first()
-
-    if not user:
+    try:
+        model_uuid = UUID(uuid)
+    except ValueError:
         raise HTTPException(status_code=404, detail="Model not found")
 
-    # =========================
-    # RELATED DATA
-    # =========================
-    profile = (
-        await db.execute(
-            select(ModelProfile).where(ModelProfile.user_id == user.id)
-        )
-    ).scalars().first()
-
-    professional = (
-        await db.execute(
-            select(ModelProfessional).where(ModelProfessional.user_id == user.id)
-        )
-    ).scalars().first()
+    bundle = await load_model_profile(
+        db,
+        User.uuid == model_uuid,
+        User.user_type == 1
+    )
 
-    portfolio = (
-        await db.execute(
-            select(ModelPortfolio).where(ModelPortfolio.user_id == user.id)
-        )
-    ).scalars().all()
-
-    # =========================
-    # SOCIAL LINKS (✅ FIXED)
-    # =========================
-    social_link = (
-        await db.execute(
-            select(UserSocialLink).where(UserSocialLink.user_id == user.id)
-        )
-    ).scalars().first()
-
-    social_links = {
-        "x": social_link.x if social_link else None,
-        "instagram": social_link.instagram if social_link else None,
-        "tiktok": social_link.tiktok if social_link else None,
-        "snapchat": social_link.snapchat if social_link else None,
-        "pinterest": social_link.pinterest if social_link else None,
-        "linkedin": social_link.linkedin if social_link else None,
-        "youtube": social_link.youtube if social_link else None,
-        "facebook": social_link.facebook if social_link else None,
-    }
+    if not bundle:
+        raise HTTPException(status_code=404, detail="Model not found")
 
-    # =========================
-    # MEDIA (IMAGES + VIDEO)
-    # =========================
     base_url = str(request.base_url).rstrip("/")
-
-    media_gallery = (
-        await db.execute(
-            select(Image_Videos).where(Image_Videos.user_id == user.id)
-        )
-    ).scalars().first()
-
-    images = []
-    video = None
-    profile_photo = None
-
-    if media_gallery:
-        images_db = (
-            await db.execute(
-                select(ModelImages)
-                .where(ModelImages.media_uuid == media_gallery.uuid)
-                .order_by(ModelImages.image_index)
-                .limit(5)
-            )
-        ).scalars().all()
-
-        images = [f"{base_url}/{img.image_path}" for img in images_db]
-        profile_photo = images[0] if images else None
-
-        if media_gallery.video:
-            video = f"{base_url}/{media_gallery.video}"
-
-    # =========================
-    # RESPONSE
-    # =========================
-    return {
-        "basic_info": {
-            "uuid": str(user.uuid),
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "full_name": f"{user.first_name} {user.last_name}",
-            "profile_photo": profile_photo,
-            "current_city": user.current_city,
-            "age": user.age,
-            "gender": user.gender,
-            "nationality": user.nationality,
-        },
-
-        "profile": {
-            "height": profile.height if profile else None,
-            "weight": profile.weight if profile else None,
-            "chest_bust": profile.chest_bust if profile else None,
-            "waist": profile.waist if profile else None,
-            "hips": profile.hips if profile else None,
-            "shoulder": profile.shoulder if profile else None,
-            "shoe_size": profile.shoe_size if profile else None,
-            "complexion": profile.complexion if profile else None,
-            "eye_color": profile.eye_color if profile else None,
-            "hair_color": profile.hair_color if profile else None,
-            "body_type": profile.body_type if profile else None,
-            "hair_length": profile.hair_length if profile else None,
-        },
-
-        "professional": {
-            "experience_details": professional.experience_details if professional else None,
-            "skills": professional.skills if professional else [],
-            "languages": professional.languages if professional else [],
-            "interested_categories": professional.interested_categories if professional else [],
-        },
-
-        "media_gallery": {
-            "images": images,
-            "video": video,
-        },
-
-        "social_links": social_links,
-
-        "portfolio": [
-            {
-                "uuid": str(item.uuid),
-                "media_type": item.media_type,
-                "file_url": item.file_url,
-            }
-            for item in portfolio
-        ],
-    }
+    return build_public_profile(bundle, base_url)
 
 
 # -----------------------------------
@@ -514,31 +404,20 @@ async def get_public_model_details(
 @router.get("/agencies")
 async def get_public_agencies(
     request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
 ):
-    base_url = str(request.base_url).rstrip("/")
+    not_modified = await conditional_get(request, response, db, AGENCIES)
+    if not_modified:
+        return not_modified
 
-    stmt = (
-        select(User, AgencyProfile)
-        .join(AgencyProfile, AgencyProfile.user_id == User.id)
-        .where(User.user_type == 2)
-        .order_by(AgencyProfile.company_name.asc())
-    )
+    base_url = str(request.base_url).rstrip("/")
 
+    stmt = public_agencies_query().order_by(AgencyProfile.company_name.asc())
     result = await db.execute(stmt)
 
     return [
-        {
-            "uuid": str(user.uuid),
-            "company_name": profile.company_name,
-            "contact_name": profile.contact_name,
-            "phone": profile.phone,
-            "website": profile.website,
-            "tagline": profile.tagline,
-            "services": profile.services,
-            "social_links": profile.social_links,
-            "logo": f"{base_url}/{profile.logo}" if profile.logo else None
-        }
+        build_agency_response(user, profile, base_url)
         for user, profile in result.all()
     ]
 
@@ -581,8 +460,16 @@ async def submit_contact(data: ContactCreate, background_tasks: BackgroundTasks,
 # 📞 PUBLIC CONTACT BANNER
 # -------------------------------
 @router.get("/contact-banner")
-async def get_public_contact_banner(db: AsyncSession = Depends(get_db)):
+async def get_public_contact_banner(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db)
+):
     """Get contact banner information"""
+    not_modified = await conditional_get(request, response, db, CONTACT_BANNER)
+    if not_modified:
+        return not_modified
+
     q = select(ContactBanner).where(ContactBanner.is_delete == False)
     result = await db.execute(q)
     banner = result.scalars().all()
@@ -615,118 +502,57 @@ def parse_job_media(request: Request, job):
         "logo": f"{base}/{job.logo}" if getattr(job, "logo", None) else None
     }
 
-def build_pay_string(job):
-    if not job.pay_min and not job.pay_max:
-        return None
-
-    # 💰 Amount
-    if job.pay_min and job.pay_max:
-        amount = f"${job.pay_min:,.0f} – ${job.pay_max:,.0f}"
-    elif job.pay_min:
-        amount = f"From ${job.pay_min:,.0f}"
-    else:
-        amount = f"Up to ${job.pay_max:,.0f}"
-
-    # 🧠 Unit mapping
-    unit_map = {
-        "per_day": "per day",
-        "per_month": "per month",
-        "per_year": "per year",
-        "per_episode": "per episode",
-        "per_movie": "per movie",
-        "per_project": "per project"
-    }
-
-    unit = None
-    if job.pay_unit:
-        unit = unit_map.get(job.pay_unit.strip().lower())
-
-    # ✅ FINAL STRING
-    return f"{amount} {unit}".strip() if unit else amount
-
 @router.get("/jobs")
 async def get_all_jobs(
     request: Request,
+    response: Response,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: str | None = None,
+    min_pay: float | None = None,
+    max_pay: float | None = None,
+    is_paid: bool | None = None,
+    location: str | None = None,
+    project_type: str | None = None,
+    gender: str | None = None,
+    work_type: list[str] | None = Query(None),
     db: AsyncSession = Depends(get_db)
 ):
+    """
+    Page of public jobs, newest first.
+    Pass `next_cursor` from the previous page as `cursor`; repeat
+    `work_type` to match jobs having any of the given work types.
+    """
+    # "posted" is relative to today, so validators also roll over daily
+    not_modified = await conditional_get(request, response, db, JOBS, changes_daily=True)
+    if not_modified:
+        return not_modified
+
+    limit = clamp_limit(limit)
+
     stmt = (
-        select(JobPosting, AgencyProfile)
-        .join(User, User.id == JobPosting.agency_id)
-        .join(AgencyProfile, AgencyProfile.user_id == User.id)
-        .where(
-            JobPosting.is_delete == False,
-            JobPosting.visibility == "public"
-        )
+        public_jobs_query()
+        .where(*job_listing_filters(
+            min_pay, max_pay, is_paid, location, project_type, gender, work_type
+        ))
         .order_by(JobPosting.id.desc())
+        .limit(limit + 1)
     )
 
-    result = await db.execute(stmt)
-    rows = result.all()
+    if cursor:
+        (last_id,) = decode_cursor(cursor, int)
+        stmt = stmt.where(JobPosting.id < last_id)
+
+    rows = (await db.execute(stmt)).all()
+    rows, next_cursor = build_page(rows, limit, lambda row: (row[0].id,))
 
     now = datetime.utcnow()
     base = str(request.base_url).rstrip("/")
-    response = []
-
-    for job, profile in rows:
-        logo_path = job.logo or profile.logo
-        logo = base + "/" + logo_path.replace("\\", "/") if logo_path else None
-
-        posted = None
-        if job.date_from:
-            days = (now - job.date_from).days
-            posted = "Today" if days <= 0 else f"{days} days ago"
-
-        response.append({
-            # ---------------- BASIC ----------------
-            "uuid": str(job.uuid),
-            "job_role": job.job_role,
-            "description": job.description,
-            "project_type": job.project_type,
-            # "work_type": job.work_type,
-            "gender": job.gender,
-            "location": job.location,
-
-            # ---------------- LOGO ----------------
-            "logo": logo,
-
-            # ---------------- PAY ----------------
-            "pay": build_pay_string(job),
-            "pay_min": job.pay_min,
-            "pay_max": job.pay_max,
-            "pay_type": job.pay_type,
-            "pay_unit": job.pay_unit,
-            "is_paid": job.is_paid,
-
-            # ---------------- SKILLS ----------------
-            "qualifications": job.qualifications,
-            "required_skills": job.required_skills,
-            "requirements": job.requirements,
-            "experience": job.experience,
-
-            # ---------------- DATES ----------------
-            "date_from": job.date_from,
-            "date_to": job.date_to,
-            "expires_at": job.expires_at,
-            "deadline": job.deadline,
-
-            # ---------------- STATUS ----------------
-            "status": job.status,
-            "visibility": job.visibility,
-            "posted": posted,
-
-            # ---------------- META ----------------
-            "agency_id": job.agency_id,
-            "created_by": job.created_by,
-            "updated_by": job.updated_by,
-
-            # ---------------- AGENCY ----------------
-            "agency": {
-                "uuid": str(profile.uuid),
-                "company_name": profile.company_name
-            }
-        })
-
-    return response
+
+    return {
+        "items": [build_job_response(job, profile, base, now) for job, profile in rows],
+        "next_cursor": next_cursor,
+        "limit": limit
+    }
 
 #====================
 # get public profile
@@ -737,130 +563,13 @@ async def get_public_profile_by_token(
     request: Request,
     db: AsyncSession = Depends(get_db),
 ):
-    from core.aes_encryption import aes_decrypt
-    from urllib.parse import unquote
-
-    # ---------------- TOKEN DECRYPT ----------------
-    try:
-        safe_token = unquote(token)
-        decrypted_token = aes_decrypt(safe_token)
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid token")
-
-    # ---------------- USER ----------------
-    user = await db.scalar(
-        select(User).where(User.share_token == decrypted_token)
-    )
-
-    if not user:
-        raise HTTPException(status_code=404, detail="Invalid or expired link")
-
-    # ---------------- FETCH RELATED DATA ----------------
-    profile = await db.scalar(
-        select(ModelProfile).where(ModelProfile.user_id == user.id)
-    )
-
-    professional = await db.scalar(
-        select(ModelProfessional).where(ModelProfessional.user_id == user.id)
-    )
-
-    portfolio = (
-        await db.execute(
-            select(ModelPortfolio).where(ModelPortfolio.user_id == user.id)
-        )
-    ).scalars().all()
-
-    social_link = await db.scalar(
-        select(UserSocialLink).where(UserSocialLink.user_id == user.id)
-    )
-
-    # ---------------- MEDIA ----------------
+    # token -> user and assembled profile are cached (see public.service_share)
     base_url = str(request.base_url).rstrip("/")
+    profile, err = await get_shared_profile(db, token, base_url)
 
-    media_gallery = await db.scalar(
-        select(Image_Videos).where(Image_Videos.user_id == user.id)
-    )
-
-    images = []
-    video = None
-    profile_photo = None
-
-    if media_gallery:
-        images_db = (
-            await db.execute(
-                select(ModelImages)
-                .where(ModelImages.media_uuid == media_gallery.uuid)
-                .order_by(ModelImages.image_index)
-                .limit(5)
-            )
-        ).scalars().all()
-
-        images = [f"{base_url}/{img.image_path}" for img in images_db]
-        profile_photo = images[0] if images else None
-
-        if media_gallery.video:
-            video = f"{base_url}/{media_gallery.video}"
-
-    # ---------------- RESPONSE ----------------
-    return {
-        "basic_info": {
-            "uuid": str(user.uuid),
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "full_name": f"{user.first_name} {user.last_name}",
-            "profile_photo": profile_photo,
-            "current_city": user.current_city,
-            "age": user.age,
-            "gender": user.gender,
-            "nationality": user.nationality,
-            "profile_visible": True,
-        },
-
-        "profile": {
-            "height": profile.height if profile else None,
-            "weight": profile.weight if profile else None,
-            "chest_bust": profile.chest_bust if profile else None,
-            "waist": profile.waist if profile else None,
-            "hips": profile.hips if profile else None,
-            "shoulder": profile.shoulder if profile else None,
-            "shoe_size": profile.shoe_size if profile else None,
-            "complexion": profile.complexion if profile else None,
-            "eye_color": profile.eye_color if profile else None,
-            "hair_color": profile.hair_color if profile else None,
-            "body_type": profile.body_type if profile else None,
-            "hair_length": profile.hair_length if profile else None,
-        },
-
-        "professional": {
-            "experience_details": professional.experience_details if professional else None,
-            "skills": professional.skills if professional else [],
-            "languages": professional.languages if professional else [],
-            "interested_categories": professional.interested_categories if professional else [],
-        },
-
-        "media_gallery": {
-            "images": images,
-            "video": video,
-        },
-
-        # ✅ FIXED SOCIAL LINKS (NO platform/url)
-        "social_links": {
-            "x": social_link.x if social_link else None,
-            "instagram": social_link.instagram if social_link else None,
-            "tiktok": social_link.tiktok if social_link else None,
-            "snapchat": social_link.snapchat if social_link else None,
-            "pinterest": social_link.pinterest if social_link else None,
-            "linkedin": social_link.linkedin if social_link else None,
-            "youtube": social_link.youtube if social_link else None,
-        },
-
-        "portfolio": [
-            {
-                "uuid": str(item.uuid),
-                "media_type": item.media_type,
-                "file_url": item.file_url,
-            }
-            for item in portfolio
-        ],
-    }
+    if err == "Invalid token":
+        raise HTTPException(status_code=400, detail=err)
+    if err:
+        raise HTTPException(status_code=404, detail=err)
 
+    return profile
@@ -0,0 +1,173 @@
+# public/service_listings.py
+from datetime import datetime
+
+from sqlalchemy import select, func
+
+from models import User, AgencyProfile, JobPosting
+from agency.service_jobposting import open_public_job
+
+
+# -----------------------------------
+# 🏢 AGENCIES
+# -----------------------------------
+def public_agencies_query():
+    return (
+        select(User, AgencyProfile)
+        .join(AgencyProfile, AgencyProfile.user_id == User.id)
+        .where(User.user_type == 2)
+    )
+
+
+def build_agency_response(user, profile, base_url: str) -> dict:
+    return {
+        "uuid": str(user.uuid),
+        "company_name": profile.company_name,
+        "contact_name": profile.contact_name,
+        "phone": profile.phone,
+        "website": profile.website,
+        "tagline": profile.tagline,
+        "services": profile.services,
+        "social_links": profile.social_links,
+        "logo": f"{base_url}/{profile.logo}" if profile.logo else None
+    }
+
+
+# -----------------------------------
+# 💼 JOBS
+# -----------------------------------
+def public_jobs_query():
+    # agency_profile.user_id is the agency's users.id, no need to join users
+    return (
+        select(JobPosting, AgencyProfile)
+        .join(AgencyProfile, AgencyProfile.user_id == JobPosting.agency_id)
+        .where(*open_public_job())
+    )
+
+
+def job_listing_filters(
+    min_pay: float | None = None,
+    max_pay: float | None = None,
+    is_paid: bool | None = None,
+    location: str | None = None,
+    project_type: str | None = None,
+    gender: str | None = None,
+    work_type: list[str] | None = None
+) -> list:
+    """
+    Optional query-string filters for the public job list.
+    Pay filters keep jobs whose pay range reaches into [min_pay, max_pay];
+    a gender filter also keeps jobs open to "any".
+    """
+    criteria = []
+
+    if min_pay is not None:
+        criteria.append(func.coalesce(JobPosting.pay_max, JobPosting.pay_min) >= min_pay)
+    if max_pay is not None:
+        criteria.append(func.coalesce(JobPosting.pay_min, JobPosting.pay_max) <= max_pay)
+    if is_paid is not None:
+        criteria.append(JobPosting.is_paid == is_paid)
+    if location:
+        # substring match, served by the pg_trgm index on location
+        pattern = location.strip().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        criteria.append(JobPosting.location.ilike(f"%{pattern}%"))
+    if project_type:
+        criteria.append(func.lower(JobPosting.project_type) == project_type.strip().lower())
+    if gender:
+        criteria.append(func.lower(JobPosting.gender).in_([gender.strip().lower(), "any"]))
+
+    work_types = [w.strip() for w in work_type or [] if w and w.strip()]
+    if work_types:
+        criteria.append(JobPosting.work_type.overlap(work_types))
+
+    return criteria
+
+
+def build_pay_string(job):
+    if not job.pay_min and not job.pay_max:
+        return None
+
+    # 💰 Amount
+    if job.pay_min and job.pay_max:
+        amount = f"${job.pay_min:,.0f} – ${job.pay_max:,.0f}"
+    elif job.pay_min:
+        amount = f"From ${job.pay_min:,.0f}"
+    else:
+        amount = f"Up to ${job.pay_max:,.0f}"
+
+    # 🧠 Unit mapping
+    unit_map = {
+        "per_day": "per day",
+        "per_month": "per month",
+        "per_year": "per year",
+        "per_episode": "per episode",
+        "per_movie": "per movie",
+        "per_project": "per project"
+    }
+
+    unit = None
+    if job.pay_unit:
+        unit = unit_map.get(job.pay_unit.strip().lower())
+
+    # ✅ FINAL STRING
+    return f"{amount} {unit}".strip() if unit else amount
+
+
+def build_job_response(job, profile, base_url: str, now: datetime) -> dict:
+    logo_path = job.logo or profile.logo
+    logo = base_url + "/" + logo_path.replace("\\", "/") if logo_path else None
+
+    posted = None
+    if job.date_from:
+        days = (now - job.date_from).days
+        posted = "Today" if days <= 0 else f"{days} days ago"
+
+    return {
+        # ---------------- BASIC ----------------
+        "uuid": str(job.uuid),
+        "job_role": job.job_role,
+        "description": job.description,
+        "project_type": job.project_type,
+        # "work_type": job.work_type,
+        "gender": job.gender,
+        "location": job.location,
+
+        # ---------------- LOGO ----------------
+        "logo": logo,
+
+        # ---------------- PAY ----------------
+        "pay": build_pay_string(job),
+        "pay_min": job.pay_min,
+        "pay_max": job.pay_max,
+        "pay_type": job.pay_type,
+        "pay_unit": job.pay_unit,
+        "is_paid": job.is_paid,
+
+        # ---------------- SKILLS ----------------
+        "qualifications": job.qualifications,
+        "required_skills": job.required_skills,
+        "requirements": job.requirements,
+        "experience": job.experience,
+
+        # ---------------- DATES ----------------
+        "date_from": job.date_from,
+        "date_to": job.date_to,
+        "expires_at": job.expires_at,
+        "deadline": job.deadline,
+
+        # ---------------- STATUS ----------------
+        "status": job.status,
+        "visibility": job.visibility,
+        "posted": posted,
+        "applicants": job.applications_count,
+
+        # ---------------- META ----------------
+        "agency_id": job.agency_id,
+        "created_by": job.created_by,
+        "updated_by": job.updated_by,
+
+        # ---------------- AGENCY ----------------
+        "agency": {
+            "uuid": str(profile.uuid),
+            "company_name": profile.company_name
+        }
+    }
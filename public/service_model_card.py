@@ -0,0 +1,213 @@
+# public/service_model_card.py
+import asyncio
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+
+from models import User, PublicModelCard, ModelJobRecommendation
+from public.service_models import (
+    is_model_profile_complete,
+    load_model_catalog
+)
+
+REBUILD_BATCH_SIZE = 500
+
+
+# -----------------------------------
+# 🔎 SEARCH KEYS
+# -----------------------------------
+def search_terms(values) -> list[str]:
+    """Lower-cased, de-duplicated array values used for @> filters and facets"""
+    return sorted({v.strip().lower() for v in values or [] if v and v.strip()})
+
+
+# -----------------------------------
+# 🧾 CARD ROW
+# -----------------------------------
+def card_values(entry: dict) -> dict:
+    """public_model_card column values for a catalog entry"""
+    user = entry["user"]
+    profile = entry["profile"]
+    professional = entry["professional"]
+    media = entry["media"]
+    images = entry["images"]
+
+    return {
+        "user_id": user.id,
+        "user_uuid": user.uuid,
+        "first_name": user.first_name,
+        "last_name": user.last_name,
+        "gender": user.gender,
+        "current_city": user.current_city,
+        "nationality": user.nationality,
+        "age": user.age,
+        "approved": bool(user.approved),
+
+        "height": profile.height if profile else None,
+        "weight": profile.weight if profile else None,
+        "chest_bust": profile.chest_bust if profile else None,
+        "waist": profile.waist if profile else None,
+        "hips": profile.hips if profile else None,
+        "shoe_size": profile.shoe_size if profile else None,
+        "eye_color": profile.eye_color if profile else None,
+        "hair_color": profile.hair_color if profile else None,
+        "complexion": profile.complexion if profile else None,
+        "body_type": profile.body_type if profile else None,
+        "height_cm": profile.height_cm if profile else None,
+
+        "skills": search_terms(professional.skills) if professional else [],
+        "languages": search_terms(professional.languages) if professional else [],
+        "interested_categories": search_terms(professional.interested_categories) if professional else [],
+        "willing_to_travel": bool(professional.willing_to_travel) if professional else False,
+
+        "profile_photo": images[0] if images else None,
+        "video": media.video if media else None,
+
+        "is_public_complete": is_model_profile_complete(
+            user=user,
+            profile=profile,
+            professional=professional,
+            profile_photo_url=images[0] if images else None
+        ),
+    }
+
+
+async def upsert_cards(db: AsyncSession, rows: list[dict]):
+    if not rows:
+        return
+
+    stmt = insert(PublicModelCard).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[PublicModelCard.user_id],
+        set_={
+            **{
+                key: stmt.excluded[key]
+                for key in rows[0]
+                if key != "user_id"
+            },
+            "updated_at": func.now(),
+        }
+    )
+    await db.execute(stmt)
+
+
+def build_card_response(card: PublicModelCard, base_url: str) -> dict:
+    """Short card used by the public models list"""
+    return {
+        "uuid": str(card.user_uuid),
+        "first_name": card.first_name,
+        "last_name": card.last_name,
+        "full_name": f"{card.first_name} {card.last_name}",
+        "profile_photo": f"{base_url}/{card.profile_photo}" if card.profile_photo else None,
+        "current_city": card.current_city,
+        "age": card.age,
+        "gender": card.gender,
+        "nationality": card.nationality,
+        "approved": card.approved,
+        "profile": {
+            "height": card.height,
+            "weight": card.weight,
+            "chest_bust": card.chest_bust,
+            "waist": card.waist,
+            "hips": card.hips,
+            "shoe_size": card.shoe_size,
+            "eye_color": card.eye_color,
+            "hair_color": card.hair_color,
+            "complexion": card.complexion,
+        }
+    }
+
+
+# -----------------------------------
+# 🔁 WRITE-PATH HOOK
+# -----------------------------------
+async def refresh_model_card(db: AsyncSession, user_id: int):
+    """
+    Recompute one model's card inside the caller's transaction.
+    Call it after changing user / profile / professional / gallery data
+    and BEFORE db.commit(), so the card commits (or rolls back) with it;
+    call public.service_share.invalidate_shared_profile AFTER the commit.
+    Also marks the model's recommended-jobs feed stale.
+    """
+    entries = await load_model_catalog(
+        db,
+        User.id == user_id,
+        User.user_type == 1
+    )
+
+    if not entries:
+        await db.execute(
+            delete(PublicModelCard).where(PublicModelCard.user_id == user_id)
+        )
+        await db.execute(
+            delete(ModelJobRecommendation).where(ModelJobRecommendation.user_id == user_id)
+        )
+        return
+
+    await upsert_cards(db, [card_values(entries[0])])
+    await mark_feed_stale(db, user_id)
+
+
+async def mark_feed_stale(db: AsyncSession, user_id: int):
+    """Queue the model's recommended-jobs feed for a rebuild (background worker)"""
+    stmt = insert(ModelJobRecommendation).values(user_id=user_id, stale=True)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[ModelJobRecommendation.user_id],
+        set_={"stale": True}
+    )
+    await db.execute(stmt)
+
+
+# -----------------------------------
+# 🏗️ REBUILD / BACKFILL
+# -----------------------------------
+async def rebuild_model_cards(
+    db: AsyncSession,
+    batch_size: int = REBUILD_BATCH_SIZE
+) -> int:
+    """Recompute every card in id batches and drop cards of non-models"""
+    total = 0
+    last_id = 0
+
+    while True:
+        entries = await load_model_catalog(
+            db,
+            User.user_type == 1,
+            User.id > last_id,
+            order_by=(User.id.asc(),),
+            limit=batch_size
+        )
+        if not entries:
+            break
+
+        await upsert_cards(db, [card_values(e) for e in entries])
+        await db.commit()
+
+        total += len(entries)
+        last_id = entries[-1]["user"].id
+        db.expunge_all()
+
+    await db.execute(
+        delete(PublicModelCard).where(
+            PublicModelCard.user_id.not_in(
+                select(User.id).where(User.user_type == 1)
+            )
+        )
+    )
+    await db.commit()
+
+    return total
+
+
+async def _main():
+    from database import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db:
+        total = await rebuild_model_cards(db)
+
+    print(f"Rebuilt {total} public model cards")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,223 @@
+# public/service_models.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, UUID
+
+from models import (
+    User, ModelProfile, ModelProfessional, ModelImages, Image_Videos
+)
+
+
+MAX_CARD_IMAGES = 5
+
+
+# -----------------------------------
+# ✅ PROFILE COMPLETENESS
+# -----------------------------------
+def is_model_profile_complete(
+        user,
+        profile,
+        professional,
+        profile_photo_url
+) -> bool:
+    """Check if model profile is complete enough to display publicly"""
+
+    # BASIC INFO (required)
+    if not all([
+        user.first_name,
+        user.last_name,
+        user.current_city,
+        user.gender,
+        user.nationality,
+    ]):
+        return False
+
+    if user.age is None:
+        return False
+
+    # PROFILE (required)
+    if not profile:
+        return False
+
+    numeric_fields = [
+        profile.height,
+        profile.weight,
+        profile.chest_bust,
+        profile.waist,
+        profile.hips,
+        profile.shoulder,
+        profile.shoe_size,
+    ]
+
+    if any(field is None for field in numeric_fields):
+        return False
+
+    text_fields = [
+        profile.complexion,
+        profile.eye_color,
+        profile.hair_color,
+        profile.body_type,
+        profile.hair_length,
+    ]
+
+    if any(not f for f in text_fields):
+        return False
+
+    # PROFESSIONAL (required) - Fixed attribute names
+    if not professional:
+        return False
+
+    # Check only the attributes that exist in ModelProfessional
+    if (
+            not professional.experience_details or
+            not professional.skills or
+            not professional.languages or
+            not professional.interested_categories
+    ):
+        return False
+
+    return True
+
+
+def model_catalog_filters(
+    source,
+    gender: str | None = None,
+    city: str | None = None,
+    nationality: str | None = None,
+    min_age: int | None = None,
+    max_age: int | None = None
+) -> list:
+    """
+    Optional query-string filters for the public catalog.
+    `source` is any mapped class with gender / current_city / nationality /
+    age columns (User or PublicModelCard).
+    """
+    criteria = []
+
+    if gender:
+        criteria.append(func.lower(source.gender) == gender.strip().lower())
+    if city:
+        criteria.append(func.lower(source.current_city) == city.strip().lower())
+    if nationality:
+        criteria.append(func.lower(source.nationality) == nationality.strip().lower())
+    if min_age is not None:
+        criteria.append(source.age >= min_age)
+    if max_age is not None:
+        criteria.append(source.age <= max_age)
+
+    return criteria
+
+
+# -----------------------------------
+# 📦 BATCHED CATALOG LOADER
+# -----------------------------------
+async def load_gallery_images(
+    db: AsyncSession,
+    media_uuids: list,
+    limit: int = MAX_CARD_IMAGES
+) -> dict:
+    """
+    Top `limit` images (by image_index) for every gallery in ONE query.
+    Returns {media_uuid: [image_path, ...]}.
+    """
+    if not media_uuids:
+        return {}
+
+    ranked = (
+        select(
+            ModelImages.media_uuid,
+            ModelImages.image_path,
+            func.row_number().over(
+                partition_by=ModelImages.media_uuid,
+                order_by=ModelImages.image_index
+            ).label("rn")
+        )
+        # single uuid[] parameter instead of one bind per id
+        .where(ModelImages.media_uuid == any_(
+            bindparam("media_uuids", list(media_uuids), type_=ARRAY(UUID(as_uuid=True)))
+        ))
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(ranked.c.media_uuid, ranked.c.image_path)
+        .where(ranked.c.rn <= limit)
+        .order_by(ranked.c.media_uuid, ranked.c.rn)
+    )
+
+    images = {}
+    for media_uuid, image_path in result.all():
+        images.setdefault(media_uuid, []).append(image_path)
+    return images
+
+
+async def load_model_catalog(
+    db: AsyncSession,
+    *criteria,
+    order_by=None,
+    limit: int | None = None
+) -> list[dict]:
+    """
+    Load models with profile, professional info and gallery in a constant
+    number of queries (one joined select + one windowed image select),
+    instead of 4 queries per model.
+
+    Each entry: {"user", "profile", "professional", "media", "images"}
+    where images are raw stored paths (max MAX_CARD_IMAGES).
+    """
+    # model_video is not unique per user; join only the first gallery row
+    # so LIMIT counts models, not gallery duplicates
+    first_gallery = (
+        select(func.min(Image_Videos.id))
+        .where(Image_Videos.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
+    stmt = (
+        select(User, ModelProfile, ModelProfessional, Image_Videos)
+        .outerjoin(ModelProfile, ModelProfile.user_id == User.id)
+        .outerjoin(ModelProfessional, ModelProfessional.user_id == User.id)
+        .outerjoin(Image_Videos, Image_Videos.id == first_gallery)
+        .where(*criteria)
+        .order_by(*(order_by if order_by is not None else (User.first_name.asc(), User.id.asc())))
+    )
+
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    result = await db.execute(stmt)
+
+    entries = [
+        {
+            "user": user,
+            "profile": profile,
+            "professional": professional,
+            "media": media,
+            "images": [],
+        }
+        for user, profile, professional, media in result.all()
+    ]
+
+    images = await load_gallery_images(
+        db,
+        [e["media"].uuid for e in entries if e["media"]]
+    )
+
+    for entry in entries:
+        if entry["media"]:
+            entry["images"] = images.get(entry["media"].uuid, [])
+
+    return entries
+
+
+def build_gallery(entry: dict, base_url: str) -> dict:
+    """Absolute image / video URLs for a catalog entry"""
+    images = [f"{base_url}/{path}" for path in entry["images"]]
+    media = entry["media"]
+
+    return {
+        "images": images,
+        "video": f"{base_url}/{media.video}" if media and media.video else None,
+        "profile_photo": images[0] if images else None,
+    }
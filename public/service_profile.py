@@ -0,0 +1,172 @@
+# public/service_profile.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import JSON, aggregate_order_by
+
+from models import (
+    User, ModelProfile, ModelProfessional, UserSocialLink,
+    ModelPortfolio, ModelImages, Image_Videos
+)
+from public.service_models import MAX_CARD_IMAGES
+
+SOCIAL_FIELDS = (
+    "x", "instagram", "tiktok", "snapchat",
+    "pinterest", "linkedin", "youtube", "facebook",
+)
+
+
+# -----------------------------------
+# 📦 SINGLE ROUND-TRIP ASSEMBLER
+# -----------------------------------
+def _first_row_id(model):
+    """Correlated min(id) for 1:1-in-practice tables without a unique user_id"""
+    return (
+        select(func.min(model.id))
+        .where(model.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
+
+async def load_model_profile(db: AsyncSession, *criteria) -> dict | None:
+    """
+    Load a full model profile in ONE statement:
+    user + profile + professional + social links + gallery joined,
+    gallery images and portfolio aggregated in correlated subqueries.
+
+    Returns {"user", "profile", "professional", "social_link", "media",
+    "images", "portfolio"} or None. Images are raw stored paths,
+    portfolio items are {"uuid", "media_type", "file_url"} dicts.
+    """
+    images = (
+        select(
+            func.array_agg(
+                aggregate_order_by(ModelImages.image_path, ModelImages.image_index)
+            )[1:MAX_CARD_IMAGES]
+        )
+        .where(ModelImages.media_uuid == Image_Videos.uuid)
+        .correlate(Image_Videos)
+        .scalar_subquery()
+    )
+
+    portfolio = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        "uuid", ModelPortfolio.uuid,
+                        "media_type", ModelPortfolio.media_type,
+                        "file_url", ModelPortfolio.file_url,
+                    ),
+                    ModelPortfolio.id
+                ),
+                type_=JSON
+            )
+        )
+        .where(ModelPortfolio.user_id == User.id)
+        .correlate(User)
+        .scalar_subquery()
+    )
+
+    result = await db.execute(
+        select(
+            User, ModelProfile, ModelProfessional, UserSocialLink, Image_Videos,
+            images, portfolio
+        )
+        .outerjoin(ModelProfile, ModelProfile.user_id == User.id)
+        .outerjoin(ModelProfessional, ModelProfessional.user_id == User.id)
+        .outerjoin(UserSocialLink, UserSocialLink.id == _first_row_id(UserSocialLink))
+        .outerjoin(Image_Videos, Image_Videos.id == _first_row_id(Image_Videos))
+        .where(*criteria)
+        .limit(1)
+    )
+    row = result.first()
+
+    if not row:
+        return None
+
+    user, profile, professional, social_link, media, image_paths, portfolio_items = row
+
+    return {
+        "user": user,
+        "profile": profile,
+        "professional": professional,
+        "social_link": social_link,
+        "media": media,
+        "images": image_paths or [],
+        "portfolio": portfolio_items or [],
+    }
+
+
+# -----------------------------------
+# 🧱 RESPONSE SHAPING
+# -----------------------------------
+def build_social_links(social_link) -> dict:
+    return {
+        field: getattr(social_link, field) if social_link else None
+        for field in SOCIAL_FIELDS
+    }
+
+
+def build_public_profile(bundle: dict, base_url: str, **basic_extra) -> dict:
+    """Public profile page (details + share link)"""
+    user = bundle["user"]
+    profile = bundle["profile"]
+    professional = bundle["professional"]
+    media = bundle["media"]
+
+    images = [f"{base_url}/{path}" for path in bundle["images"]]
+    video = f"{base_url}/{media.video}" if media and media.video else None
+
+    return {
+        "basic_info": {
+            "uuid": str(user.uuid),
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "full_name": f"{user.first_name} {user.last_name}",
+            "profile_photo": images[0] if images else None,
+            "current_city": user.current_city,
+            "age": user.age,
+            "gender": user.gender,
+            "nationality": user.nationality,
+            **basic_extra,
+        },
+
+        "profile": {
+            "height": profile.height if profile else None,
+            "weight": profile.weight if profile else None,
+            "chest_bust": profile.chest_bust if profile else None,
+            "waist": profile.waist if profile else None,
+            "hips": profile.hips if profile else None,
+            "shoulder": profile.shoulder if profile else None,
+            "shoe_size": profile.shoe_size if profile else None,
+            "complexion": profile.complexion if profile else None,
+            "eye_color": profile.eye_color if profile else None,
+            "hair_color": profile.hair_color if profile else None,
+            "body_type": profile.body_type if profile else None,
+            "hair_length": profile.hair_length if profile else None,
+        },
+
+        "professional": {
+            "experience_details": professional.experience_details if professional else None,
+            "skills": professional.skills if professional else [],
+            "languages": professional.languages if professional else [],
+            "interested_categories": professional.interested_categories if professional else [],
+        },
+
+        "media_gallery": {
+            "images": images,
+            "video": video,
+        },
+
+        "social_links": build_social_links(bundle["social_link"]),
+
+        "portfolio": [
+            {
+                "uuid": str(item["uuid"]),
+                "media_type": item["media_type"],
+                "file_url": item["file_url"],
+            }
+            for item in bundle["portfolio"]
+        ],
+    }
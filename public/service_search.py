@@ -0,0 +1,164 @@
+# public/service_search.py
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func, literal, union_all
+
+from models import PublicModelCard, ModelFilter
+from public.service_models import model_catalog_filters
+from public.service_model_card import search_terms
+
+FACET_LIMIT = 20
+
+# facet name -> public_model_card column
+SCALAR_FACETS = {
+    "gender": "gender",
+    "eye_color": "eye_color",
+    "hair_color": "hair_color",
+    "body_type": "body_type",
+    "skin_tone": "complexion",
+}
+ARRAY_FACETS = {
+    "skills": "skills",
+    "languages": "languages",
+    "categories": "interested_categories",
+}
+
+
+# -----------------------------------
+# 🎛️ FILTERS
+# -----------------------------------
+def model_search_filters(
+    gender: str | None = None,
+    city: str | None = None,
+    nationality: str | None = None,
+    min_age: int | None = None,
+    max_age: int | None = None,
+    min_height: float | None = None,
+    max_height: float | None = None,
+    eye_color: str | None = None,
+    hair_color: str | None = None,
+    body_type: str | None = None,
+    skin_tone: str | None = None,
+    skills: list[str] | None = None,
+    languages: list[str] | None = None,
+    categories: list[str] | None = None,
+    willing_to_travel: bool | None = None
+) -> list:
+    """
+    SQL criteria over public_model_card. Text facets compare lower()-ed,
+    array facets must contain ALL requested values (GIN @>), heights are cm.
+    """
+    card = PublicModelCard
+
+    criteria = [
+        card.is_public_complete == True,
+        *model_catalog_filters(card, gender, city, nationality, min_age, max_age)
+    ]
+
+    for column, value in (
+        (card.eye_color, eye_color),
+        (card.hair_color, hair_color),
+        (card.body_type, body_type),
+        (card.complexion, skin_tone),
+    ):
+        if value:
+            criteria.append(func.lower(column) == value.strip().lower())
+
+    if min_height is not None:
+        criteria.append(card.height_cm >= min_height)
+    if max_height is not None:
+        criteria.append(card.height_cm <= max_height)
+
+    for column, values in (
+        (card.skills, skills),
+        (card.languages, languages),
+        (card.interested_categories, categories),
+    ):
+        terms = search_terms(values)
+        if terms:
+            criteria.append(column.contains(terms))
+
+    if willing_to_travel is not None:
+        criteria.append(card.willing_to_travel == willing_to_travel)
+
+    return criteria
+
+
+async def load_saved_filter(db: AsyncSession, filter_id: int) -> dict | None:
+    """A model_filters row as model_search_filters keyword arguments"""
+    result = await db.execute(
+        select(ModelFilter).where(ModelFilter.id == filter_id)
+    )
+    saved = result.scalar_one_or_none()
+
+    if not saved:
+        return None
+
+    # availability has no model-side data to match against yet
+    return {
+        "gender": saved.gender,
+        "min_height": saved.height_min,
+        "max_height": saved.height_max,
+        "eye_color": saved.eye_color,
+        "hair_color": saved.hair_color,
+        "min_age": saved.age_range_min,
+        "max_age": saved.age_range_max,
+        "body_type": saved.body_type,
+        "skin_tone": saved.skin_tone,
+    }
+
+
+# -----------------------------------
+# 📊 FACET COUNTS
+# -----------------------------------
+async def load_search_facets(db: AsyncSession, criteria: list) -> dict:
+    """
+    Value counts of every facet over the matched set, in ONE query:
+    the matches are materialized once, scalar facets are lower()-ed,
+    array facets unnested, and only the top FACET_LIMIT values per
+    facet are returned.
+    """
+    columns = {**SCALAR_FACETS, **ARRAY_FACETS}
+
+    matched = (
+        select(*(getattr(PublicModelCard, col) for col in columns.values()))
+        .where(*criteria)
+        .cte("matched")
+    )
+
+    values = union_all(
+        *(
+            select(literal(name).label("facet"), func.lower(matched.c[col]).label("value"))
+            for name, col in SCALAR_FACETS.items()
+        ),
+        *(
+            select(literal(name).label("facet"), func.unnest(matched.c[col]).label("value"))
+            for name, col in ARRAY_FACETS.items()
+        ),
+    ).subquery()
+
+    counted = (
+        select(
+            values.c.facet,
+            values.c.value,
+            func.count().label("count"),
+            func.row_number().over(
+                partition_by=values.c.facet,
+                order_by=(func.count().desc(), values.c.value)
+            ).label("rn")
+        )
+        .where(values.c.value.isnot(None), values.c.value != "")
+        .group_by(values.c.facet, values.c.value)
+        .subquery()
+    )
+
+    result = await db.execute(
+        select(counted.c.facet, counted.c.value, counted.c.count)
+        .where(counted.c.rn <= FACET_LIMIT)
+        .order_by(counted.c.facet, counted.c.rn)
+    )
+
+    facets = {name: [] for name in columns}
+    for facet, value, count in result.all():
+        facets[facet].append({"value": value, "count": count})
+
+    return facets
@@ -0,0 +1,68 @@
+# public/service_share.py
+from urllib.parse import unquote
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.aes_encryption import aes_decrypt
+from core.cache import TTLCache
+from models import User
+from public.service_profile import load_model_profile, build_public_profile
+
+# encrypted token (as received) -> (user_id, plain share_token)
+# skips unquote + AES on repeat hits; the plain token is re-checked
+# against the DB every time the profile below is reloaded
+SHARE_TOKEN_TTL_SECONDS = 300
+_share_tokens = TTLCache(maxsize=10000, ttl=SHARE_TOKEN_TTL_SECONDS)
+
+# user_id -> (share_token, base_url, response)
+# short TTL: bounds staleness for edits made through another worker
+SHARE_PROFILE_TTL_SECONDS = 30
+_share_profiles = TTLCache(maxsize=2000, ttl=SHARE_PROFILE_TTL_SECONDS)
+
+
+def invalidate_shared_profile(user_id: int):
+    """Drop the cached public profile; call on any write to the model's profile data"""
+    _share_profiles.pop(user_id)
+
+
+async def get_shared_profile(db: AsyncSession, token: str, base_url: str):
+    """
+    Public profile for an encrypted share token.
+    Returns (response, err); err is "Invalid token" or "Invalid or expired link".
+    """
+    ref = _share_tokens.get(token)
+
+    if ref is None:
+        try:
+            share_token = aes_decrypt(unquote(token))
+        except Exception:
+            return None, "Invalid token"
+
+        bundle = await load_model_profile(db, User.share_token == share_token)
+        if not bundle:
+            return None, "Invalid or expired link"
+
+        user_id = bundle["user"].id
+        _share_tokens.set(token, (user_id, share_token))
+
+    else:
+        user_id, share_token = ref
+
+        cached = _share_profiles.get(user_id)
+        if cached and cached[0] == share_token and cached[1] == base_url:
+            return cached[2], None
+
+        # PK lookup; also catches a token rotated through another worker
+        bundle = await load_model_profile(
+            db,
+            User.id == user_id,
+            User.share_token == share_token
+        )
+        if not bundle:
+            _share_tokens.pop(token)
+            return None, "Invalid or expired link"
+
+    response = build_public_profile(bundle, base_url, profile_visible=True)
+    _share_profiles.set(user_id, (share_token, base_url, response))
+
+    return response, None
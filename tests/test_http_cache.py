@@ -0,0 +1,59 @@
+# tests/test_http_cache.py
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core import http_cache
+from core.http_cache import bump_version, JOBS, AGENCIES
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    http_cache._versions.clear()
+    yield
+    http_cache._versions.clear()
+
+
+def test_cached_version_is_dropped_after_commit_only():
+    async def scenario():
+        db = AsyncSession()
+
+        async def execute(stmt):
+            return None
+        db.execute = execute
+
+        http_cache._versions.set(JOBS, (1, None))
+        http_cache._versions.set(AGENCIES, (1, None))
+
+        await bump_version(db, JOBS)
+        await bump_version(db, JOBS, AGENCIES)
+        assert http_cache._versions.get(JOBS) == (1, None)
+
+        await db.commit()
+        assert http_cache._versions.get(JOBS) is None
+        assert http_cache._versions.get(AGENCIES) is None
+
+        # the next transaction registers again
+        http_cache._versions.set(JOBS, (2, None))
+        await bump_version(db, JOBS)
+        await db.commit()
+        assert http_cache._versions.get(JOBS) is None
+
+    asyncio.run(scenario())
+
+
+def test_rollback_keeps_cached_version():
+    async def scenario():
+        db = AsyncSession()
+
+        async def execute(stmt):
+            return None
+        db.execute = execute
+
+        http_cache._versions.set(JOBS, (1, None))
+        await bump_version(db, JOBS)
+        await db.rollback()
+        assert http_cache._versions.get(JOBS) == (1, None)
+
+    asyncio.run(scenario())
@@ -0,0 +1,100 @@
+# tests/test_measurements.py
+import pytest
+
+from utils.measurements import (
+    parse_height_cm, parse_weight_kg, parse_length_cm, parse_shoe_size_eu,
+    normalized_measurements
+)
+
+
+@pytest.mark.parametrize("text, cm", [
+    ("175", 175.0),
+    ("175cm", 175.0),
+    ("1.75m", 175.0),
+    ("1.75", 175.0),
+    ("5'9\"", 175.3),
+    ("5 ft 9 in", 175.3),
+    ("5.9", 175.3),
+    ("69in", 175.3),
+    ("69", 175.3),
+])
+def test_height(text, cm):
+    assert parse_height_cm(text) == cm
+
+
+@pytest.mark.parametrize("text", [None, "", "tall", "175 mm", "1750", "30cm", "12'"])
+def test_height_unparsable_or_implausible(text):
+    assert parse_height_cm(text) is None
+
+
+@pytest.mark.parametrize("text, kg", [
+    ("60", 60.0),
+    ("60kg", 60.0),
+    ("60,5 kg", 60.5),
+    ("132 lbs", 59.9),
+])
+def test_weight(text, kg):
+    assert parse_weight_kg(text) == kg
+
+
+@pytest.mark.parametrize("text", ["60 st", "5", "600kg"])
+def test_weight_unparsable_or_implausible(text):
+    assert parse_weight_kg(text) is None
+
+
+@pytest.mark.parametrize("text, cm", [
+    ("34", 86.4),
+    ("34in", 86.4),
+    ("34\"", 86.4),
+    ("86", 86.0),
+    ("86cm", 86.0),
+])
+def test_length(text, cm):
+    assert parse_length_cm(text, inch_below=60, column="chest_bust_cm") == cm
+
+
+@pytest.mark.parametrize("text, column", [
+    ("8600", "chest_bust_cm"),         # typo
+    ("340in", "hips_cm"),
+    ("10cm", "waist_cm"),
+    ("150", "shoulder_cm"),
+    ("34 mm", "chest_bust_cm"),
+])
+def test_length_implausible_or_unparsable(text, column):
+    assert parse_length_cm(text, inch_below=30, column=column) is None
+
+
+@pytest.mark.parametrize("text, eu", [
+    ("39", 39.0),
+    ("EU 39", 39.0),
+    ("UK 6", 39.0),
+    ("US 8", 39.5),
+    ("6", 39.0),
+])
+def test_shoe_size(text, eu):
+    assert parse_shoe_size_eu(text) == eu
+
+
+@pytest.mark.parametrize("text", ["390", "EU 2", "size 6"])
+def test_shoe_size_implausible_or_unparsable(text):
+    assert parse_shoe_size_eu(text) is None
+
+
+def test_normalized_measurements():
+    assert normalized_measurements({
+        "height": "5'9\"",
+        "weight": "60kg",
+        "chest_bust": "34",
+        "waist": "26",
+        "hips": "3600",
+        "shoulder": None,
+        "shoe_size": "UK 6",
+    }) == {
+        "height_cm": 175.3,
+        "weight_kg": 60.0,
+        "chest_bust_cm": 86.4,
+        "waist_cm": 66.0,
+        "hips_cm": None,
+        "shoulder_cm": None,
+        "shoe_size_eu": 39.0,
+    }
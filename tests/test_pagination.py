@@ -0,0 +1,31 @@
+# tests/test_pagination.py
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from core.pagination import encode_cursor, decode_cursor
+
+
+def test_round_trip():
+    created_at = datetime(2026, 2, 1, 12, 30, 5, 123456)
+    cursor = encode_cursor(created_at.isoformat(), 42)
+    assert decode_cursor(cursor, datetime, int) == [created_at, 42]
+    assert decode_cursor(encode_cursor("Anna", 7), str, int) == ["Anna", 7]
+
+
+@pytest.mark.parametrize("cursor, types", [
+    ("not base64 json!", (int,)),
+    (encode_cursor(1, 2), (int,)),             # wrong size
+    (encode_cursor("7"), (int,)),              # string for an int key
+    (encode_cursor(7.5), (int,)),
+    (encode_cursor(True), (int,)),
+    (encode_cursor(None), (int,)),
+    (encode_cursor({"id": 7}), (int,)),
+    (encode_cursor(7, 7), (str, int)),         # int for a str key
+    (encode_cursor("yesterday", 7), (datetime, int)),
+])
+def test_tampered_cursor_is_400(cursor, types):
+    with pytest.raises(HTTPException) as exc:
+        decode_cursor(cursor, *types)
+    assert exc.value.status_code == 400
@@ -0,0 +1,129 @@
+# tests/test_principal.py
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+
+from core.principal import (
+    resolve_user_principal, invalidate_user_principal, is_refresh_payload, UserPrincipal,
+    CLAIMS_VERSION, ACCESS_TOKEN, REFRESH_TOKEN, ACCESS_TOKEN_TTL_SECONDS
+)
+
+USER_UUID = uuid4()
+
+
+class FakeResult:
+    def __init__(self, row):
+        self.row = row
+
+    def first(self):
+        return self.row
+
+
+class FakeDB:
+    """Answers the (token_version, claims_version) lookup, then the principal row"""
+
+    def __init__(self, token_version=0, claims_version=0, row=None):
+        self.versions = None if token_version is None else (token_version, claims_version)
+        self.row = row
+        self.executed = 0
+
+    async def execute(self, stmt):
+        self.executed += 1
+        return FakeResult(self.versions if self.executed == 1 else self.row)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    invalidate_user_principal(USER_UUID)
+    yield
+    invalidate_user_principal(USER_UUID)
+
+
+def payload(**overrides):
+    claims = {
+        "sub": str(USER_UUID),
+        "exp": time.time() + 600,
+        "typ": ACCESS_TOKEN,
+        "tv": 0,
+        "uv": 0,
+        "cv": CLAIMS_VERSION,
+        "uid": 7,
+        "user_type": 1,
+        "approved": True,
+        "plan": "free",
+    }
+    claims.update(overrides)
+    return {key: value for key, value in claims.items() if value is not None}
+
+
+def resolve(db, claims):
+    return asyncio.run(resolve_user_principal(db, claims))
+
+
+def test_access_token_resolves_from_claims():
+    db = FakeDB()
+    principal = resolve(db, payload())
+    assert principal == UserPrincipal(id=7, uuid=USER_UUID, user_type=1, approved=True, plan="free")
+    assert db.executed == 1                  # the version lookup only
+
+
+def test_refresh_token_is_refused():
+    assert resolve(FakeDB(), payload(typ=REFRESH_TOKEN)) is None
+
+
+def test_revoked_token_is_refused():
+    assert resolve(FakeDB(token_version=1), payload(tv=0)) is None
+    invalidate_user_principal(USER_UUID)
+    assert resolve(FakeDB(token_version=1), payload(tv=1)) is not None
+
+
+def test_token_without_tv_is_refused_after_revocation():
+    assert resolve(FakeDB(token_version=2), payload(tv=None)) is None
+
+
+def test_deleted_user_is_refused():
+    assert resolve(FakeDB(token_version=None), payload()) is None
+
+
+def test_bad_subject_is_refused():
+    assert resolve(FakeDB(), payload(sub="not-a-uuid")) is None
+
+
+def test_old_claim_set_loads_the_user():
+    row = (7, USER_UUID, 2, False, "pro")
+    db = FakeDB(row=row)
+    assert resolve(db, payload(cv=None)) == UserPrincipal(*row)
+    assert db.executed == 2
+
+
+def test_stale_claims_load_the_user_instead_of_failing():
+    # approved changed since the token was issued: the session survives
+    row = (7, USER_UUID, 1, False, "free")
+    db = FakeDB(claims_version=1, row=row)
+    assert resolve(db, payload(uv=0)) == UserPrincipal(*row)
+
+
+def test_missing_claims_are_refused():
+    assert resolve(FakeDB(), payload(plan=None)) is None
+
+
+def test_legacy_token_within_access_ttl():
+    assert resolve(FakeDB(), payload(typ=None)) is not None
+
+
+def test_legacy_token_past_access_ttl_is_refused():
+    # no "typ" and an exp only a refresh token can have
+    claims = payload(typ=None, exp=time.time() + ACCESS_TOKEN_TTL_SECONDS + 3600)
+    assert resolve(FakeDB(), claims) is None
+
+
+def test_refresh_payload():
+    now = time.time()
+    assert is_refresh_payload({"typ": REFRESH_TOKEN, "exp": now + 60})
+    assert not is_refresh_payload({"typ": ACCESS_TOKEN, "exp": now + 30 * 86400})
+    # no "typ": only an exp no access token can have makes it a refresh token
+    assert is_refresh_payload({"exp": now + ACCESS_TOKEN_TTL_SECONDS + 3600})
+    assert not is_refresh_payload({"exp": now + 600})
+    assert not is_refresh_payload({})
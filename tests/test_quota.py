@@ -0,0 +1,73 @@
+# tests/test_quota.py
+import asyncio
+
+import pytest
+
+from core import quota
+from core.quota import (
+    get_plan_limits, consume_quota, FREE_PLAN, FREE_PLAN_LIMITS,
+    JOB_POSTINGS, MODEL_IMAGES, MODEL_VIDEOS
+)
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def all(self):
+        return self.rows
+
+
+class FakeDB:
+    """plan_entitlements rows as (plan, resource, max_count)"""
+
+    def __init__(self, rows=()):
+        self.rows = list(rows)
+        self.executed = 0
+
+    async def execute(self, stmt):
+        self.executed += 1
+        return FakeResult(self.rows)
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    quota._entitlements.clear()
+    yield
+    quota._entitlements.clear()
+
+
+def limits(db, plan):
+    return asyncio.run(get_plan_limits(db, plan))
+
+
+def test_free_plan_rows():
+    db = FakeDB([(FREE_PLAN, JOB_POSTINGS, 1)])
+    assert limits(db, None) == {**FREE_PLAN_LIMITS, JOB_POSTINGS: 1}
+
+
+def test_missing_rows_fall_back_to_free_limits():
+    db = FakeDB([(FREE_PLAN, JOB_POSTINGS, 3), (FREE_PLAN, MODEL_IMAGES, 5), ("pro", MODEL_IMAGES, 50)])
+    assert limits(db, "pro") == {JOB_POSTINGS: 3, MODEL_IMAGES: 50, MODEL_VIDEOS: FREE_PLAN_LIMITS[MODEL_VIDEOS]}
+
+
+def test_unknown_plan_gets_free_defaults():
+    assert limits(FakeDB(), "enterprise") == FREE_PLAN_LIMITS
+
+
+def test_limits_are_cached():
+    db = FakeDB()
+    limits(db, "pro")
+    limits(db, "pro")
+    assert db.executed == 1
+
+
+def test_resource_without_any_limit_is_refused():
+    db = FakeDB()
+    assert asyncio.run(consume_quota(db, 1, FREE_PLAN, "something_new")) is False
+    assert db.executed == 1                  # only the entitlement lookup
+
+
+def test_amount_over_the_limit_is_refused():
+    db = FakeDB()
+    assert asyncio.run(consume_quota(db, 1, FREE_PLAN, JOB_POSTINGS, amount=4)) is False
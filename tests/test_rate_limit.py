@@ -0,0 +1,82 @@
+# tests/test_rate_limit.py
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from core import rate_limit
+from core.rate_limit import MemoryBuckets
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def take(buckets, *args, **kwargs):
+    return asyncio.run(buckets.take(*args, **kwargs))
+
+
+def test_burst_then_reject(monkeypatch):
+    monkeypatch.setattr(rate_limit.time, "monotonic", Clock())
+    buckets = MemoryBuckets()
+
+    for _ in range(3):
+        assert take(buckets, "k", capacity=3, rate=1) == (True, 0.0)
+
+    allowed, retry_after = take(buckets, "k", capacity=3, rate=1)
+    assert not allowed
+    assert retry_after == 1
+
+
+def test_refills_over_time(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    buckets = MemoryBuckets()
+
+    assert take(buckets, "k", capacity=2, rate=0.5, cost=2)[0]
+    allowed, retry_after = take(buckets, "k", capacity=2, rate=0.5)
+    assert not allowed
+    assert retry_after == 2
+
+    clock.now += 2
+    assert take(buckets, "k", capacity=2, rate=0.5)[0]
+
+
+def test_refill_stops_at_capacity(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", clock)
+    buckets = MemoryBuckets()
+
+    take(buckets, "k", capacity=2, rate=1)
+    clock.now += 3600
+    assert take(buckets, "k", capacity=2, rate=1, cost=2)[0]
+    assert not take(buckets, "k", capacity=2, rate=1)[0]
+
+
+def test_keys_are_separate(monkeypatch):
+    monkeypatch.setattr(rate_limit.time, "monotonic", Clock())
+    buckets = MemoryBuckets()
+
+    assert take(buckets, "a", capacity=1, rate=1)[0]
+    assert not take(buckets, "a", capacity=1, rate=1)[0]
+    assert take(buckets, "b", capacity=1, rate=1)[0]
+
+
+def test_export_limit_raises_429(monkeypatch):
+    monkeypatch.setattr(rate_limit.time, "monotonic", Clock())
+    monkeypatch.setattr(rate_limit, "_backend", MemoryBuckets())
+    monkeypatch.setattr(rate_limit, "EXPORT_LIMITS", (2, 1))
+
+    for _ in range(2):
+        asyncio.run(rate_limit.enforce_export_limits(7))
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(rate_limit.enforce_export_limits(7))
+    assert exc.value.status_code == 429
+    assert exc.value.headers["Retry-After"] == "60"
+
+    asyncio.run(rate_limit.enforce_export_limits(8))
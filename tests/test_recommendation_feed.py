@@ -0,0 +1,36 @@
+# tests/test_recommendation_feed.py
+from model import model_recommendation_service as feeds
+from model.model_recommendation_service import merge_feed
+
+
+def test_merge_adds_new_jobs_by_score():
+    job_ids, scores = merge_feed([1, 2], [0.5, 0.2], {3: 0.4})
+    assert job_ids == [1, 3, 2]
+    assert scores == [0.5, 0.4, 0.2]
+
+
+def test_new_score_replaces_existing_entry():
+    job_ids, scores = merge_feed([1, 2], [0.5, 0.2], {2: 0.9})
+    assert job_ids == [2, 1]
+    assert scores == [0.9, 0.5]
+
+
+def test_ties_put_newest_job_first():
+    job_ids, _ = merge_feed([4], [0.3], {7: 0.3, 5: 0.3})
+    assert job_ids == [7, 5, 4]
+
+
+def test_keep_drops_jobs_no_longer_open():
+    job_ids, scores = merge_feed([1, 2, 3], [0.9, 0.8, 0.7], {4: 0.1}, keep={1, 3})
+    assert job_ids == [1, 3, 4]
+    assert scores == [0.9, 0.7, 0.1]
+
+
+def test_empty_feed():
+    assert merge_feed(None, None, {}) == ([], [])
+
+
+def test_feed_is_capped(monkeypatch):
+    monkeypatch.setattr(feeds, "FEED_SIZE", 2)
+    job_ids, _ = merge_feed([1, 2], [0.1, 0.2], {3: 0.3})
+    assert job_ids == [3, 2]
@@ -0,0 +1,21 @@
+# tests/test_service_candidates.py
+import numpy as np
+
+from agency.service_candidates import rank_page
+
+
+def test_pages_follow_one_total_order_with_ties():
+    rng = np.random.default_rng(7)
+    scores = rng.integers(0, 4, 300) / 4          # few distinct scores: many ties
+    user_ids = rng.permutation(300) + 1
+
+    pages = [rank_page(scores, user_ids, offset, min(offset + 20, 300)) for offset in range(0, 300, 20)]
+
+    assert np.array_equal(np.concatenate(pages), np.lexsort((user_ids, -scores)))
+
+
+def test_highest_score_first_then_user_id():
+    scores = np.array([0.5, 0.9, 0.5, 0.1])
+    user_ids = np.array([30, 20, 10, 40])
+    assert rank_page(scores, user_ids, 0, 2).tolist() == [1, 2]
+    assert rank_page(scores, user_ids, 2, 4).tolist() == [0, 3]
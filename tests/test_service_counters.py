@@ -0,0 +1,25 @@
+# tests/test_service_counters.py
+from job_applications.service_counters import counter_deltas, TOTAL_COUNTER
+
+
+def test_created_counts_total_and_status():
+    assert counter_deltas(None, "applied") == {TOTAL_COUNTER: 1, "applied_count": 1}
+
+
+def test_deleted_uncounts_total_and_status():
+    assert counter_deltas("shortlisted", None) == {TOTAL_COUNTER: -1, "shortlisted_count": -1}
+
+
+def test_status_change_moves_between_columns():
+    assert counter_deltas("applied", "hired", count=3) == {"applied_count": -3, "hired_count": 3}
+
+
+def test_same_status_is_no_change():
+    assert counter_deltas("rejected", "rejected") == {}
+    assert counter_deltas(None, None) == {}
+
+
+def test_unknown_status_only_counts_towards_total():
+    assert counter_deltas(None, "withdrawn") == {TOTAL_COUNTER: 1}
+    assert counter_deltas("withdrawn", "applied") == {"applied_count": 1}
+    assert counter_deltas("applied", "withdrawn") == {"applied_count": -1}
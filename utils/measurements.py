@@ -0,0 +1,189 @@
+# utils/measurements.py
+import re
+
+# Free-text ModelProfile measurement -> numeric shadow column.
+# Lengths are stored in cm, weight in kg and shoe size in EU sizing.
+
+CM_PER_INCH = 2.54
+CM_PER_FOOT = 30.48
+KG_PER_LB = 0.45359237
+
+_NUMBER = r"(\d+(?:[.,]\d+)?)"
+_FEET_INCHES = re.compile(
+    rf"^{_NUMBER}\s*(?:'|’|ft|feet|foot)\s*(?:{_NUMBER}\s*(?:\"|”|''|in|inch|inches)?)?$"
+)
+_NUMBER_UNIT = re.compile(rf"^{_NUMBER}\s*([a-z\"”]*)\.?$")
+
+_INCH_UNITS = {"in", "inch", "inches", '"', "”"}
+
+# column -> (min, max) a person can plausibly have; anything outside is a
+# typo or the wrong unit and is stored as None
+PLAUSIBLE_RANGES = {
+    "height_cm": (50, 260),
+    "weight_kg": (20, 300),
+    "chest_bust_cm": (50, 200),
+    "waist_cm": (40, 200),
+    "hips_cm": (50, 200),
+    "shoulder_cm": (25, 80),
+    "shoe_size_eu": (15, 55),
+}
+
+
+def _plausible(number: float, column: str) -> float | None:
+    low, high = PLAUSIBLE_RANGES[column]
+    return round(number, 1) if low <= number <= high else None
+
+
+def _split(value) -> tuple[float, str] | None:
+    text = str(value).strip().lower()
+    match = _NUMBER_UNIT.match(text)
+    if not match:
+        return None
+    return float(match.group(1).replace(",", ".")), match.group(2)
+
+
+def parse_height_cm(value) -> float | None:
+    """
+    "175", "175cm", "1.75m", "5'9\\"", "5 ft 9 in", "5.9" (feet.inches),
+    "69in" / "69" (inches) -> cm
+    """
+    if not value:
+        return None
+
+    text = str(value).strip().lower()
+
+    match = _FEET_INCHES.match(text)
+    if match:
+        feet, inches = match.groups()
+        total = float(feet.replace(",", ".")) * CM_PER_FOOT
+        if inches:
+            total += float(inches.replace(",", ".")) * CM_PER_INCH
+        return _plausible(total, "height_cm")
+
+    match = _NUMBER_UNIT.match(text)
+    if not match:
+        return None
+    raw, unit = match.groups()
+    number = float(raw.replace(",", "."))
+
+    if unit == "cm":
+        cm = number
+    elif unit == "m":
+        cm = number * 100
+    elif unit in _INCH_UNITS:
+        cm = number * CM_PER_INCH
+    elif unit:
+        return None
+    elif number < 3:                     # metres
+        cm = number * 100
+    elif number < 8:                     # 5.9 -> 5 ft 9 in
+        feet, _, inches = raw.replace(",", ".").partition(".")
+        cm = int(feet) * CM_PER_FOOT + int(inches or 0) * CM_PER_INCH
+    elif number < 100:                   # inches
+        cm = number * CM_PER_INCH
+    else:
+        cm = number
+
+    return _plausible(cm, "height_cm")
+
+
+def parse_weight_kg(value) -> float | None:
+    """"60", "60kg", "132 lbs" -> kg"""
+    if not value:
+        return None
+
+    parsed = _split(value)
+    if not parsed:
+        return None
+    number, unit = parsed
+
+    if unit in ("", "kg", "kgs", "kilo", "kilos"):
+        kg = number
+    elif unit in ("lb", "lbs", "pound", "pounds"):
+        kg = number * KG_PER_LB
+    else:
+        return None
+
+    return _plausible(kg, "weight_kg")
+
+
+def parse_length_cm(value, inch_below: float, column: str) -> float | None:
+    """
+    Body circumference / width in cm. Unit-less numbers below
+    `inch_below` are taken as inches ("34" bust, "26" waist); None
+    outside PLAUSIBLE_RANGES[column].
+    """
+    if not value:
+        return None
+
+    parsed = _split(value)
+    if not parsed:
+        return None
+    number, unit = parsed
+
+    if unit == "cm":
+        cm = number
+    elif unit in _INCH_UNITS:
+        cm = number * CM_PER_INCH
+    elif unit:
+        return None
+    elif number < inch_below:
+        cm = number * CM_PER_INCH
+    else:
+        cm = number
+
+    return _plausible(cm, column)
+
+
+def parse_shoe_size_eu(value) -> float | None:
+    """
+    "39", "EU 39", "UK 6", "US 8", "6" -> EU size.
+    Unit-less sizes below 20 are read as UK / India sizes.
+    """
+    if not value:
+        return None
+
+    text = str(value).strip().lower()
+    system = None
+    for prefix in ("eu", "uk", "us"):
+        if text.startswith(prefix) or text.endswith(prefix):
+            system = prefix
+            text = text.removeprefix(prefix).removesuffix(prefix).strip()
+            break
+
+    parsed = _split(text)
+    if not parsed or parsed[1]:
+        return None
+    number = parsed[0]
+
+    if system is None:
+        system = "eu" if number >= 20 else "uk"
+
+    if system == "eu":
+        eu = number
+    elif system == "us":
+        eu = number + 31.5
+    else:                                # uk / india
+        eu = number + 33
+    return _plausible(eu, "shoe_size_eu")
+
+
+# column on ModelProfile -> (free-text source column, parser)
+MEASUREMENT_FIELDS = {
+    "height_cm": ("height", parse_height_cm),
+    "weight_kg": ("weight", parse_weight_kg),
+    "chest_bust_cm": ("chest_bust", lambda v: parse_length_cm(v, inch_below=60, column="chest_bust_cm")),
+    "waist_cm": ("waist", lambda v: parse_length_cm(v, inch_below=55, column="waist_cm")),
+    "hips_cm": ("hips", lambda v: parse_length_cm(v, inch_below=60, column="hips_cm")),
+    "shoulder_cm": ("shoulder", lambda v: parse_length_cm(v, inch_below=30, column="shoulder_cm")),
+    "shoe_size_eu": ("shoe_size", parse_shoe_size_eu),
+}
+
+
+def normalized_measurements(source) -> dict:
+    """Numeric shadow values for a ModelProfile (or any object / dict with the text fields)"""
+    get = source.get if isinstance(source, dict) else lambda f: getattr(source, f, None)
+    return {
+        column: parser(get(field))
+        for column, (field, parser) in MEASUREMENT_FIELDS.items()
+    }